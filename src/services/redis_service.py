@@ -11,8 +11,13 @@ Clean, async-only wrapper around Redis with:
 """
 import os
 import json
+import asyncio
+import inspect
+import socket
+import orjson
+import zstandard
 import redis.asyncio as redis
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple, Union
 from dataclasses import dataclass
 import logging
 
@@ -25,6 +30,69 @@ from src.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Detect dead proxy connections in about 90s instead of the OS default of ~2h
+# (the TCP_KEEP* constants are Linux-specific)
+_KEEPALIVE_OPTIONS: Dict[int, int] = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Connection pools shared by all services pointing at the same Redis with
+# the same options, per event loop (see _make_pool_key); reference-counted
+# for cleanup
+_POOLS: Dict[tuple, redis.ConnectionPool] = {}
+_POOL_REFS: Dict[tuple, int] = {}
+
+# First characters a stored JSON document can start with, including JSON
+# whitespace and the NaN/Infinity tokens json.dumps writes; anything else is
+# a raw string and skips the decode attempt (and its exception) entirely
+_JSON_START = frozenset('{["-0123456789tfnNI \t\n\r')
+
+# Default for get() that tells a missing key apart from a stored JSON null
+_MISSING = object()
+
+# Compressed values are recognised by the zstd frame magic number, so no
+# extra tag byte is stored and uncompressed values stay readable as-is
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# Server-side scripts: each saves a round trip and closes a race window.
+# KEYS[1]=key, ARGV[1]=amount, ARGV[2]=ttl; TTL only set on key creation
+_INCR_EXPIRE_LUA = """
+local v = redis.call('INCRBY', KEYS[1], ARGV[1])
+if v == tonumber(ARGV[1]) then redis.call('EXPIRE', KEYS[1], ARGV[2]) end
+return v
+"""
+
+# KEYS[1]=key, ARGV[1]=value, ARGV[2]=ttl (0 = none); returns the stored value
+_SET_IF_ABSENT_LUA = """
+local v = redis.call('GET', KEYS[1])
+if v then return v end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return ARGV[1]
+"""
+
+
+def _make_pool_key(url: str, client_kwargs: Dict[str, Any]) -> tuple:
+    """
+    Registry key for a shared connection pool.
+    
+    Covers the URL and every option the pool is created with, so services
+    configured differently never share a pool. The running loop is part of
+    the key as well, since asyncio connections cannot move between loops.
+    """
+    options = tuple(sorted(
+        (name, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+        for name, value in client_kwargs.items()
+    ))
+    return (asyncio.get_running_loop(), url, options)
+
 
 @dataclass
 class RedisConfig(ServiceConfig):
@@ -32,9 +100,15 @@ class RedisConfig(ServiceConfig):
     url: Optional[str] = None
     decode_responses: bool = True
     socket_timeout: float = 5.0
-    max_connections: int = 10
+    max_connections: int = 64
     retry_on_timeout: bool = True
     health_check_interval: int = 30
+    pipeline_chunk: int = 500
+    socket_keepalive: bool = True
+    client_name: Optional[str] = None
+    # Compress stored values of at least this many bytes (None = disabled).
+    # Requires decode_responses=False since compressed values are binary.
+    compress_min_size: Optional[int] = None
 
 
 class RedisService(BaseService[RedisConfig]):
@@ -52,7 +126,8 @@ class RedisService(BaseService[RedisConfig]):
         Args:
             config: Redis configuration. If not provided, uses environment variables.
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        self._url_source = None  # Track which env var was used
         
         # Use provided config or create from environment
         if config is None:
@@ -63,7 +138,9 @@ class RedisService(BaseService[RedisConfig]):
             )
         
         super().__init__(config, logger)
-        self._url_source = None  # Track which env var was used
+        self._scripts: Dict[str, Any] = {}
+        self._pool_key: Optional[tuple] = None
+        self._redis_version: Optional[str] = None  # Fixed for a connection
     
     def _get_redis_url(self) -> Optional[str]:
         """
@@ -97,6 +174,12 @@ class RedisService(BaseService[RedisConfig]):
                 "No Redis URL found. Redis functionality will be disabled. "
                 "Set one of: REDIS_DIRECT_URI, REDIS_URL, etc."
             )
+        
+        if self.config.compress_min_size and self.config.decode_responses:
+            raise ConfigurationError(
+                "Redis compression requires decode_responses=False",
+                component="compress_min_size"
+            )
     
     async def _initialize_client(self) -> Optional[redis.Redis]:
         """Initialize the Redis client"""
@@ -105,15 +188,35 @@ class RedisService(BaseService[RedisConfig]):
             return None
         
         try:
+            client_kwargs = {
+                "decode_responses": self.config.decode_responses,
+                "socket_timeout": self.config.socket_timeout,
+                "max_connections": self.config.max_connections,
+                "retry_on_timeout": self.config.retry_on_timeout,
+                "health_check_interval": self.config.health_check_interval,
+                # Lets ops identify our connections in CLIENT LIST
+                "client_name": self.config.client_name or os.environ.get("SERVICE_NAME", "wuff-api"),
+            }
+            
+            if self.config.url.startswith("unix://"):
+                # Unix sockets skip the TCP stack entirely
+                self.logger.info("Using Redis unix socket connection")
+            elif self.config.socket_keepalive:
+                client_kwargs["socket_keepalive"] = True
+                client_kwargs["socket_keepalive_options"] = _KEEPALIVE_OPTIONS
+            
+            # Reuse the pool of any other service on this loop with the
+            # same Redis and connection options
+            self._pool_key = _make_pool_key(self.config.url, client_kwargs)
+            pool = _POOLS.get(self._pool_key)
+            if pool is None:
+                pool = _POOLS[self._pool_key] = redis.ConnectionPool.from_url(
+                    self.config.url, **client_kwargs
+                )
+            _POOL_REFS[self._pool_key] = _POOL_REFS.get(self._pool_key, 0) + 1
+            
             # Create async Redis client
-            client = redis.from_url(
-                self.config.url,
-                decode_responses=self.config.decode_responses,
-                socket_timeout=self.config.socket_timeout,
-                max_connections=self.config.max_connections,
-                retry_on_timeout=self.config.retry_on_timeout,
-                health_check_interval=self.config.health_check_interval
-            )
+            client = redis.Redis(connection_pool=pool)
             
             # Test connection
             await client.ping()
@@ -124,6 +227,7 @@ class RedisService(BaseService[RedisConfig]):
         except Exception as e:
             error_msg = f"Failed to connect to Redis: {str(e)}"
             self.logger.error(error_msg)
+            await self._release_pool()
             
             # Don't fail initialization - Redis is optional
             self.logger.warning("Redis functionality disabled due to connection error")
@@ -156,14 +260,10 @@ class RedisService(BaseService[RedisConfig]):
                 return default
             
             # Try to deserialize JSON if requested
-            if deserialize_json and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    # Not JSON, return as string
-                    pass
+            if deserialize_json:
+                return self._deserialize(value)
             
-            return value
+            return self._decompress(value)
             
         except Exception as e:
             self.logger.warning(f"Redis get failed for key '{key}': {e}")
@@ -192,9 +292,7 @@ class RedisService(BaseService[RedisConfig]):
             return False
         
         try:
-            # Serialize value if needed
-            if serialize_json and not isinstance(value, (str, bytes)):
-                value = json.dumps(value)
+            value = self._serialize(value, serialize_json)
             
             # Set with optional TTL
             if ttl:
@@ -246,26 +344,42 @@ class RedisService(BaseService[RedisConfig]):
             self.logger.warning(f"Redis exists check failed: {e}")
             return 0
     
-    async def keys(self, pattern: str = "*") -> List[str]:
+    async def iter_keys(self, pattern: str = "*", count: int = 500) -> AsyncIterator[str]:
         """
-        Get keys matching pattern.
+        Iterate keys matching pattern without blocking the server.
+        
+        Uses SCAN, so keys are fetched page by page instead of
+        materializing the whole keyspace in one KEYS call.
         
         Args:
             pattern: Pattern to match (default: "*" for all)
+            count: Page size hint passed to SCAN
             
-        Returns:
-            List of matching keys
+        Yields:
+            Matching keys
         """
         if not self._client:
-            return []
+            return
         
         try:
-            keys = await self._client.keys(pattern)
-            # Convert bytes to strings if needed
-            return [k.decode() if isinstance(k, bytes) else k for k in keys]
+            async for key in self._client.scan_iter(match=pattern, count=count):
+                # Convert bytes to strings if needed
+                yield key.decode() if isinstance(key, bytes) else key
         except Exception as e:
-            self.logger.warning(f"Redis keys failed: {e}")
-            return []
+            self.logger.warning(f"Redis scan failed: {e}")
+    
+    async def keys(self, pattern: str = "*", count: int = 500) -> List[str]:
+        """
+        Get keys matching pattern.
+        
+        Args:
+            pattern: Pattern to match (default: "*" for all)
+            count: Page size hint passed to SCAN
+            
+        Returns:
+            List of matching keys
+        """
+        return [key async for key in self.iter_keys(pattern, count)]
     
     async def expire(self, key: str, seconds: int) -> bool:
         """
@@ -306,6 +420,122 @@ class RedisService(BaseService[RedisConfig]):
             self.logger.warning(f"Redis ttl failed for key '{key}': {e}")
             return -2
     
+    def _script(self, source: str) -> Any:
+        """Register a Lua script once; redis-py reloads it on NOSCRIPT"""
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = self._client.register_script(source)
+        return script
+    
+    def _serialize(self, value: Any, serialize_json: bool = True) -> Any:
+        """
+        Prepare a value for storage, the same way for every writer.
+        
+        Non-string values become JSON (json.dumps, so non-str dict keys and
+        big ints work as before) and strings are compressed if large enough.
+        """
+        if serialize_json and not isinstance(value, (str, bytes)):
+            value = json.dumps(value)
+        if isinstance(value, (str, bytes)):
+            value = self._compress(value)
+        return value
+    
+    def _compress(self, value: Union[str, bytes]) -> Union[str, bytes]:
+        """Compress a serialized value if compression is enabled and it's large"""
+        threshold = self.config.compress_min_size
+        if not threshold or len(value) < threshold:
+            return value
+        if isinstance(value, str):
+            value = value.encode()
+        return _ZSTD_COMPRESSOR.compress(value)
+    
+    def _decompress(self, value: Any) -> Any:
+        """Decompress and decode a value read by a compressing (binary) client"""
+        if not isinstance(value, bytes) or not self.config.compress_min_size:
+            return value
+        if value.startswith(_ZSTD_MAGIC):
+            value = _ZSTD_DECOMPRESSOR.decompress(value)
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return value
+    
+    def _deserialize(self, value: Any) -> Any:
+        """Deserialize a raw Redis value, falling back to the raw value"""
+        value = self._decompress(value)
+        if isinstance(value, str) and value[:1] in _JSON_START:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity, which json.dumps writes
+                try:
+                    return json.loads(value)
+                except ValueError:
+                    pass
+        return value
+    
+    async def pipeline_execute(self, ops: List[Tuple[str, tuple]]) -> List[Any]:
+        """
+        Execute several commands in a single round trip.
+        
+        Args:
+            ops: List of (command, args) tuples, e.g. ("get", ("key",))
+            
+        Returns:
+            Raw results in command order (empty list on error)
+        """
+        if not self._client or not ops:
+            return []
+        
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for op, args in ops:
+                    getattr(pipe, op)(*args)
+                return await pipe.execute()
+        except Exception as e:
+            self.logger.warning(f"Redis pipeline failed: {e}")
+            return []
+    
+    async def pipeline_get(self, keys: List[str]) -> List[Any]:
+        """
+        Get multiple values with one pipelined GET per key.
+        
+        Args:
+            keys: List of keys to get
+            
+        Returns:
+            List of values (None for missing keys)
+        """
+        values = await self.pipeline_execute([("get", (key,)) for key in keys])
+        if not values:
+            return [None] * len(keys)
+        return [self._deserialize(value) for value in values]
+    
+    async def pipeline_set(
+        self,
+        mapping: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set multiple values with one pipelined SET/SETEX per key.
+        
+        Args:
+            mapping: Dictionary of key-value pairs
+            ttl: Optional time to live in seconds applied to every key
+            
+        Returns:
+            True if successful
+        """
+        if not self._client or not mapping:
+            return False
+        
+        ops = []
+        for key, value in mapping.items():
+            value = self._serialize(value)
+            ops.append(("setex", (key, ttl, value)) if ttl else ("set", (key, value)))
+        
+        return len(await self.pipeline_execute(ops)) == len(ops)
+    
     async def mget(self, keys: List[str]) -> List[Any]:
         """
         Get multiple values at once.
@@ -322,18 +552,7 @@ class RedisService(BaseService[RedisConfig]):
         try:
             values = await self._client.mget(keys)
             # Try to deserialize JSON values
-            result = []
-            for value in values:
-                if value is None:
-                    result.append(None)
-                elif isinstance(value, str):
-                    try:
-                        result.append(json.loads(value))
-                    except json.JSONDecodeError:
-                        result.append(value)
-                else:
-                    result.append(value)
-            return result
+            return [self._deserialize(value) for value in values]
         except Exception as e:
             self.logger.warning(f"Redis mget failed: {e}")
             return [None] * len(keys)
@@ -342,6 +561,10 @@ class RedisService(BaseService[RedisConfig]):
         """
         Set multiple values at once.
         
+        Large mappings are split into MSET commands of at most
+        ``config.pipeline_chunk`` keys, sent through one pipeline so a
+        single huge MSET doesn't block other clients.
+        
         Args:
             mapping: Dictionary of key-value pairs
             
@@ -352,27 +575,73 @@ class RedisService(BaseService[RedisConfig]):
             return False
         
         try:
-            # Serialize values
-            serialized = {}
-            for key, value in mapping.items():
-                if not isinstance(value, (str, bytes)):
-                    serialized[key] = json.dumps(value)
-                else:
-                    serialized[key] = value
-            
-            await self._client.mset(serialized)
+            items = [(key, self._serialize(value)) for key, value in mapping.items()]
+            chunk = max(1, self.config.pipeline_chunk)
+            async with self._client.pipeline(transaction=False) as pipe:
+                for start in range(0, len(items), chunk):
+                    pipe.mset(dict(items[start:start + chunk]))
+                await pipe.execute()
             return True
         except Exception as e:
             self.logger.error(f"Redis mset failed: {e}")
             return False
     
-    async def incr(self, key: str, amount: int = 1) -> Optional[int]:
+    async def get_or_set(
+        self,
+        key: str,
+        producer: Callable[[], Any],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Get a value, producing and storing it on a miss.
+        
+        This is GET, then produce, then an atomic set-if-absent script.
+        Concurrent callers that miss each run the producer; only the store
+        is deduplicated, so they all return the first value stored. A stored
+        None (JSON null) is a hit, not a miss.
+        
+        Args:
+            key: The key to retrieve
+            producer: Sync or async callable returning the value on a miss
+            ttl: Time to live in seconds for a newly stored value
+            
+        Returns:
+            The stored value (or the produced value if Redis is unavailable)
+        """
+        value = await self.get(key, default=_MISSING)
+        if value is not _MISSING:
+            return value
+        
+        value = producer()
+        if inspect.isawaitable(value):
+            value = await value
+        
+        if not self._client:
+            return value
+        
+        try:
+            serialized = self._serialize(value)
+            stored = await self._script(_SET_IF_ABSENT_LUA)(
+                keys=[key], args=[serialized, ttl or 0]
+            )
+            return self._deserialize(stored)
+        except Exception as e:
+            self.logger.error(f"Redis get_or_set failed for key '{key}': {e}")
+            return value
+    
+    async def incr(
+        self,
+        key: str,
+        amount: int = 1,
+        ttl: Optional[int] = None
+    ) -> Optional[int]:
         """
         Increment a counter.
         
         Args:
             key: Counter key
             amount: Amount to increment by
+            ttl: Expiration applied atomically when the counter is created
             
         Returns:
             New value or None on error
@@ -381,6 +650,8 @@ class RedisService(BaseService[RedisConfig]):
             return None
         
         try:
+            if ttl:
+                return await self._script(_INCR_EXPIRE_LUA)(keys=[key], args=[amount, ttl])
             return await self._client.incrby(key, amount)
         except Exception as e:
             self.logger.error(f"Redis incr failed for key '{key}': {e}")
@@ -413,20 +684,29 @@ class RedisService(BaseService[RedisConfig]):
                     }
                 }
             
-            # Ping Redis
-            await self._client.ping()
+            # Ping and read only the INFO sections we report, in one round
+            # trip; the server section is only needed until the version is known
+            need_version = self._redis_version is None
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.ping()
+                pipe.info("clients")
+                pipe.info("memory")
+                if need_version:
+                    pipe.info("server")
+                results = await pipe.execute()
             
-            # Get info
-            info = await self._client.info()
+            clients, memory = results[1], results[2]
+            if need_version:
+                self._redis_version = results[3].get("redis_version", "unknown")
             
             return {
                 "healthy": True,
                 "status": "connected",
                 "details": {
                     "url_source": self._url_source,
-                    "redis_version": info.get("redis_version", "unknown"),
-                    "connected_clients": info.get("connected_clients", 0),
-                    "used_memory_human": info.get("used_memory_human", "unknown")
+                    "redis_version": self._redis_version,
+                    "connected_clients": clients.get("connected_clients", 0),
+                    "used_memory_human": memory.get("used_memory_human", "unknown")
                 }
             }
             
@@ -440,13 +720,33 @@ class RedisService(BaseService[RedisConfig]):
                 }
             }
     
+    async def _release_pool(self) -> None:
+        """Drop this service's pool reference, disconnecting on the last one"""
+        key, self._pool_key = self._pool_key, None
+        if key is None or key not in _POOL_REFS:
+            return
+        
+        _POOL_REFS[key] -= 1
+        if _POOL_REFS[key] <= 0:
+            del _POOL_REFS[key]
+            pool = _POOLS.pop(key, None)
+            if pool is not None:
+                await pool.disconnect()
+    
     async def _cleanup(self) -> None:
         """Clean up Redis connection"""
+        self._scripts.clear()
+        self._redis_version = None
         if self._client:
             try:
                 await self._client.close()
             except Exception as e:
                 self.logger.warning(f"Error closing Redis client: {e}")
+        
+        try:
+            await self._release_pool()
+        except Exception as e:
+            self.logger.warning(f"Error disconnecting Redis pool: {e}")
     
     def is_connected(self) -> bool:
         """Check if Redis is connected and available"""
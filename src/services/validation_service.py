@@ -7,8 +7,12 @@ Flow Engine handles state transitions, Handlers coordinate business logic,
 and this service validates inputs.
 """
 
-from typing import Optional, Dict, Any, Set, TYPE_CHECKING
+from typing import Optional, Dict, Any, Callable, FrozenSet, Mapping, TYPE_CHECKING
+from collections import OrderedDict
 from dataclasses import dataclass
+from types import MappingProxyType
+import asyncio
+import hashlib
 import logging
 import re
 
@@ -16,6 +20,55 @@ if TYPE_CHECKING:
     from src.services.gpt_service import GPTService
 
 logger = logging.getLogger(__name__)
+_validator_logger = logging.getLogger(f"{__name__}.DogContentValidator")
+
+
+# Splits input into word tokens; whole-token lookup enforces word boundaries
+_WORD_RE = re.compile(r'\w+')
+
+# Dog-related keywords for fast validation, shared by all validators
+_KEYWORDS_DE: FrozenSet[str] = frozenset({
+    'hund', 'hunde', 'welpe', 'welpen', 'rüde', 'hündin', 'vierbeiner',
+    'bellen', 'bellt', 'gebell', 'beißen', 'beißt', 'knurren', 'knurrt',
+    'winseln', 'winselt', 'jaulen', 'jault', 'heulen', 'heult',
+    'schwanz', 'rute', 'pfote', 'pfoten', 'schnauze', 'nase',
+    'schnüffeln', 'schnüffelt', 'lecken', 'leckt', 'sabbern', 'sabbert',
+    'springen', 'springt', 'hüpfen', 'hüpft', 'rennen', 'rennt', 'laufen', 'läuft',
+    'ziehen', 'zieht', 'zerren', 'zerrt',
+    'gehorchen', 'gehorcht', 'folgen', 'folgt', 'hören', 'hört',
+    'sitz', 'platz', 'bleib', 'fuß', 'hier', 'komm', 'aus', 'nein',
+    'apportieren', 'apportiert', 'bringen', 'bringt', 'holen', 'holt',
+    'jagen', 'jagt', 'hetzen', 'hetzt', 'verfolgen', 'verfolgt',
+    'fressen', 'frisst', 'essen', 'isst', 'futter', 'leckerli', 'leckerchen',
+    'gassi', 'spaziergang', 'spazieren', 'leine', 'halsband', 'geschirr',
+    'spielen', 'spielt', 'toben', 'tobt', 'ball', 'spielzeug', 'stock',
+    'hundeschule', 'training', 'erziehung', 'kommando', 'tricks'
+})
+
+_KEYWORDS_EN: FrozenSet[str] = frozenset({
+    'dog', 'dogs', 'puppy', 'puppies', 'canine', 'pup', 'pooch',
+    'bark', 'barking', 'barks', 'bite', 'biting', 'bites', 'growl', 'growling',
+    'whine', 'whining', 'howl', 'howling', 'yelp', 'yelping',
+    'tail', 'paw', 'paws', 'snout', 'muzzle', 'nose',
+    'sniff', 'sniffing', 'lick', 'licking', 'drool', 'drooling',
+    'jump', 'jumping', 'jumps', 'run', 'running', 'runs',
+    'pull', 'pulling', 'pulls', 'tug', 'tugging',
+    'obey', 'obeys', 'follow', 'follows', 'listen', 'listens',
+    'sit', 'stay', 'down', 'heel', 'come', 'fetch', 'drop',
+    'retrieve', 'retrieves', 'bring', 'brings', 'get',
+    'chase', 'chasing', 'hunt', 'hunting', 'track', 'tracking',
+    'eat', 'eating', 'eats', 'food', 'treat', 'treats', 'kibble',
+    'walk', 'walking', 'walks', 'leash', 'collar', 'harness',
+    'play', 'playing', 'plays', 'ball', 'toy', 'stick',
+    'training', 'train', 'command', 'commands', 'trick', 'tricks'
+})
+
+# All languages merged once so each token costs a single hash lookup
+_ALL_KEYWORDS: FrozenSet[str] = _KEYWORDS_DE | _KEYWORDS_EN
+
+# Accepted first words of a yes/no answer
+_YES_WORDS: FrozenSet[str] = frozenset({'ja', 'jo', 'jep', 'yes', 'y', 'ok', 'okay'})
+_NO_WORDS: FrozenSet[str] = frozenset({'nein', 'nö', 'no', 'n', 'nope'})
 
 
 @dataclass
@@ -36,47 +89,23 @@ class DogContentValidator:
     2. GPT validation as fallback for edge cases
     """
     
-    # Dog-related keywords for fast validation
-    DOG_KEYWORDS: Dict[str, Set[str]] = {
-        'de': {
-            'hund', 'hunde', 'welpe', 'welpen', 'rüde', 'hündin', 'vierbeiner',
-            'bellen', 'bellt', 'gebell', 'beißen', 'beißt', 'knurren', 'knurrt',
-            'winseln', 'winselt', 'jaulen', 'jault', 'heulen', 'heult',
-            'schwanz', 'rute', 'pfote', 'pfoten', 'schnauze', 'nase',
-            'schnüffeln', 'schnüffelt', 'lecken', 'leckt', 'sabbern', 'sabbert',
-            'springen', 'springt', 'hüpfen', 'hüpft', 'rennen', 'rennt', 'laufen', 'läuft',
-            'ziehen', 'zieht', 'zerren', 'zerrt', 'ziehen', 'zieht',
-            'gehorchen', 'gehorcht', 'folgen', 'folgt', 'hören', 'hört',
-            'sitz', 'platz', 'bleib', 'fuß', 'hier', 'komm', 'aus', 'nein',
-            'apportieren', 'apportiert', 'bringen', 'bringt', 'holen', 'holt',
-            'jagen', 'jagt', 'hetzen', 'hetzt', 'verfolgen', 'verfolgt',
-            'fressen', 'frisst', 'essen', 'isst', 'futter', 'leckerli', 'leckerchen',
-            'gassi', 'spaziergang', 'spazieren', 'leine', 'halsband', 'geschirr',
-            'spielen', 'spielt', 'toben', 'tobt', 'ball', 'spielzeug', 'stock',
-            'hundeschule', 'training', 'erziehung', 'kommando', 'tricks'
-        },
-        'en': {
-            'dog', 'dogs', 'puppy', 'puppies', 'canine', 'pup', 'pooch',
-            'bark', 'barking', 'barks', 'bite', 'biting', 'bites', 'growl', 'growling',
-            'whine', 'whining', 'howl', 'howling', 'yelp', 'yelping',
-            'tail', 'paw', 'paws', 'snout', 'muzzle', 'nose',
-            'sniff', 'sniffing', 'lick', 'licking', 'drool', 'drooling',
-            'jump', 'jumping', 'jumps', 'run', 'running', 'runs',
-            'pull', 'pulling', 'pulls', 'tug', 'tugging',
-            'obey', 'obeys', 'follow', 'follows', 'listen', 'listens',
-            'sit', 'stay', 'down', 'heel', 'come', 'fetch', 'drop',
-            'retrieve', 'retrieves', 'bring', 'brings', 'get',
-            'chase', 'chasing', 'hunt', 'hunting', 'track', 'tracking',
-            'eat', 'eating', 'eats', 'food', 'treat', 'treats', 'kibble',
-            'walk', 'walking', 'walks', 'leash', 'collar', 'harness',
-            'play', 'playing', 'plays', 'ball', 'toy', 'stick',
-            'training', 'train', 'command', 'commands', 'trick', 'tricks'
-        }
-    }
+    KEYWORDS_DE = _KEYWORDS_DE
+    KEYWORDS_EN = _KEYWORDS_EN
+    ALL_KEYWORDS = _ALL_KEYWORDS
+    # Former per-language layout, kept for existing callers
+    DOG_KEYWORDS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+        'de': _KEYWORDS_DE,
+        'en': _KEYWORDS_EN,
+    })
+    
+    # Maximum number of remembered GPT verdicts per validator
+    GPT_CACHE_SIZE = 2048
     
     def __init__(self, gpt_service: Optional["GPTService"] = None):
         self.gpt_service = gpt_service
-        self.logger = logging.getLogger(f"{__name__}.DogContentValidator")
+        self.logger = _validator_logger
+        self._gpt_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+        self._inflight: Dict[bytes, "asyncio.Future[bool]"] = {}
     
     async def is_dog_related(self, user_input: str) -> bool:
         """
@@ -88,16 +117,37 @@ class DogContentValidator:
         Returns:
             True if input appears to be dog-related, False otherwise
         """
+        text_norm = " ".join(user_input.lower().split())
+        
         # Step 1: Fast keyword check
-        if self._check_keywords(user_input):
+        if _keyword_decision(text_norm):
             self.logger.debug("Dog content detected via keywords")
             return True
         
-        # Step 2: GPT fallback for edge cases
+        # Step 2: GPT fallback for edge cases (verdicts are cached, both ways)
         if self.gpt_service:
+            cache_key = hashlib.blake2b(text_norm.encode(), digest_size=16).digest()
+            cached = self._gpt_cache.get(cache_key)
+            if cached is not None:
+                self._gpt_cache.move_to_end(cache_key)
+                self.logger.debug(f"Dog content GPT cache hit: {cached}")
+                return cached
+            
+            # Concurrent callers for the same text share one GPT request
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(self._check_with_gpt(user_input))
+                self._inflight[cache_key] = inflight
+                inflight.add_done_callback(
+                    lambda _: self._inflight.pop(cache_key, None)
+                )
+            
             try:
-                is_dog_related = await self._check_with_gpt(user_input)
+                is_dog_related = await asyncio.shield(inflight)
                 self.logger.debug(f"Dog content GPT check result: {is_dog_related}")
+                self._gpt_cache[cache_key] = is_dog_related
+                if len(self._gpt_cache) > self.GPT_CACHE_SIZE:
+                    self._gpt_cache.popitem(last=False)
                 return is_dog_related
             except Exception as e:
                 self.logger.warning(f"GPT dog content check failed: {e}")
@@ -118,22 +168,7 @@ class DogContentValidator:
         Returns:
             True if dog-related keywords found, False otherwise
         """
-        text_lower = user_input.lower()
-        
-        # Check German keywords with word boundaries
-        for keyword in self.DOG_KEYWORDS['de']:
-            # Use word boundaries to avoid partial matches (e.g., "eat" in "weather")
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        
-        # Check English keywords with word boundaries
-        for keyword in self.DOG_KEYWORDS['en']:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        
-        return False
+        return _keyword_decision(user_input.lower())
     
     async def _check_with_gpt(self, user_input: str) -> bool:
         """
@@ -160,6 +195,49 @@ class DogContentValidator:
         return "ja" in response.lower().strip()
 
 
+def _keyword_decision(text_lower: str) -> bool:
+    """Keyword verdict for already-lowercased text"""
+    tokens = _WORD_RE.findall(text_lower)
+    
+    # Whole-token matching avoids partial matches (e.g., "eat" in "weather")
+    return not _ALL_KEYWORDS.isdisjoint(tokens)
+
+
+def _make_length_check(
+    min_length_attr: str,
+    error_type: str,
+    message: str,
+    report_length: bool = True
+) -> Callable[..., Optional[ValidationResult]]:
+    """
+    Build a minimum-length check method with its constants bound once.
+    
+    The threshold is read from ``min_length_attr`` on each call, so
+    subclasses and tests can override the MIN_* attributes. The returned
+    method takes the stripped input (plus any extra detail fields) and
+    returns None when the input is long enough, so only failures allocate
+    a ValidationResult. ``message`` may use ``{min_length}``.
+    """
+    def check(self, text: str, **extra_details: Any) -> Optional[ValidationResult]:
+        min_length = getattr(self, min_length_attr)
+        length = len(text)
+        if length >= min_length:
+            return None
+        
+        details = {**extra_details, "min_length": min_length}
+        if report_length:
+            details["actual_length"] = length
+            details["error_type"] = error_type
+        return ValidationResult(
+            valid=False,
+            error_type=error_type,
+            message=message.format(min_length=min_length),
+            details=details
+        )
+    
+    return check
+
+
 class ValidationService:
     """
     Centralized validation service for all user inputs.
@@ -178,6 +256,24 @@ class ValidationService:
     MIN_CONTEXT_LENGTH = 25      # Context needs detail too
     MIN_FEEDBACK_LENGTH = 1      # Feedback can be brief
     
+    # Length checks, specialized once per input kind
+    _symptom_check = _make_length_check(
+        "MIN_SYMPTOM_LENGTH",
+        "input_too_short",
+        "Please describe the behavior in more detail (at least {min_length} characters)"
+    )
+    _context_check = _make_length_check(
+        "MIN_CONTEXT_LENGTH",
+        "context_too_short",
+        "Please provide more context details (at least {min_length} characters)"
+    )
+    _feedback_check = _make_length_check(
+        "MIN_FEEDBACK_LENGTH",
+        "feedback_too_short",
+        "Feedback response cannot be empty",
+        report_length=False
+    )
+    
     def __init__(self, gpt_service: Optional["GPTService"] = None):
         self.logger = logger
         self.dog_content_validator = DogContentValidator(gpt_service)
@@ -199,17 +295,9 @@ class ValidationService:
         user_input = user_input.strip()
         
         # Step 1: Length validation FIRST (performance optimization)
-        if len(user_input) < self.MIN_SYMPTOM_LENGTH:
-            return ValidationResult(
-                valid=False,
-                error_type="input_too_short",
-                message="Please describe the behavior in more detail (at least 25 characters)",
-                details={
-                    "min_length": self.MIN_SYMPTOM_LENGTH,
-                    "actual_length": len(user_input),
-                    "error_type": "input_too_short"
-                }
-            )
+        too_short = self._symptom_check(user_input)
+        if too_short:
+            return too_short
         
         # Step 2: Content validation ONLY for qualified inputs (cost optimization)
         try:
@@ -243,17 +331,9 @@ class ValidationService:
         user_input = user_input.strip()
         
         # Check minimum length for context - needs substantial detail
-        if len(user_input) < self.MIN_CONTEXT_LENGTH:
-            return ValidationResult(
-                valid=False,
-                error_type="context_too_short",
-                message=f"Please provide more context details (at least {self.MIN_CONTEXT_LENGTH} characters)",
-                details={
-                    "min_length": self.MIN_CONTEXT_LENGTH,
-                    "actual_length": len(user_input),
-                    "error_type": "context_too_short"
-                }
-            )
+        too_short = self._context_check(user_input)
+        if too_short:
+            return too_short
         
         return ValidationResult(valid=True)
     
@@ -267,17 +347,19 @@ class ValidationService:
         Returns:
             ValidationResult with validation outcome and classification
         """
-        normalized_input = user_input.lower().strip()
+        # Only the first word counts ("ja, gerne" is yes; "jaguar" is not)
+        match = _WORD_RE.search(user_input.lower())
+        head = match.group() if match else ""
         
         # Check for yes responses
-        if "ja" in normalized_input or "yes" in normalized_input:
+        if head in _YES_WORDS:
             return ValidationResult(
                 valid=True,
                 details={"response_type": "yes"}
             )
         
         # Check for no responses  
-        if "nein" in normalized_input or "no" in normalized_input:
+        if head in _NO_WORDS:
             return ValidationResult(
                 valid=True,
                 details={"response_type": "no"}
@@ -305,16 +387,9 @@ class ValidationService:
         user_input = user_input.strip()
         
         # Basic length check
-        if len(user_input) < self.MIN_FEEDBACK_LENGTH:
-            return ValidationResult(
-                valid=False,
-                error_type="feedback_too_short",
-                message="Feedback response cannot be empty",
-                details={
-                    "question_number": question_number,
-                    "min_length": self.MIN_FEEDBACK_LENGTH
-                }
-            )
+        too_short = self._feedback_check(user_input, question_number=question_number)
+        if too_short:
+            return too_short
         
         # Question 5 is optional contact info (email OR phone) - no validation needed
         # Users can enter email, phone, or even skip with "keine" etc.
@@ -5,17 +5,25 @@ Weaviate Service for WuffChat V2.
 Clean, async-only wrapper around Weaviate vector database with:
 - Direct vector search (no Query Agent)
 - Generic interface
-- No built-in caching
+- Short-lived in-process cache for repeated text searches
 - Proper error handling
 - Health checks
 """
 import os
-from typing import Optional, Dict, Any, List
+import time
+import array
+import asyncio
+import itertools
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, Callable, FrozenSet, Iterator, List, Sequence, Tuple
 from dataclasses import dataclass
 import logging
 import weaviate
 from weaviate.client import WeaviateClient
-from weaviate.classes.init import Auth, AdditionalConfig, Timeout
+from weaviate.classes.init import Auth, AdditionalConfig, GrpcConfig, Timeout
 from weaviate.classes.query import MetadataQuery
 
 from src.core.service_base import BaseService, ServiceConfig
@@ -28,13 +36,72 @@ from src.core.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(eq=False)
+class _SharedPool:
+    """Client pool shared by services with the same connection settings"""
+    key: tuple
+    clients: List[WeaviateClient]
+    refs: int = 0
+    closed: bool = False
+
+
+# Client pools shared by all services with the same connection settings
+# (see _pool_key), so short-lived services skip the connect/readiness
+# handshake; each pool is reference-counted for close
+_CLIENT_REGISTRY: Dict[tuple, _SharedPool] = {}
+
+# Registry locks, one per event loop and created on first use; an asyncio
+# lock is bound to the loop that first waits on it
+_CLIENT_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _client_lock() -> asyncio.Lock:
+    """Return the registry lock for the running event loop"""
+    loop = asyncio.get_running_loop()
+    lock = _CLIENT_LOCKS.get(loop)
+    if lock is None:
+        lock = _CLIENT_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+# Accepted vector containers; numpy arrays are recognized by __array__ so
+# numpy stays optional. The client packs any of them without a list copy.
+_VECTOR_TYPES = (list, tuple, array.array)
+
+# Properties read from the Symptome collection by the symptom helpers
+SYMPTOM_PROPERTIES = ["beschreibung", "schnelldiagnose"]
+
+
+def _copy_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy search results two levels deep (hit dicts and their properties and
+    metadata dicts), which is all callers mutate; much cheaper than deepcopy.
+    """
+    return [
+        {k: dict(v) if isinstance(v, dict) else v for k, v in item.items()}
+        for item in items
+    ]
+
+
 @dataclass
 class WeaviateConfig(ServiceConfig):
     """Configuration for Weaviate Service"""
     url: Optional[str] = None
     api_key: Optional[str] = None
-    timeout: int = 30
+    timeout: int = 30  # connection setup (TLS handshake, init checks)
+    query_timeout: int = 5
+    grpc_keepalive_ms: int = 30000
+    grpc_keepalive_timeout_ms: int = 10000
+    grpc_max_concurrent_streams: int = 100
+    verify_ready: bool = False  # connect already runs the client's init checks
     additional_headers: Optional[Dict[str, str]] = None
+    max_workers: int = 16
+    pool_size: int = 1
+    count_cache_ttl: float = 30.0
+    collections_cache_ttl: float = 300.0
+    search_cache_size: int = 1024  # 0 disables the search result cache
+    search_cache_ttl: float = 600.0
 
 
 class WeaviateService(BaseService[WeaviateConfig]):
@@ -64,6 +131,30 @@ class WeaviateService(BaseService[WeaviateConfig]):
         
         super().__init__(config, logger)
         self._collections_cache: Optional[List[str]] = None
+        self._collections_set: FrozenSet[str] = frozenset()
+        self._collections_fetched = 0.0
+        self._count_cache: Dict[str, Tuple[float, int]] = {}
+        self._search_cache: "OrderedDict[tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._shared_pool: Optional[_SharedPool] = None
+        self._client_pool: List[WeaviateClient] = []
+        self._collection_cache: Dict[Tuple[int, str], Any] = {}
+        self._pool_idx: Iterator[int] = itertools.cycle([0])
+    
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking weaviate-client call on the service's thread pool.
+        
+        The client is synchronous; running it here keeps the event loop free
+        so independent queries proceed concurrently.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="weaviate"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
     
     def _validate_config(self) -> None:
         """Validate Weaviate configuration"""
@@ -80,28 +171,145 @@ class WeaviateService(BaseService[WeaviateConfig]):
                 "api_key",
                 "Weaviate API key is required. Set WEAVIATE_API_KEY environment variable."
             )
+        
+        if self.config.pool_size < 1:
+            raise ConfigurationError(
+                "pool_size",
+                "Weaviate client pool size must be at least 1."
+            )
+    
+    def _pool_key(self) -> tuple:
+        """
+        Registry key for the shared client pool: every setting _connect
+        passes to connect_to_weaviate_cloud, so services that would open
+        differently configured clients never share a pool. The pool size is
+        not part of it; a larger request grows the shared pool instead.
+        """
+        config = self.config
+        return (
+            config.url,
+            config.api_key,
+            tuple(sorted((config.additional_headers or {}).items())),
+            config.timeout,
+            config.query_timeout,
+            config.grpc_keepalive_ms,
+            config.grpc_keepalive_timeout_ms,
+            config.grpc_max_concurrent_streams
+        )
     
     async def _initialize_client(self) -> WeaviateClient:
-        """Initialize the Weaviate client"""
+        """
+        Initialize the Weaviate client pool, reusing a live shared one if available.
+        
+        ``config.pool_size`` clients are opened in parallel and handed out
+        round-robin (see _next_client), so concurrent queries do not queue
+        on one client's connection. The first client is the service's
+        ``client``.
+        """
+        key = self._pool_key()
+        async with _client_lock():
+            shared = _CLIENT_REGISTRY.get(key)
+            if shared is not None:
+                try:
+                    # Cheap liveness pings instead of a full reconnect
+                    live = await asyncio.gather(
+                        *(self._run(c.is_live) for c in shared.clients)
+                    )
+                except Exception as e:
+                    self.logger.warning("Shared Weaviate client liveness check failed: %s", e)
+                    live = [False]
+                if all(live):
+                    self.logger.debug("Reusing shared Weaviate client pool")
+                    missing = self.config.pool_size - len(shared.clients)
+                    if missing > 0:
+                        # Grown in place, so every user of the pool sees it
+                        shared.clients.extend(await asyncio.gather(
+                            *(self._connect() for _ in range(missing))
+                        ))
+                    self._acquire_pool(shared)
+                    return shared.clients[0]
+                
+                self.logger.warning("Shared Weaviate client is not live, reconnecting")
+                # Services still holding the stale pool release it without
+                # closing it again (see _cleanup)
+                del _CLIENT_REGISTRY[key]
+                shared.refs = 0
+                shared.closed = True
+                await self._close_clients(shared.clients)
+            
+            shared = _SharedPool(key, list(await asyncio.gather(
+                *(self._connect() for _ in range(self.config.pool_size))
+            )))
+            _CLIENT_REGISTRY[key] = shared
+            self._acquire_pool(shared)
+            return shared.clients[0]
+    
+    def _acquire_pool(self, shared: _SharedPool) -> None:
+        """Register this service as a user of a shared client pool"""
+        shared.refs += 1
+        self._shared_pool = shared
+        self._client_pool = shared.clients
+        self._pool_idx = itertools.cycle(range(len(shared.clients)))
+        # Handles belong to the previous clients after a reconnect
+        self._collection_cache.clear()
+    
+    async def _close_clients(self, clients: List[WeaviateClient]) -> None:
+        """Close clients concurrently, logging rather than raising errors"""
+        results = await asyncio.gather(
+            *(self._run(c.close) for c in clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("Error closing Weaviate client: %s", result)
+    
+    def _next_client(self) -> WeaviateClient:
+        """Return the next pooled client, round-robin"""
+        if not self._client_pool:
+            return self.client
+        return self._client_pool[next(self._pool_idx)]
+    
+    def _get_collection(self, name: str) -> Any:
+        """Return the next pooled client's handle for a collection, memoized"""
+        client = self._next_client()
+        key = (id(client), name)
+        handle = self._collection_cache.get(key)
+        if handle is None:
+            handle = self._collection_cache[key] = client.collections.get(name)
+        return handle
+    
+    async def _connect(self) -> WeaviateClient:
+        """Open and verify a new Weaviate client connection"""
         try:
-            # Note: weaviate-client is not async, so we use sync client
-            # but wrap our methods to be async for consistency
+            # Note: weaviate-client is not async, so blocking calls run on
+            # the service's thread pool (see _run)
             self.logger.debug("Starting Weaviate client initialization")
-            client = weaviate.connect_to_weaviate_cloud(
+            client = await self._run(
+                weaviate.connect_to_weaviate_cloud,
                 cluster_url=self.config.url,
                 auth_credentials=Auth.api_key(self.config.api_key),
                 headers=self.config.additional_headers,
                 additional_config=AdditionalConfig(
+                    # Short query timeout so a stuck connection fails fast
                     timeout=Timeout(
                         init=self.config.timeout,
-                        query=self.config.timeout,
+                        query=self.config.query_timeout,
                         insert=self.config.timeout * 2
+                    ),
+                    # Keep-alive pings detect dead gRPC channels between queries
+                    grpc_config=GrpcConfig(
+                        channel_options=[
+                            ("grpc.keepalive_time_ms", self.config.grpc_keepalive_ms),
+                            ("grpc.keepalive_timeout_ms", self.config.grpc_keepalive_timeout_ms),
+                            ("grpc.keepalive_permit_without_calls", 1),
+                            ("grpc.max_concurrent_streams", self.config.grpc_max_concurrent_streams)
+                        ]
                     )
                 )
             )
             
-            # Verify connection
-            if not client.is_ready():
+            # connect_to_weaviate_cloud already validated the connection;
+            # the extra readiness round trip is opt-in
+            if self.config.verify_ready and not await self._run(client.is_ready):
                 raise V2ServiceError(
                     "Weaviate",
                     "Weaviate client is not ready after initialization",
@@ -130,7 +338,8 @@ class WeaviateService(BaseService[WeaviateConfig]):
         limit: int = 5,
         properties: Optional[List[str]] = None,
         where_filter: Optional[Dict[str, Any]] = None,
-        return_metadata: bool = False
+        return_metadata: bool = False,
+        return_id: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Search for objects in a collection using text similarity.
@@ -142,6 +351,7 @@ class WeaviateService(BaseService[WeaviateConfig]):
             properties: Specific properties to return (None = all)
             where_filter: Optional filter conditions
             return_metadata: Include distance and other metadata
+            return_id: Include the object UUID as a string (None otherwise)
             
         Returns:
             List of matching objects
@@ -151,69 +361,34 @@ class WeaviateService(BaseService[WeaviateConfig]):
             ValidationError: If inputs are invalid
         """
         await self.ensure_initialized()
+        self._validate_search(collection, query, limit)
         
-        # Validate inputs
-        if not collection:
-            raise ValidationError(
-                "collection",
-                "Collection name is required"
-            )
-        
-        if not query or not query.strip():
-            raise ValidationError(
-                "query",
-                "Search query cannot be empty"
-            )
-        
-        if limit < 1 or limit > 100:
-            raise ValidationError(
-                "limit",
-                "Limit must be between 1 and 100"
+        # Filtered searches are not cached (filters are not hashable)
+        cache_key = None
+        if where_filter is None:
+            cache_key = self._search_cache_key(
+                collection, query, limit, properties, return_metadata, return_id
             )
+            cached = self._cached_search(cache_key)
+            if cached is not None:
+                return cached
         
         try:
-            self.logger.debug(f"Searching {collection} for: {query[:50]}...")
+            self.logger.debug("Searching %s for: %.50s...", collection, query)
             
             # Get collection
-            collection_obj = self.client.collections.get(collection)
+            collection_obj = self._get_collection(collection)
             
-            # Build query parameters
-            query_params = {
-                "query": query,
-                "limit": limit
-            }
-
-            # Add properties if specified
-            if properties:
-                query_params["return_properties"] = properties
-
-            # Add metadata if requested
-            if return_metadata:
-                query_params["return_metadata"] = MetadataQuery(distance=True)
-
-            # Add where filter if provided
-            if where_filter:
-                query_params["where"] = where_filter
-
             # Execute query - no chaining!
-            results = collection_obj.query.near_text(**query_params)
-
-            # Process results
-            items = []
-            for item in results.objects:
-                item_dict = {
-                    "id": str(item.uuid),
-                    "properties": item.properties
-                }
-                
-                if return_metadata and hasattr(item, 'metadata'):
-                    item_dict["metadata"] = {
-                        "distance": item.metadata.distance if hasattr(item.metadata, 'distance') else None
-                    }
-                
-                items.append(item_dict)
+            results = await self._run(
+                collection_obj.query.near_text,
+                **self._near_text_params(query, limit, properties, where_filter, return_metadata)
+            )
             
-            self.logger.debug(f"Found {len(items)} results")
+            items = self._to_items(results, return_metadata, return_id)
+            self.logger.debug("Found %d results", len(items))
+            if cache_key is not None:
+                self._store_search(cache_key, items)
             return items
             
         except Exception as e:
@@ -227,10 +402,218 @@ class WeaviateService(BaseService[WeaviateConfig]):
                 {"collection": collection, "query": query}
             )
     
+    async def search_batch(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int = 5,
+        properties: Optional[List[str]] = None,
+        where_filter: Optional[Dict[str, Any]] = None,
+        return_metadata: bool = False,
+        return_id: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several text searches against one collection concurrently.
+        
+        Args:
+            collection: Name of the collection to search
+            queries: Search query texts
+            limit: Maximum number of results per query
+            properties: Specific properties to return (None = all)
+            where_filter: Optional filter conditions
+            return_metadata: Include distance and other metadata
+            return_id: Include object UUIDs as strings (None otherwise)
+            
+        Returns:
+            One result list per query, in query order
+            
+        Raises:
+            WeaviateServiceError: If any search fails
+            ValidationError: If inputs are invalid
+        """
+        await self.ensure_initialized()
+        for query in queries:
+            self._validate_search(collection, query, limit)
+        
+        # Only cache misses go to Weaviate
+        outcomes: List[Any] = [None] * len(queries)
+        if where_filter is None:
+            for i, query in enumerate(queries):
+                outcomes[i] = self._cached_search(self._search_cache_key(
+                    collection, query, limit, properties, return_metadata, return_id
+                ))
+        misses = [i for i, outcome in enumerate(outcomes) if outcome is None]
+        if misses:
+            fetched = await self._search_many(
+                collection, [queries[i] for i in misses], limit,
+                properties, where_filter, return_metadata, return_id
+            )
+            for i, outcome in zip(misses, fetched):
+                outcomes[i] = outcome
+        
+        for query, outcome in zip(queries, outcomes):
+            if isinstance(outcome, Exception):
+                error_msg = f"Batch search failed in collection '{collection}': {str(outcome)}"
+                self.logger.error(error_msg)
+                raise V2ServiceError(
+                    "Weaviate",
+                    error_msg,
+                    "search_batch",
+                    {"collection": collection, "query": query}
+                )
+        return outcomes
+    
+    async def _search_many(
+        self,
+        collection: str,
+        queries: List[str],
+        limit: int,
+        properties: Optional[List[str]],
+        where_filter: Optional[Dict[str, Any]],
+        return_metadata: bool,
+        return_id: bool = True
+    ) -> List[Any]:
+        """Run near_text for each query concurrently; failures are returned, not raised"""
+        # One collection handle per pooled client used, spread round-robin
+        width = min(len(queries), len(self._client_pool) or 1)
+        near_texts = [
+            self._get_collection(collection).query.near_text
+            for _ in range(width)
+        ]
+        
+        async def run_one(i: int, query: str) -> List[Dict[str, Any]]:
+            results = await self._run(
+                near_texts[i % width],
+                **self._near_text_params(query, limit, properties, where_filter, return_metadata)
+            )
+            items = self._to_items(results, return_metadata, return_id)
+            if where_filter is None:
+                self._store_search(self._search_cache_key(
+                    collection, query, limit, properties, return_metadata, return_id
+                ), items)
+            return items
+        
+        self.logger.debug("Searching %s for %d queries", collection, len(queries))
+        return await asyncio.gather(
+            *(run_one(i, q) for i, q in enumerate(queries)), return_exceptions=True
+        )
+    
+    @staticmethod
+    def _search_cache_key(
+        collection: str,
+        query: str,
+        limit: int,
+        properties: Optional[List[str]],
+        return_metadata: bool,
+        return_id: bool
+    ) -> tuple:
+        """Build the search cache key; queries match case- and padding-insensitively"""
+        return (
+            collection, query.strip().lower(), limit,
+            tuple(properties) if properties else None, return_metadata, return_id
+        )
+    
+    def _cached_search(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of a fresh cached result for key, or None"""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.config.search_cache_ttl:
+            del self._search_cache[key]
+            return None
+        self._search_cache.move_to_end(key)
+        # Callers may mutate their results; keep the cached copy pristine
+        return _copy_items(entry[1])
+    
+    def _store_search(self, key: tuple, items: List[Dict[str, Any]]) -> None:
+        """Remember a search result, evicting the least recently used entry"""
+        if self.config.search_cache_size <= 0:
+            return
+        self._search_cache[key] = (time.monotonic(), _copy_items(items))
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self.config.search_cache_size:
+            self._search_cache.popitem(last=False)
+    
+    def _validate_search(self, collection: str, query: str, limit: int) -> None:
+        """Validate text search inputs"""
+        # Single combined check on the hot path; the branches below only
+        # run to pick the error to report
+        if collection and query and not query.isspace() and 1 <= limit <= 100:
+            return
+        
+        if not collection:
+            raise ValidationError(
+                "collection",
+                "Collection name is required"
+            )
+        
+        if not query or not query.strip():
+            raise ValidationError(
+                "query",
+                "Search query cannot be empty"
+            )
+        
+        if limit < 1 or limit > 100:
+            raise ValidationError(
+                "limit",
+                "Limit must be between 1 and 100"
+            )
+    
+    def _near_text_params(
+        self,
+        query: str,
+        limit: int,
+        properties: Optional[List[str]],
+        where_filter: Optional[Dict[str, Any]],
+        return_metadata: bool
+    ) -> Dict[str, Any]:
+        """Build near_text keyword arguments"""
+        query_params = {
+            "query": query,
+            "limit": limit
+        }
+        
+        # Add properties if specified
+        if properties:
+            query_params["return_properties"] = properties
+        
+        # Add metadata if requested
+        if return_metadata:
+            query_params["return_metadata"] = MetadataQuery(distance=True)
+        
+        # Add where filter if provided
+        if where_filter:
+            query_params["where"] = where_filter
+        
+        return query_params
+    
+    def _to_items(
+        self,
+        results: Any,
+        return_metadata: bool,
+        return_id: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Convert near_text results to plain dicts"""
+        # v4 result objects always carry a metadata dataclass, so no
+        # per-item reflection is needed; UUIDs are only formatted on request
+        if not return_metadata:
+            return [
+                {"id": str(item.uuid) if return_id else None, "properties": item.properties}
+                for item in results.objects
+            ]
+        return [
+            {
+                "id": str(item.uuid) if return_id else None,
+                "properties": item.properties,
+                "metadata": {"distance": item.metadata.distance}
+            }
+            for item in results.objects
+        ]
+    
     async def vector_search(
         self,
         collection: str,
-        vector: List[float],
+        vector: Sequence[float],
         limit: int = 5,
         properties: Optional[List[str]] = None,
         return_metadata: bool = False
@@ -240,7 +623,8 @@ class WeaviateService(BaseService[WeaviateConfig]):
         
         Args:
             collection: Name of the collection to search
-            vector: Query vector
+            vector: Query vector; any flat float sequence (list, tuple,
+                array.array, numpy array) is passed to the client as-is
             limit: Maximum number of results
             properties: Specific properties to return
             return_metadata: Include distance metadata
@@ -256,47 +640,52 @@ class WeaviateService(BaseService[WeaviateConfig]):
                 "Collection name is required"
             )
         
-        if not vector or not isinstance(vector, list):
+        # len() rather than truthiness: numpy arrays refuse bool()
+        is_vector = isinstance(vector, _VECTOR_TYPES) or hasattr(vector, "__array__")
+        if not is_vector or len(vector) == 0:
             raise ValidationError(
                 "vector",
                 "Valid vector is required"
             )
         
         try:
-            collection_obj = self.client.collections.get(collection)
-            
-            # Build query
-            query_builder = collection_obj.query.near_vector(
-                near_vector=vector,
-                limit=limit
-            )
-            
-            if properties:
-                query_builder = query_builder.select(properties)
+            collection_obj = self._get_collection(collection)
             
-            if return_metadata:
-                query_builder = query_builder.include_metadata(MetadataQuery.full())
+            def run_query():
+                # Build query
+                query_builder = collection_obj.query.near_vector(
+                    near_vector=vector,
+                    limit=limit
+                )
+                
+                if properties:
+                    query_builder = query_builder.select(properties)
+                
+                if return_metadata:
+                    query_builder = query_builder.include_metadata(MetadataQuery.full())
+                
+                # Execute query
+                return query_builder.do()
             
-            # Execute query
-            results = query_builder.do()
+            results = await self._run(run_query)
             
             # Convert to list of dicts
-            items = []
-            for item in results.objects:
-                item_dict = {
+            if not return_metadata:
+                return [
+                    {"id": str(item.uuid), "properties": item.properties}
+                    for item in results.objects
+                ]
+            return [
+                {
                     "id": str(item.uuid),
-                    "properties": item.properties
-                }
-                
-                if return_metadata and hasattr(item, 'metadata'):
-                    item_dict["metadata"] = {
-                        "distance": getattr(item.metadata, 'distance', None),
-                        "certainty": getattr(item.metadata, 'certainty', None)
+                    "properties": item.properties,
+                    "metadata": {
+                        "distance": item.metadata.distance,
+                        "certainty": item.metadata.certainty
                     }
-                
-                items.append(item_dict)
-            
-            return items
+                }
+                for item in results.objects
+            ]
             
         except Exception as e:
             error_msg = f"Vector search failed in collection '{collection}': {str(e)}"
@@ -327,10 +716,11 @@ class WeaviateService(BaseService[WeaviateConfig]):
         await self.ensure_initialized()
         
         try:
-            collection_obj = self.client.collections.get(collection)
+            collection_obj = self._get_collection(collection)
             
             # Get object
-            result = collection_obj.query.fetch_object_by_id(
+            result = await self._run(
+                collection_obj.query.fetch_object_by_id,
                 uuid=object_id,
                 select=properties
             )
@@ -345,7 +735,7 @@ class WeaviateService(BaseService[WeaviateConfig]):
             
         except Exception as e:
             # Log but don't raise for not found
-            self.logger.debug(f"Object not found or error: {e}")
+            self.logger.debug("Object not found or error: %s", e)
             return None
     
     async def get_collections(self) -> List[str]:
@@ -358,15 +748,18 @@ class WeaviateService(BaseService[WeaviateConfig]):
         await self.ensure_initialized()
         
         try:
-            # Use cached value if available
-            if self._collections_cache is not None:
+            # Use cached value while it is fresh
+            if (self._collections_cache is not None and
+                    time.monotonic() - self._collections_fetched < self.config.collections_cache_ttl):
                 return self._collections_cache
             
             # Get all collections
-            collections = list(self.client.collections.list_all().keys())
+            collections = list((await self._run(self.client.collections.list_all)).keys())
             
-            # Cache the result
+            # Cache the result (the set serves collection_exists lookups)
             self._collections_cache = collections
+            self._collections_set = frozenset(collections)
+            self._collections_fetched = time.monotonic()
             
             return collections
             
@@ -388,13 +781,21 @@ class WeaviateService(BaseService[WeaviateConfig]):
         Returns:
             True if collection exists
         """
-        collections = await self.get_collections()
-        return collection in collections
+        await self.get_collections()
+        return collection in self._collections_set
+    
+    def invalidate_collections(self) -> None:
+        """Drop the cached collection list, e.g. after creating a collection"""
+        self._collections_cache = None
+        self._collections_set = frozenset()
     
     async def count_objects(self, collection: str) -> int:
         """
         Count objects in a collection.
         
+        Counts are cached for ``config.count_cache_ttl`` seconds, since the
+        aggregate is a server-side scan.
+        
         Args:
             collection: Collection name
             
@@ -403,13 +804,19 @@ class WeaviateService(BaseService[WeaviateConfig]):
         """
         await self.ensure_initialized()
         
+        cached = self._count_cache.get(collection)
+        if cached is not None and time.monotonic() - cached[0] < self.config.count_cache_ttl:
+            return cached[1]
+        
         try:
-            collection_obj = self.client.collections.get(collection)
-            aggregate_result = collection_obj.aggregate.over_all(total_count=True)
-            return aggregate_result.total_count or 0
+            collection_obj = self._get_collection(collection)
+            aggregate_result = await self._run(collection_obj.aggregate.over_all, total_count=True)
+            count = aggregate_result.total_count or 0
+            self._count_cache[collection] = (time.monotonic(), count)
+            return count
             
         except Exception as e:
-            self.logger.warning(f"Failed to count objects: {e}")
+            self.logger.warning("Failed to count objects: %s", e)
             return 0
     
     async def health_check(self) -> Dict[str, Any]:
@@ -422,17 +829,17 @@ class WeaviateService(BaseService[WeaviateConfig]):
         try:
             await self.ensure_initialized()
             
-            # Check if client is ready
-            is_ready = self.client.is_ready()
-            
-            # Get collections
-            collections = await self.get_collections()
+            # Readiness and the collection list are independent round trips
+            is_ready, collections = await asyncio.gather(
+                self._run(self.client.is_ready),
+                self.get_collections()
+            )
             
-            # Count objects in each collection
-            collection_counts = {}
-            for collection in collections[:5]:  # Limit to first 5 for performance
-                count = await self.count_objects(collection)
-                collection_counts[collection] = count
+            # Count objects in each collection concurrently; the counts are
+            # multiplexed as streams over the client's gRPC connection
+            sampled = collections[:5]  # Limit to first 5 for performance
+            counts = await asyncio.gather(*(self.count_objects(c) for c in sampled))
+            collection_counts = dict(zip(sampled, counts))
             
             return {
                 "healthy": is_ready,
@@ -457,11 +864,28 @@ class WeaviateService(BaseService[WeaviateConfig]):
     
     async def _cleanup(self) -> None:
         """Clean up Weaviate client connection"""
-        if self._client:
-            try:
-                self._client.close()
-            except Exception as e:
-                self.logger.warning(f"Error closing Weaviate client: {e}")
+        self._count_cache.clear()
+        self._search_cache.clear()
+        self._collection_cache.clear()
+        
+        # Only the last service using a shared pool closes it; a pool that
+        # was replaced after going stale is already closed
+        shared, self._shared_pool = self._shared_pool, None
+        if shared is None:
+            await self._close_clients([self._client] if self._client else [])
+        elif not shared.closed:
+            shared.refs -= 1
+            if shared.refs <= 0:
+                shared.closed = True
+                if _CLIENT_REGISTRY.get(shared.key) is shared:
+                    del _CLIENT_REGISTRY[shared.key]
+                await self._close_clients(shared.clients)
+        self._client_pool = []
+        self._pool_idx = itertools.cycle([0])
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     # Convenience method from retrieval.py
     async def find_symptom_match(self, symptom: str, limit: int = 1) -> Optional[str]:
@@ -480,8 +904,9 @@ class WeaviateService(BaseService[WeaviateConfig]):
                 collection="Symptome",
                 query=symptom,
                 limit=limit,
-                properties=["beschreibung", "schnelldiagnose"],
-                return_metadata=True
+                properties=SYMPTOM_PROPERTIES,
+                return_metadata=True,
+                return_id=False
             )
             
             if results:
@@ -491,8 +916,41 @@ class WeaviateService(BaseService[WeaviateConfig]):
             return None
             
         except Exception as e:
-            self.logger.error(f"Failed to find symptom match: {e}")
+            self.logger.error("Failed to find symptom match: %s", e)
             return None
+    
+    async def find_symptom_match_many(
+        self,
+        symptoms: List[str],
+        limit: int = 1
+    ) -> List[Optional[str]]:
+        """
+        Find matching symptom information for several symptoms in one batch.
+        
+        Args:
+            symptoms: The symptoms to search for
+            limit: Number of matches to consider per symptom
+            
+        Returns:
+            Matching symptom information (or None) per symptom, in order
+        """
+        try:
+            batches = await self.search_batch(
+                collection="Symptome",
+                queries=symptoms,
+                limit=limit,
+                properties=SYMPTOM_PROPERTIES,
+                return_metadata=True,
+                return_id=False
+            )
+            return [
+                results[0]["properties"].get("schnelldiagnose", "") if results else None
+                for results in batches
+            ]
+            
+        except Exception as e:
+            self.logger.error("Failed to find symptom matches: %s", e)
+            return [None] * len(symptoms)
 
 
 # Factory function for convenience
@@ -2,49 +2,82 @@
 """Test script for API authentication"""
 
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import threading
 
 # Test configuration
 API_URL = "http://localhost:8000"
 API_KEY = os.getenv("WUFFCHAT_API_KEY", "test-key-123")
 
+# requests.Session is not thread-safe, so each worker thread keeps its own
+# keep-alive session
+_local = threading.local()
+
+
+def get_session():
+    """Return this thread's keep-alive session, creating it on first use"""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.headers.update({"Connection": "keep-alive"})
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+
+def run_test(name, method, url, check, **kwargs):
+    """Send one request and return the lines to print for it"""
+    try:
+        response = get_session().request(method, url, **kwargs)
+        return [f"\n{name}", f"   Status: {response.status_code}", check(response)]
+    except Exception as e:
+        # Report the failed check instead of aborting the whole run
+        return [f"\n{name}", f"   ❌ Error: {e}"]
+
+
+def check_health(response):
+    return f"   Response: {response.json()}"
+
+
+def check_rejected(response):
+    if response.status_code == 401:
+        return f"   ✅ Correctly rejected: {response.json()['detail']}"
+    return f"   ❌ Should have been rejected!"
+
+
+def check_accepted(response):
+    if response.status_code == 200:
+        return f"   ✅ Success! Session ID: {response.json()['session_id']}"
+    return f"   ❌ Failed: {response.text}"
+
+
+TESTS = [
+    # Test 1: Health check (no auth required)
+    ("1️⃣ Testing health check (no auth)...", "GET", f"{API_URL}/", check_health, {}),
+    # Test 2: Protected endpoint without API key
+    ("2️⃣ Testing protected endpoint without API key...", "POST", f"{API_URL}/flow_intro",
+     check_rejected, {}),
+    # Test 3: Protected endpoint with wrong API key
+    ("3️⃣ Testing protected endpoint with wrong API key...", "POST", f"{API_URL}/flow_intro",
+     check_rejected, {"headers": {"X-API-Key": "wrong-key"}}),
+    # Test 4: Protected endpoint with correct API key
+    ("4️⃣ Testing protected endpoint with correct API key...", "POST", f"{API_URL}/flow_intro",
+     check_accepted, {"headers": {"X-API-Key": API_KEY}}),
+]
+
 print("🔐 Testing API Authentication")
 print(f"📍 API URL: {API_URL}")
 print(f"🔑 API Key: {API_KEY[:8]}...")
 
-# Test 1: Health check (no auth required)
-print("\n1️⃣ Testing health check (no auth)...")
-response = requests.get(f"{API_URL}/")
-print(f"   Status: {response.status_code}")
-print(f"   Response: {response.json()}")
-
-# Test 2: Protected endpoint without API key
-print("\n2️⃣ Testing protected endpoint without API key...")
-response = requests.post(f"{API_URL}/flow_intro")
-print(f"   Status: {response.status_code}")
-if response.status_code == 401:
-    print(f"   ✅ Correctly rejected: {response.json()['detail']}")
-else:
-    print(f"   ❌ Should have been rejected!")
-
-# Test 3: Protected endpoint with wrong API key
-print("\n3️⃣ Testing protected endpoint with wrong API key...")
-headers = {"X-API-Key": "wrong-key"}
-response = requests.post(f"{API_URL}/flow_intro", headers=headers)
-print(f"   Status: {response.status_code}")
-if response.status_code == 401:
-    print(f"   ✅ Correctly rejected: {response.json()['detail']}")
-else:
-    print(f"   ❌ Should have been rejected!")
-
-# Test 4: Protected endpoint with correct API key
-print("\n4️⃣ Testing protected endpoint with correct API key...")
-headers = {"X-API-Key": API_KEY}
-response = requests.post(f"{API_URL}/flow_intro", headers=headers)
-print(f"   Status: {response.status_code}")
-if response.status_code == 200:
-    print(f"   ✅ Success! Session ID: {response.json()['session_id']}")
-else:
-    print(f"   ❌ Failed: {response.text}")
-
-print("\n✅ API Authentication test complete!")
\ No newline at end of file
+# Run all checks concurrently; results print in order of completion
+with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+    futures = [
+        executor.submit(run_test, name, method, url, check, **kwargs)
+        for name, method, url, check, kwargs in TESTS
+    ]
+    for future in as_completed(futures):
+        print("\n".join(future.result()))
+
+print("\n✅ API Authentication test complete!")
@@ -0,0 +1,122 @@
+# tests/v2/agents/_stubs.py
+"""
+Hand-written service stubs for the agent tests.
+
+Cheaper than spec'd mocks: nothing is introspected at construction and
+calls are not recorded. They support the subset of the Mock API the tests
+use - return_value, side_effect, call_count and assert_called_once() -
+plus queue_responses() for scripting a sequence of results.
+"""
+
+import string
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any, Mapping
+
+
+_FORMATTER = string.Formatter()
+
+
+class StubAsyncMethod:
+    """Awaitable method that follows Mock's return_value/side_effect rules"""
+    
+    def __init__(self, return_value: Any = None):
+        self._default = return_value
+        self.reset()
+    
+    def reset(self):
+        """Restore the default return value and clear side effect and calls"""
+        self.return_value = self._default
+        self._side_effect = None
+        self._queue = deque()
+        self.call_count = 0
+    
+    def queue_responses(self, responses: Iterable[Any]):
+        """
+        Queue results for the next calls, one per call.
+        
+        Exceptions in the queue are raised. Once it is empty, calls fall
+        back to side_effect/return_value.
+        """
+        self._queue.extend(responses)
+    
+    @property
+    def side_effect(self):
+        return self._side_effect
+    
+    @side_effect.setter
+    def side_effect(self, effect):
+        # Like Mock: an iterable yields one result per call
+        if (
+            effect is not None
+            and not callable(effect)
+            and not isinstance(effect, BaseException)
+            and isinstance(effect, Iterable)
+        ):
+            effect = iter(effect)
+        self._side_effect = effect
+    
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected one call, got {self.call_count}"
+    
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        if self._queue:
+            result = self._queue.popleft()
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException) or (
+            isinstance(effect, type) and issubclass(effect, BaseException)
+        ):
+            raise effect
+        if isinstance(effect, Iterator):
+            result = next(effect)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        return effect(*args, **kwargs)
+
+
+class StubGPTService:
+    """Stand-in for GPTService with configurable complete() results"""
+    
+    def __init__(self, response: str = "Mock GPT response"):
+        self.complete = StubAsyncMethod(response)
+        self.health_check = StubAsyncMethod({"healthy": True})
+    
+    def reset(self):
+        """Restore the default results, as reset_mock plus defaults would"""
+        self.complete.reset()
+        self.health_check.reset()
+
+
+class StubPromptManager:
+    """Stand-in for PromptManager that renders prompts from a mapping"""
+    
+    def __init__(self, responses: Mapping[Any, str]):
+        self._responses = responses
+        # Most templates have no fields; those are returned without formatting
+        self._has_fields = frozenset(
+            prompt_type
+            for prompt_type, template in responses.items()
+            if any(field for _, field, _, _ in _FORMATTER.parse(template))
+        )
+    
+    def get_prompt(self, prompt_type: Any, **kwargs: Any) -> str:
+        """Return the formatted prompt, or a placeholder for unknown types"""
+        template = self._responses.get(prompt_type)
+        if template is None:
+            return f"Mock prompt for {prompt_type}"
+        if prompt_type not in self._has_fields:
+            return template
+        try:
+            return template.format_map(kwargs)
+        except KeyError:
+            return template
+    
+    def load_prompts(self):
+        return None
@@ -5,16 +5,20 @@ Shared fixtures for V2 agent tests.
 Provides common mock objects and test data for agent testing.
 """
 
+import inspect
+import operator
+import string
+import sys
 import pytest
+import pytest_asyncio
+from functools import lru_cache
 from unittest.mock import Mock, AsyncMock, MagicMock
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Tuple
+from dataclasses import dataclass, replace
+from types import MappingProxyType
 
 from src.agents.base_agent import AgentContext, MessageType, V2AgentMessage
-from src.core.prompt_manager import PromptManager, PromptType
-from src.services.gpt_service import GPTService
-from src.services.weaviate_service import WeaviateService
-from src.services.redis_service import RedisService
+from src.core.prompt_manager import PromptType
 
 
 # Test data constants
@@ -22,107 +26,193 @@ MOCK_SESSION_ID = "test-session-123"
 MOCK_USER_INPUT = "Mein Hund bellt ständig"
 MOCK_GPT_RESPONSE = "Als Hund fühle ich mich in dieser Situation unsicher."
 
+# Interned so message field comparisons in the helpers are identity checks
+_RESPONSE_TYPE = sys.intern(MessageType.RESPONSE.value)
 
-@pytest.fixture
-def mock_prompt_manager():
+
+@lru_cache(maxsize=None)
+def _spec_attrs(cls: type) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Public attribute names of cls, and the subset that are coroutine functions"""
+    names = tuple(a for a in dir(cls) if not a.startswith("_"))
+    async_names = tuple(a for a in names if inspect.iscoroutinefunction(getattr(cls, a)))
+    return names, async_names
+
+
+def _spec_mock(cls: type, spec_set: bool = False) -> Mock:
     """
-    Mock PromptManager with comprehensive prompt responses.
+    Create a mock restricted to cls's public attributes.
     
-    Returns a properly configured mock that handles all PromptType enums.
+    Same attribute checks as ``Mock(spec=cls)``, but the class is
+    introspected only once per session. Only coroutine methods get
+    AsyncMock children; everything else stays a plain Mock, so sync calls
+    and attributes pay no coroutine wrapping. With spec_set, setting an
+    attribute cls does not have raises AttributeError too.
     """
-    mock = Mock(spec=PromptManager)
-    
-    # Define comprehensive prompt responses
-    prompt_responses = {
-        # Dog prompts
-        PromptType.DOG_GREETING: "Hallo! Schön, dass Du da bist. Ich erkläre Dir Hundeverhalten aus der Hundeperspektive.",
-        PromptType.DOG_GREETING_FOLLOWUP: "Bitte beschreibe ein Verhalten oder eine Situation!",
-        PromptType.DOG_PERSPECTIVE: "Ich bin ein Hund und zeige dieses Verhalten: {symptom}. Aus meiner Sicht {match}.",
-        # DOG_INSTINCT_PERSPECTIVE doesn't exist in current PromptType enum
-        PromptType.DOG_DIAGNOSIS: "Ich erkenne bei diesem Verhalten hauptsächlich meinen {primary_instinct}-Instinkt. {primary_description}",
-        PromptType.DOG_CONFIRMATION_QUESTION: "Magst Du mehr erfahren, warum ich mich so verhalte?",
-        PromptType.DOG_CONTEXT_QUESTION: "Gut, dann brauche ich ein bisschen mehr Informationen. Bitte beschreibe die Situation genauer.",
-        PromptType.DOG_EXERCISE_QUESTION: "Möchtest du eine Lernaufgabe, die dir in dieser Situation helfen kann?",
-        PromptType.DOG_CONTINUE_OR_RESTART: "Möchtest du ein weiteres Hundeverhalten verstehen?",
-        PromptType.DOG_NO_MATCH_ERROR: "Hmm, zu diesem Verhalten habe ich leider noch keine Antwort.",
-        PromptType.DOG_INVALID_INPUT_ERROR: "Kannst Du das Verhalten bitte etwas ausführlicher beschreiben?",
-        PromptType.DOG_TECHNICAL_ERROR: "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?",
-        PromptType.DOG_DESCRIBE_MORE: "Kannst du mir mehr erzählen?",
-        PromptType.DOG_BE_SPECIFIC: "Kannst Du das bitte genauer beschreiben?",
-        PromptType.DOG_ANOTHER_BEHAVIOR_QUESTION: "Gibt es ein weiteres Verhalten, das Du mit mir besprechen möchtest?",
-        PromptType.DOG_FALLBACK_EXERCISE: "Eine hilfreiche Übung wäre, mit deinem Hund Impulskontrolle zu trainieren.",
-        
-        # Companion prompts
-        PromptType.COMPANION_FEEDBACK_INTRO: "Ich würde mich freuen, wenn du mir noch ein kurzes Feedback gibst.",
-        PromptType.COMPANION_FEEDBACK_Q1: "Hast Du das Gefühl, dass Dir die Beratung bei Deinem Anliegen weitergeholfen hat?",
-        PromptType.COMPANION_FEEDBACK_Q2: "Wie fandest Du die Sichtweise des Hundes – was hat Dir daran gefallen oder vielleicht irritiert?",
-        PromptType.COMPANION_FEEDBACK_Q3: "Was denkst Du über die vorgeschlagene Übung – passt sie zu Deiner Situation?",
-        PromptType.COMPANION_FEEDBACK_Q4: "Auf einer Skala von 0-10: Wie wahrscheinlich ist es, dass Du Wuffchat weiterempfiehlst?",
-        PromptType.COMPANION_FEEDBACK_Q5: "Optional: Deine E-Mail oder Telefonnummer für eventuelle Rückfragen.",
-        PromptType.COMPANION_FEEDBACK_ACK: "Danke für deine Antwort.",
-        PromptType.COMPANION_FEEDBACK_COMPLETE: "Danke für Dein Feedback! 🐾",
-        PromptType.COMPANION_FEEDBACK_COMPLETE_NOSAVE: "Danke für dein Feedback! Es konnte leider nicht gespeichert werden.",
-        PromptType.COMPANION_PROCEED_CONFIRMATION: "Möchtest du fortfahren?",
-        PromptType.COMPANION_SKIP_CONFIRMATION: "Möchtest du überspringen?",
-        PromptType.COMPANION_INVALID_FEEDBACK_ERROR: "Bitte gib eine gültige Antwort.",
-        PromptType.COMPANION_SAVE_ERROR: "Das Feedback konnte nicht gespeichert werden.",
-        PromptType.COMPANION_GENERAL_ERROR: "Es tut mir leid, es gab ein Problem. Bitte versuche es erneut.",
-        
-        # Other prompts
-        PromptType.VALIDATION: "Antworte mit 'ja' oder 'nein'. Hat die folgende Eingabe mit Hundeverhalten zu tun? {text}",
-        PromptType.COMBINED_INSTINCT: "Analysiere das Verhalten '{symptom}' mit Kontext '{context}' und identifiziere Instinkte.",
-    }
-    
-    def get_prompt_side_effect(prompt_type, **kwargs):
-        """Side effect for get_prompt that handles formatting"""
-        # Handle the prompt_type properly - it's a PromptType enum
-        template = None
-        
-        # Direct lookup by enum
-        if prompt_type in prompt_responses:
-            template = prompt_responses[prompt_type]
-        else:
-            # If not found, try to match by name
-            for key, value in prompt_responses.items():
-                if key == prompt_type or (hasattr(key, 'name') and key.name == str(prompt_type)):
-                    template = value
-                    break
-        
-        if template:
-            # Simple template formatting
-            try:
-                return template.format(**kwargs)
-            except KeyError:
-                # Return template as-is if formatting fails
+    names, async_names = _spec_attrs(cls)
+    mock = Mock()
+    mock.mock_add_spec(names, spec_set=spec_set)
+    for name in async_names:
+        setattr(mock, name, AsyncMock())
+    return mock
+
+
+# Mock prompt responses, built once at import
+_PROMPT_RESPONSES: Dict[PromptType, str] = {
+    # Dog prompts
+    PromptType.DOG_GREETING: "Hallo! Schön, dass Du da bist. Ich erkläre Dir Hundeverhalten aus der Hundeperspektive.",
+    PromptType.DOG_GREETING_FOLLOWUP: "Bitte beschreibe ein Verhalten oder eine Situation!",
+    PromptType.DOG_PERSPECTIVE: "Ich bin ein Hund und zeige dieses Verhalten: {symptom}. Aus meiner Sicht {match}.",
+    # DOG_INSTINCT_PERSPECTIVE doesn't exist in current PromptType enum
+    PromptType.DOG_DIAGNOSIS: "Ich erkenne bei diesem Verhalten hauptsächlich meinen {primary_instinct}-Instinkt. {primary_description}",
+    PromptType.DOG_CONFIRMATION_QUESTION: "Magst Du mehr erfahren, warum ich mich so verhalte?",
+    PromptType.DOG_CONTEXT_QUESTION: "Gut, dann brauche ich ein bisschen mehr Informationen. Bitte beschreibe die Situation genauer.",
+    PromptType.DOG_EXERCISE_QUESTION: "Möchtest du eine Lernaufgabe, die dir in dieser Situation helfen kann?",
+    PromptType.DOG_CONTINUE_OR_RESTART: "Möchtest du ein weiteres Hundeverhalten verstehen?",
+    PromptType.DOG_NO_MATCH_ERROR: "Hmm, zu diesem Verhalten habe ich leider noch keine Antwort.",
+    PromptType.DOG_INVALID_INPUT_ERROR: "Kannst Du das Verhalten bitte etwas ausführlicher beschreiben?",
+    PromptType.DOG_TECHNICAL_ERROR: "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?",
+    PromptType.DOG_DESCRIBE_MORE: "Kannst du mir mehr erzählen?",
+    PromptType.DOG_BE_SPECIFIC: "Kannst Du das bitte genauer beschreiben?",
+    PromptType.DOG_ANOTHER_BEHAVIOR_QUESTION: "Gibt es ein weiteres Verhalten, das Du mit mir besprechen möchtest?",
+    PromptType.DOG_FALLBACK_EXERCISE: "Eine hilfreiche Übung wäre, mit deinem Hund Impulskontrolle zu trainieren.",
+    
+    # Companion prompts
+    PromptType.COMPANION_FEEDBACK_INTRO: "Ich würde mich freuen, wenn du mir noch ein kurzes Feedback gibst.",
+    PromptType.COMPANION_FEEDBACK_Q1: "Hast Du das Gefühl, dass Dir die Beratung bei Deinem Anliegen weitergeholfen hat?",
+    PromptType.COMPANION_FEEDBACK_Q2: "Wie fandest Du die Sichtweise des Hundes – was hat Dir daran gefallen oder vielleicht irritiert?",
+    PromptType.COMPANION_FEEDBACK_Q3: "Was denkst Du über die vorgeschlagene Übung – passt sie zu Deiner Situation?",
+    PromptType.COMPANION_FEEDBACK_Q4: "Auf einer Skala von 0-10: Wie wahrscheinlich ist es, dass Du Wuffchat weiterempfiehlst?",
+    PromptType.COMPANION_FEEDBACK_Q5: "Optional: Deine E-Mail oder Telefonnummer für eventuelle Rückfragen.",
+    PromptType.COMPANION_FEEDBACK_ACK: "Danke für deine Antwort.",
+    PromptType.COMPANION_FEEDBACK_COMPLETE: "Danke für Dein Feedback! 🐾",
+    PromptType.COMPANION_FEEDBACK_COMPLETE_NOSAVE: "Danke für dein Feedback! Es konnte leider nicht gespeichert werden.",
+    PromptType.COMPANION_PROCEED_CONFIRMATION: "Möchtest du fortfahren?",
+    PromptType.COMPANION_SKIP_CONFIRMATION: "Möchtest du überspringen?",
+    PromptType.COMPANION_INVALID_FEEDBACK_ERROR: "Bitte gib eine gültige Antwort.",
+    PromptType.COMPANION_SAVE_ERROR: "Das Feedback konnte nicht gespeichert werden.",
+    PromptType.COMPANION_GENERAL_ERROR: "Es tut mir leid, es gab ein Problem. Bitte versuche es erneut.",
+    
+    # Other prompts
+    PromptType.VALIDATION: "Antworte mit 'ja' oder 'nein'. Hat die folgende Eingabe mit Hundeverhalten zu tun? {text}",
+    PromptType.COMBINED_INSTINCT: "Analysiere das Verhalten '{symptom}' mit Kontext '{context}' und identifiziere Instinkte.",
+}
+
+# PromptType keys are immutable; share one tuple across tests
+_PROMPT_KEYS = tuple(_PROMPT_RESPONSES)
+
+# Secondary index for lookups by prompt name (e.g. "DOG_GREETING")
+_PROMPTS_BY_NAME = {getattr(key, 'name', str(key)): key for key in _PROMPT_RESPONSES}
+
+def _compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Compile a template into a renderer that joins its literal parts with
+    the field values, without re-parsing on each call.
+    
+    A missing field renders the raw template, like the KeyError fallback
+    of str.format used to.
+    """
+    parsed = list(string.Formatter().parse(template))
+    if all(field_name is None for _, field_name, _, _ in parsed):
+        return lambda **kwargs: template
+    
+    literals = [literal for literal, _, _, _ in parsed]
+    fields = [
+        (field_name, format_spec or "", conversion)
+        for _, field_name, format_spec, conversion in parsed
+    ]
+    
+    def render(**kwargs: Any) -> str:
+        parts = []
+        for literal, (field_name, format_spec, conversion) in zip(literals, fields):
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if field_name not in kwargs:
                 return template
-        
-        # Default fallback
-        return f"Mock prompt for {prompt_type}"
+            value = kwargs[field_name]
+            if conversion:
+                value = repr(value) if conversion == 'r' else str(value)
+            parts.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(parts)
+    
+    return render
+
+
+# Each template compiled once into a renderer
+_PROMPT_RENDERERS = {
+    prompt_type: _compile_prompt(template)
+    for prompt_type, template in _PROMPT_RESPONSES.items()
+}
+
+
+def _get_prompt_side_effect(prompt_type, **kwargs):
+    """Side effect for get_prompt that handles formatting"""
+    # Handle the prompt_type properly - direct lookup by PromptType enum
+    renderer = _PROMPT_RENDERERS.get(prompt_type)
+    if renderer is None:
+        # If not found, try to match by name
+        key = _PROMPTS_BY_NAME.get(getattr(prompt_type, 'name', str(prompt_type)))
+        if key is not None:
+            renderer = _PROMPT_RENDERERS[key]
     
-    mock.get_prompt.side_effect = get_prompt_side_effect
-    mock.load_prompts.return_value = None
-    mock.list_prompts.return_value = list(prompt_responses.keys())
+    if renderer is not None:
+        return renderer(**kwargs)
     
-    return mock
+    # Default fallback
+    return f"Mock prompt for {prompt_type}"
+
+
+# Spec'd mocks are built once per module (spec introspection is the costly
+# part); the function-scoped fixtures below reset them and reapply their
+# defaults for every test. Configure them through return_value/side_effect
+# rather than by replacing attributes, which would outlive the test.
+
+@pytest.fixture(scope="module")
+def _prompt_manager_base():
+    """Module-wide PromptManager mock and its default configuration"""
+    from src.core.prompt_manager import PromptManager
+    # Tests only configure existing methods, so typos in names fail loudly
+    mock = _spec_mock(PromptManager, spec_set=True)
+    
+    def apply_defaults():
+        mock.get_prompt.side_effect = _get_prompt_side_effect
+        mock.load_prompts.return_value = None
+        mock.list_prompts.return_value = _PROMPT_KEYS
+    
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_gpt_service():
+def mock_prompt_manager(_prompt_manager_base):
     """
-    Mock GPTService with realistic behavior.
+    Mock PromptManager with comprehensive prompt responses.
     
-    Provides async methods and configurable responses.
+    Returns a properly configured mock that handles all PromptType enums.
+    """
+    mock, apply_defaults = _prompt_manager_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+@pytest.fixture
+def mock_prompt_manager_plain(_prompt_manager_base):
     """
-    mock = AsyncMock(spec=GPTService)
+    Mock PromptManager that answers every prompt with "Mock prompt".
     
-    # Default responses
-    mock.complete.return_value = MOCK_GPT_RESPONSE
-    mock.health_check.return_value = {
-        "healthy": True,
-        "status": "connected",
-        "details": {"model": "gpt-4", "response_time_ms": 250}
-    }
-    mock.is_initialized = True
+    For unit tests that set get_prompt's return value themselves.
+    """
+    mock, _ = _prompt_manager_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.get_prompt.return_value = "Mock prompt"
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _gpt_service_base():
+    """Module-wide GPTService mock and its default configuration"""
+    from src.services.gpt_service import GPTService
+    mock = _spec_mock(GPTService)
     
     # Add method to configure responses
     def configure_response(response: str):
@@ -130,38 +220,36 @@ def mock_gpt_service():
     
     mock.configure_response = configure_response
     
-    return mock
+    def apply_defaults():
+        mock.complete.return_value = MOCK_GPT_RESPONSE
+        mock.health_check.return_value = {
+            "healthy": True,
+            "status": "connected",
+            "details": {"model": "gpt-4", "response_time_ms": 250}
+        }
+        mock.is_initialized = True
+    
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_weaviate_service():
+def mock_gpt_service(_gpt_service_base):
     """
-    Mock WeaviateService with realistic search results.
+    Mock GPTService with realistic behavior.
     
-    Provides vector search functionality with configurable results.
+    Provides async methods and configurable responses.
     """
-    mock = AsyncMock(spec=WeaviateService)
-    
-    # Default search results
-    default_results = [
-        {
-            "id": "uuid-1",
-            "properties": {
-                "text": "Hund bellt bei fremden Menschen aus territorialem Instinkt",
-                "schnelldiagnose": "Der Hund zeigt territoriales Verhalten",
-                "instinct": "territorial"
-            },
-            "metadata": {"distance": 0.15, "certainty": 0.85}
-        }
-    ]
-    
-    mock.vector_search.return_value = default_results
-    mock.health_check.return_value = {
-        "healthy": True,
-        "status": "connected",
-        "details": {"collections": ["Symptome", "Instinkte", "Erziehung"]}
-    }
-    mock.is_initialized = True
+    mock, apply_defaults = _gpt_service_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _weaviate_service_base():
+    """Module-wide WeaviateService mock and its default configuration"""
+    from src.services.weaviate_service import WeaviateService
+    mock = _spec_mock(WeaviateService)
     
     # Add method to configure search results
     def configure_results(results: List[Dict[str, Any]]):
@@ -169,137 +257,264 @@ def mock_weaviate_service():
     
     mock.configure_results = configure_results
     
-    return mock
+    def apply_defaults():
+        # Default search results
+        mock.vector_search.return_value = [
+            {
+                "id": "uuid-1",
+                "properties": {
+                    "text": "Hund bellt bei fremden Menschen aus territorialem Instinkt",
+                    "schnelldiagnose": "Der Hund zeigt territoriales Verhalten",
+                    "instinct": "territorial"
+                },
+                "metadata": {"distance": 0.15, "certainty": 0.85}
+            }
+        ]
+        mock.health_check.return_value = {
+            "healthy": True,
+            "status": "connected",
+            "details": {"collections": ["Symptome", "Instinkte", "Erziehung"]}
+        }
+        mock.is_initialized = True
+    
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_redis_service():
+def mock_weaviate_service(_weaviate_service_base):
     """
-    Mock RedisService with realistic caching behavior.
+    Mock WeaviateService with realistic search results.
     
-    Provides in-memory cache simulation.
+    Provides vector search functionality with configurable results.
     """
-    mock = AsyncMock(spec=RedisService)
+    mock, apply_defaults = _weaviate_service_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _redis_service_base():
+    """Module-wide RedisService mock and its default configuration"""
+    from src.services.redis_service import RedisService
+    mock = _spec_mock(RedisService)
     
-    # Simple in-memory cache for testing
+    # Simple in-memory cache for testing; exposed as mock.cache so tests
+    # can bulk-load state
     cache = {}
     
-    async def mock_get(key: str):
+    # Plain callables: AsyncMock already makes the calls awaitable
+    def mock_get(key: str, *args, **kwargs):
         return cache.get(key)
     
-    async def mock_set(key: str, value: Any, ttl: int = None):
+    def mock_set(key: str, value: Any, ttl: int = None):
         cache[key] = value
         return True
     
-    async def mock_delete(key: str):
-        if key in cache:
-            del cache[key]
+    def mock_delete(key: str):
+        cache.pop(key, None)
         return True
     
-    mock.get.side_effect = mock_get
-    mock.set.side_effect = mock_set
-    mock.delete.side_effect = mock_delete
-    mock.health_check.return_value = {
-        "healthy": True,
-        "status": "connected",
-        "details": {"memory_usage": "1.2MB", "keys": len(cache)}
-    }
-    mock.is_initialized = True
-    
     # Add cache management methods
-    mock.clear_cache = lambda: cache.clear()
-    mock.get_cache = lambda: cache.copy()
+    mock.cache = cache
+    mock.clear_cache = cache.clear
+    mock.get_cache = cache.copy
     
-    return mock
+    def apply_defaults():
+        cache.clear()
+        mock.get.side_effect = mock_get
+        mock.set.side_effect = mock_set
+        mock.delete.side_effect = mock_delete
+        mock.health_check.return_value = {
+            "healthy": True,
+            "status": "connected",
+            "details": {"memory_usage": "1.2MB", "keys": len(cache)}
+        }
+        mock.is_initialized = True
+    
+    return mock, apply_defaults
 
 
 @pytest.fixture
+def mock_redis_service(_redis_service_base):
+    """
+    Mock RedisService with realistic caching behavior.
+    
+    Provides in-memory cache simulation.
+    """
+    mock, apply_defaults = _redis_service_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+# Sample data is built once at import and handed out read-only
+_SAMPLE_ANALYSIS = MappingProxyType({
+    'primary_instinct': 'territorial',
+    'primary_description': 'Der Hund zeigt territoriales Verhalten zum Schutz seines Reviers und seiner Familie',
+    'all_instincts': MappingProxyType({
+        'jagd': 'Der Jagdinstinkt lässt mich Dinge verfolgen und fangen wollen',
+        'rudel': 'Der Rudelinstinkt regelt mein soziales Verhalten in der Gruppe',
+        'territorial': 'Der territoriale Instinkt lässt mich mein Gebiet und meine Ressourcen schützen',
+        'sexual': 'Der Sexualinstinkt steuert mein Fortpflanzungsverhalten'
+    }),
+    'exercise': 'Übe mit deinem Hund die "Freund-Feind-Unterscheidung": Stelle deinen Hund Besuchern vor und belohne ruhiges Verhalten.',
+    'confidence': 0.85,
+    'match_quality': 'high'
+})
+
+_SAMPLE_CONTEXTS = MappingProxyType({
+    'simple': AgentContext(
+        session_id=MOCK_SESSION_ID,
+        user_input=MOCK_USER_INPUT,
+        message_type=MessageType.RESPONSE
+    ),
+    'with_metadata': AgentContext(
+        session_id=MOCK_SESSION_ID,
+        user_input=MOCK_USER_INPUT,
+        message_type=MessageType.RESPONSE,
+        metadata={'response_mode': 'perspective_only'}
+    ),
+    'greeting': AgentContext(
+        session_id=MOCK_SESSION_ID,
+        message_type=MessageType.GREETING
+    ),
+    'error': AgentContext(
+        session_id=MOCK_SESSION_ID,
+        message_type=MessageType.ERROR,
+        metadata={'error_type': 'technical'}
+    )
+})
+
+
+def copy_context(name: str, **changes: Any) -> AgentContext:
+    """Return a private copy of a sample context, for tests that modify it"""
+    context = _SAMPLE_CONTEXTS[name]
+    changes.setdefault('metadata', dict(context.metadata))
+    return replace(context, **changes)
+
+
+# Template for make_context; replace() gives each test its own instance
+_BASE_CONTEXT = AgentContext(session_id="test-session", message_type=MessageType.QUESTION)
+
+
+@pytest.fixture(scope="session")
+def make_context():
+    """
+    Factory for contexts on the "test-session" session.
+    
+    Keyword arguments override the template's fields; metadata defaults to
+    a fresh dict so tests never share one.
+    """
+    def factory(**changes: Any) -> AgentContext:
+        changes.setdefault('metadata', {})
+        return replace(_BASE_CONTEXT, **changes)
+    
+    return factory
+
+
+@pytest.fixture(scope="session")
 def sample_analysis_data():
-    """Realistic analysis data for testing"""
-    return {
-        'primary_instinct': 'territorial',
-        'primary_description': 'Der Hund zeigt territoriales Verhalten zum Schutz seines Reviers und seiner Familie',
-        'all_instincts': {
-            'jagd': 'Der Jagdinstinkt lässt mich Dinge verfolgen und fangen wollen',
-            'rudel': 'Der Rudelinstinkt regelt mein soziales Verhalten in der Gruppe',
-            'territorial': 'Der territoriale Instinkt lässt mich mein Gebiet und meine Ressourcen schützen',
-            'sexual': 'Der Sexualinstinkt steuert mein Fortpflanzungsverhalten'
-        },
-        'exercise': 'Übe mit deinem Hund die "Freund-Feind-Unterscheidung": Stelle deinen Hund Besuchern vor und belohne ruhiges Verhalten.',
-        'confidence': 0.85,
-        'match_quality': 'high'
-    }
+    """Realistic analysis data for testing (read-only)"""
+    return _SAMPLE_ANALYSIS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_contexts():
-    """Common test contexts for all agents"""
-    return {
-        'simple': AgentContext(
-            session_id=MOCK_SESSION_ID,
-            user_input=MOCK_USER_INPUT,
-            message_type=MessageType.RESPONSE
-        ),
-        'with_metadata': AgentContext(
-            session_id=MOCK_SESSION_ID,
-            user_input=MOCK_USER_INPUT,
-            message_type=MessageType.RESPONSE,
-            metadata={'response_mode': 'perspective_only'}
-        ),
-        'greeting': AgentContext(
-            session_id=MOCK_SESSION_ID,
-            message_type=MessageType.GREETING
-        ),
-        'error': AgentContext(
-            session_id=MOCK_SESSION_ID,
-            message_type=MessageType.ERROR,
-            metadata={'error_type': 'technical'}
-        )
-    }
+    """Common test contexts for all agents (shared; see copy_context)"""
+    return _SAMPLE_CONTEXTS
 
 
 @dataclass
 class AgentTestHelper:
     """Helper class for common agent test operations"""
     
+    # Fetches all message fields in one call
+    _GET_MSG_ATTRS = operator.attrgetter('sender', 'text', 'message_type', 'metadata')
+    
     @staticmethod
     def assert_message_valid(message: V2AgentMessage, expected_sender: str = None):
         """Assert that a message has valid structure"""
         assert isinstance(message, V2AgentMessage)
-        assert hasattr(message, 'sender')
-        assert hasattr(message, 'text')
-        assert hasattr(message, 'message_type')
-        assert hasattr(message, 'metadata')
+        try:
+            sender, text, _, metadata = AgentTestHelper._GET_MSG_ATTRS(message)
+        except AttributeError as e:
+            raise AssertionError(f"Message is missing a field: {e}") from e
         
-        assert isinstance(message.text, str)
-        assert len(message.text) > 0
-        assert isinstance(message.metadata, dict)
+        assert isinstance(text, str)
+        assert len(text) > 0
+        assert isinstance(metadata, dict)
         
         if expected_sender:
-            assert message.sender == expected_sender
+            assert sender == expected_sender
     
     @staticmethod
-    def assert_messages_valid(messages: List[V2AgentMessage], expected_sender: str = None, min_count: int = 1):
-        """Assert that a list of messages is valid"""
+    def assert_messages_valid(
+        messages: List[V2AgentMessage],
+        expected_sender: str = None,
+        min_count: int = 1,
+        skip_type_check: bool = False
+    ):
+        """
+        Assert that a list of messages is valid.
+        
+        Same checks as assert_message_valid, in a single loop; pass
+        skip_type_check=True when the caller guarantees V2AgentMessage items.
+        """
         assert isinstance(messages, list)
         assert len(messages) >= min_count
         
-        for message in messages:
-            AgentTestHelper.assert_message_valid(message, expected_sender)
+        if expected_sender:
+            expected_sender = sys.intern(expected_sender)
+        get_attrs = AgentTestHelper._GET_MSG_ATTRS
+        for index, message in enumerate(messages):
+            if not skip_type_check and not isinstance(message, V2AgentMessage):
+                raise AssertionError(f"Message {index} is not a V2AgentMessage: {message!r}")
+            try:
+                sender, text, _, metadata = get_attrs(message)
+            except AttributeError as e:
+                raise AssertionError(f"Message {index} is missing a field: {e}") from e
+            if not (isinstance(text, str) and text and isinstance(metadata, dict)):
+                raise AssertionError(f"Message {index} has invalid text or metadata: {message!r}")
+            if expected_sender and sender != expected_sender:
+                raise AssertionError(
+                    f"Message {index} sender {sender!r} != expected {expected_sender!r}"
+                )
     
     @staticmethod
     def create_mock_messages(count: int, sender: str = "test") -> List[V2AgentMessage]:
         """Create mock messages for testing"""
+        sender = sys.intern(sender)
         return [
             V2AgentMessage(
                 sender=sender,
                 text=f"Test message {i}",
-                message_type=MessageType.RESPONSE.value,
+                message_type=_RESPONSE_TYPE,
                 metadata={"index": i}
             )
             for i in range(count)
         ]
     
+    @staticmethod
+    def create_mock_messages_bulk(count: int, sender: str = "test") -> List[V2AgentMessage]:
+        """
+        Create mock messages that all share one metadata dict.
+        
+        For tests that only read messages; mutating one message's metadata
+        changes it for all of them.
+        """
+        sender = sys.intern(sender)
+        metadata = {"bulk": True}
+        return [
+            V2AgentMessage(
+                sender=sender,
+                text=f"Test message {i}",
+                message_type=_RESPONSE_TYPE,
+                metadata=metadata
+            )
+            for i in range(count)
+        ]
+    
     @staticmethod
     async def assert_agent_responds(agent, context: AgentContext, expected_count: int = None):
         """Assert that agent responds properly to context"""
@@ -335,20 +550,61 @@ def pytest_configure(config):
     )
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_pycollect_makeitem(collector, name, obj):
+    """Run the async agent tests on the session event loop"""
+    if (
+        inspect.iscoroutinefunction(obj)
+        and collector.funcnamefilter(name)
+        and not any(mark.name == "asyncio" for mark in getattr(obj, "pytestmark", ()))
+    ):
+        pytest.mark.asyncio(scope="session")(obj)
+
+
+# Constant fixtures are session-scoped, so pytest evaluates them once
+@pytest.fixture(scope="session")
+def mock_session_id():
+    """Session ID used by the sample contexts"""
+    return MOCK_SESSION_ID
+
+
 # Async test utilities
-@pytest.fixture
+@pytest.fixture(scope="session")
 def async_timeout():
     """Timeout for async operations"""
     return 5.0  # 5 seconds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Loop policy for the session loop the agent tests share.
+    
+    pytest_pycollect_makeitem marks the async tests with
+    pytest.mark.asyncio(scope="session"), so pytest-asyncio creates one
+    loop from this policy instead of one per test. Uses uvloop when it is
+    installed (it comes with uvicorn[standard] on Linux/macOS) for cheaper
+    scheduling of the many short awaits.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture
 async def cleanup_tasks():
     """Cleanup any pending async tasks after tests"""
     yield
     # Cleanup code if needed
     import asyncio
-    tasks = [t for t in asyncio.all_tasks() if not t.done()]
+    current = asyncio.current_task()
+    tasks = [t for t in asyncio.all_tasks() if not t.done() and t is not current]
+    if not tasks:
+        return
     for task in tasks:
         task.cancel()
-    await asyncio.gather(*tasks, return_exceptions=True)
\ No newline at end of file
+    # Bounded wait, so a task that ignores cancellation cannot stall teardown
+    await asyncio.wait(tasks, timeout=0.1)
\ No newline at end of file
@@ -11,31 +11,45 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
 
 from src.agents.dog_agent import DogAgent
-from src.agents.base_agent import AgentContext, MessageType, V2AgentMessage
-from src.core.prompt_manager import PromptManager, PromptType
+from src.agents.base_agent import MessageType, V2AgentMessage
+from src.core.prompt_manager import PromptType
 from src.core.exceptions import V2AgentError, V2ValidationError
+from tests.agents._stubs import StubGPTService
+
+# Lets CI run only the tests of the agent that changed
+pytestmark = pytest.mark.agent(name="dog")
+
+
+# Technical error prompt, shared by the error handling tests
+DOG_ERROR_PROMPT = "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?"
+
+# Greeting prompts returned by the mock prompt manager
+_GREETING_PROMPTS = {
+    PromptType.DOG_GREETING: "Hallo! Ich bin dein Hund!",
+    PromptType.DOG_GREETING_FOLLOWUP: "Was möchtest du wissen?",
+}
+
+
+def _get_greeting_prompt(prompt_type, **kwargs):
+    return _GREETING_PROMPTS.get(prompt_type, "Mock prompt")
 
 
 class TestDogAgentBasics:
     """Test basic DogAgent functionality"""
     
-    def test_agent_initialization(self):
+    def test_agent_initialization(self, dog_agent):
         """Test agent initializes with correct properties"""
-        agent = DogAgent()
-        
-        assert agent.name == "Hund"
-        assert agent.role == "dog"
-        assert agent._default_temperature == 0.8
-        assert MessageType.GREETING in agent.get_supported_message_types()
+        assert dog_agent.name == "Hund"
+        assert dog_agent.role == "dog"
+        assert dog_agent._default_temperature == 0.8
+        assert MessageType.GREETING in dog_agent.get_supported_message_types()
     
-    def test_supported_message_types(self):
+    def test_supported_message_types(self, dog_agent):
         """Test agent reports correct supported message types"""
-        agent = DogAgent()
-        supported = agent.get_supported_message_types()
+        supported = dog_agent.get_supported_message_types()
         
         expected_types = [
             MessageType.GREETING,
@@ -45,32 +59,24 @@ class TestDogAgentBasics:
             MessageType.INSTRUCTION
         ]
         
-        for msg_type in expected_types:
-            assert msg_type in supported
+        assert set(expected_types) <= set(supported), (
+            f"Missing message types: {set(expected_types) - set(supported)}"
+        )
 
 
 class TestGreetingMessages:
     """Test greeting message generation"""
     
-    @pytest.mark.asyncio
-    async def test_greeting_format(self, mock_prompt_manager):
+    async def test_greeting_format(self, mock_prompt_manager_plain, make_context):
         """Test greeting returns two messages with correct format"""
         # Setup
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
-        context = AgentContext(
-            session_id="test-session",
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
+        context = make_context(
             message_type=MessageType.GREETING
         )
         
         # Configure mock to return greeting prompts
-        def mock_get_prompt(prompt_type, **kwargs):
-            if prompt_type == PromptType.DOG_GREETING:
-                return "Hallo! Ich bin dein Hund!"
-            elif prompt_type == PromptType.DOG_GREETING_FOLLOWUP:
-                return "Was möchtest du wissen?"
-            return "Mock prompt"
-        
-        mock_prompt_manager.get_prompt.side_effect = mock_get_prompt
+        mock_prompt_manager_plain.get_prompt.side_effect = _get_greeting_prompt
         
         # Execute
         messages = await agent.respond(context)
@@ -85,35 +91,31 @@ class TestGreetingMessages:
         assert "Was möchtest du wissen?" in messages[1].text
         assert messages[1].message_type == MessageType.QUESTION.value
     
-    @pytest.mark.asyncio
-    async def test_greeting_uses_correct_prompts(self, mock_prompt_manager):
+    async def test_greeting_uses_correct_prompts(self, mock_prompt_manager_plain, make_context):
         """Test greeting uses the correct prompt types"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
-        context = AgentContext(
-            session_id="test-session",
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
+        context = make_context(
             message_type=MessageType.GREETING
         )
         
         await agent.respond(context)
         
         # Verify prompts were called (at least once each)
-        assert mock_prompt_manager.get_prompt.call_count >= 2
+        assert mock_prompt_manager_plain.get_prompt.call_count >= 2
 
 
 class TestResponseMessages:
     """Test response message generation with different modes"""
     
-    @pytest.mark.asyncio
-    async def test_perspective_only_response(self, mock_gpt_service, mock_prompt_manager):
+    async def test_perspective_only_response(self, mock_gpt_service, mock_prompt_manager_plain, make_context):
         """Test dog perspective response generation"""
         # Setup
         agent = DogAgent(
-            prompt_manager=mock_prompt_manager,
+            prompt_manager=mock_prompt_manager_plain,
             gpt_service=mock_gpt_service
         )
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             user_input="Mein Hund bellt",
             message_type=MessageType.RESPONSE,
             metadata={
@@ -136,16 +138,14 @@ class TestResponseMessages:
         # Verify GPT was called
         mock_gpt_service.complete.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_diagnosis_response(self, mock_gpt_service, mock_prompt_manager):
+    async def test_diagnosis_response(self, mock_gpt_service, mock_prompt_manager_plain, make_context):
         """Test diagnosis response format"""
         agent = DogAgent(
-            prompt_manager=mock_prompt_manager,
+            prompt_manager=mock_prompt_manager_plain,
             gpt_service=mock_gpt_service
         )
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.RESPONSE,
             metadata={
                 'response_mode': 'diagnosis',
@@ -163,13 +163,11 @@ class TestResponseMessages:
         assert len(messages) == 1
         assert "Territorialinstinkt" in messages[0].text
     
-    @pytest.mark.asyncio
-    async def test_exercise_response(self, mock_prompt_manager):
+    async def test_exercise_response(self, mock_prompt_manager_plain, make_context):
         """Test exercise recommendation response"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.RESPONSE,
             metadata={
                 'response_mode': 'exercise',
@@ -182,16 +180,14 @@ class TestResponseMessages:
         assert len(messages) == 1
         assert messages[0].text == "Übe täglich 10 Minuten Impulskontrolle"
     
-    @pytest.mark.asyncio
-    async def test_exercise_fallback(self, mock_prompt_manager):
+    async def test_exercise_fallback(self, mock_prompt_manager_plain, make_context):
         """Test exercise fallback when no data provided"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
         
         # Mock fallback prompt
-        mock_prompt_manager.get_prompt.return_value = "Standard-Übung: Grundgehorsam"
+        mock_prompt_manager_plain.get_prompt.return_value = "Standard-Übung: Grundgehorsam"
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.RESPONSE,
             metadata={
                 'response_mode': 'exercise',
@@ -205,71 +201,62 @@ class TestResponseMessages:
         assert messages[0].text == "Standard-Übung: Grundgehorsam"
         
         # Verify fallback prompt was requested
-        mock_prompt_manager.get_prompt.assert_called_with(PromptType.DOG_FALLBACK_EXERCISE)
+        assert mock_prompt_manager_plain.get_prompt.call_args.args == (PromptType.DOG_FALLBACK_EXERCISE,)
 
 
 class TestQuestionMessages:
     """Test question message generation"""
     
-    @pytest.mark.asyncio
-    async def test_question_types(self, mock_prompt_manager):
+    @pytest.mark.parametrize("q_type,expected_text", [
+        ('confirmation', "Möchtest du mehr erfahren?"),
+        ('context', "Erzähl mir mehr über die Situation"),
+        ('exercise', "Möchtest du eine Übung?"),
+        ('restart', "Noch ein anderes Verhalten?"),
+    ], ids=['confirmation', 'context', 'exercise', 'restart'])
+    async def test_question_types(self, mock_prompt_manager_plain, q_type, expected_text, make_context):
         """Test different question types"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
-        
-        question_types = {
-            'confirmation': "Möchtest du mehr erfahren?",
-            'context': "Erzähl mir mehr über die Situation",
-            'exercise': "Möchtest du eine Übung?",
-            'restart': "Noch ein anderes Verhalten?"
-        }
-        
-        for q_type, expected_text in question_types.items():
-            mock_prompt_manager.get_prompt.return_value = expected_text
-            
-            context = AgentContext(
-                session_id="test-session",
-                message_type=MessageType.QUESTION,
-                metadata={'question_type': q_type}
-            )
-            
-            messages = await agent.respond(context)
-            
-            assert len(messages) == 1
-            assert messages[0].text == expected_text
-            assert messages[0].message_type == MessageType.QUESTION.value
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
+        
+        mock_prompt_manager_plain.get_prompt.return_value = expected_text
+        
+        context = make_context(
+            message_type=MessageType.QUESTION,
+            metadata={'question_type': q_type}
+        )
+        
+        messages = await agent.respond(context)
+        
+        assert len(messages) == 1
+        assert messages[0].text == expected_text
+        assert messages[0].message_type == MessageType.QUESTION.value
 
 
 class TestErrorHandling:
     """Test error message handling"""
     
-    @pytest.mark.asyncio
-    async def test_error_types(self, mock_prompt_manager):
+    @pytest.mark.parametrize("error_type", ['no_match', 'invalid_input', 'technical', 'general'], ids=str)
+    async def test_error_types(self, mock_prompt_manager_plain, error_type, make_context):
         """Test different error types"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
         
         # Configure mock to return the dog technical error message
-        mock_prompt_manager.get_prompt.return_value = "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?"
-        
-        error_types = ['no_match', 'invalid_input', 'technical', 'general']
-        
-        for error_type in error_types:
-            context = AgentContext(
-                session_id="test-session",
-                message_type=MessageType.ERROR,
-                metadata={'error_type': error_type}
-            )
-            
-            messages = await agent.respond(context)
-            
-            assert len(messages) == 1
-            assert messages[0].message_type == MessageType.ERROR.value
-            # The actual text depends on the prompt manager configuration
+        mock_prompt_manager_plain.get_prompt.return_value = DOG_ERROR_PROMPT
+        
+        context = make_context(
+            message_type=MessageType.ERROR,
+            metadata={'error_type': error_type}
+        )
+        
+        messages = await agent.respond(context)
+        
+        assert len(messages) == 1
+        assert messages[0].message_type == MessageType.ERROR.value
+        # The actual text depends on the prompt manager configuration
     
-    @pytest.mark.asyncio
-    async def test_exception_handling(self, mock_gpt_service, mock_prompt_manager):
+    async def test_exception_handling(self, mock_gpt_service, mock_prompt_manager_plain, make_context):
         """Test agent handles exceptions gracefully"""
         agent = DogAgent(
-            prompt_manager=mock_prompt_manager,
+            prompt_manager=mock_prompt_manager_plain,
             gpt_service=mock_gpt_service
         )
         
@@ -277,10 +264,9 @@ class TestErrorHandling:
         mock_gpt_service.complete.side_effect = Exception("GPT failed")
         
         # Configure fallback error message
-        mock_prompt_manager.get_prompt.return_value = "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?"
+        mock_prompt_manager_plain.get_prompt.return_value = DOG_ERROR_PROMPT
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.RESPONSE,
             metadata={'response_mode': 'perspective_only', 'match_data': 'test'}
         )
@@ -295,22 +281,17 @@ class TestErrorHandling:
 class TestContextValidation:
     """Test context validation"""
     
-    @pytest.mark.asyncio
-    async def test_invalid_context_type(self):
+    async def test_invalid_context_type(self, dog_agent):
         """Test agent handles invalid context type"""
-        agent = DogAgent()
-        
         # Pass invalid context - this should be caught by validate_context
         with pytest.raises(V2ValidationError):
-            agent.validate_context("not a context object")
+            dog_agent.validate_context("not a context object")
     
-    @pytest.mark.asyncio
-    async def test_missing_response_mode(self, mock_prompt_manager):
+    async def test_missing_response_mode(self, mock_prompt_manager_plain, make_context):
         """Test validation for response mode"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.RESPONSE
             # Missing response_mode in metadata
         )
@@ -322,16 +303,14 @@ class TestContextValidation:
         assert messages[0].message_type == MessageType.ERROR.value
         assert "verstehe" in messages[0].text  # Should contain friendly error
     
-    @pytest.mark.asyncio
-    async def test_unsupported_message_type(self, mock_prompt_manager):
+    async def test_unsupported_message_type(self, mock_prompt_manager_plain, make_context):
         """Test handling of unsupported message type"""
-        agent = DogAgent(prompt_manager=mock_prompt_manager)
+        agent = DogAgent(prompt_manager=mock_prompt_manager_plain)
         
         # Configure error message
-        mock_prompt_manager.get_prompt.return_value = "Wuff! Entschuldige, ich bin gerade etwas verwirrt. Kannst du es nochmal versuchen?"
+        mock_prompt_manager_plain.get_prompt.return_value = DOG_ERROR_PROMPT
         
-        context = AgentContext(
-            session_id="test-session",
+        context = make_context(
             message_type=MessageType.CONFIRMATION  # Not supported by DogAgent
         )
         
@@ -344,17 +323,16 @@ class TestContextValidation:
 class TestHealthCheck:
     """Test agent health check functionality"""
     
-    @pytest.mark.asyncio
-    async def test_health_check_all_services_healthy(self, mock_gpt_service, mock_prompt_manager):
+    async def test_health_check_all_services_healthy(self, mock_gpt_service, mock_prompt_manager_plain):
         """Test health check when all services are healthy"""
         agent = DogAgent(
-            prompt_manager=mock_prompt_manager,
+            prompt_manager=mock_prompt_manager_plain,
             gpt_service=mock_gpt_service
         )
         
         # Mock healthy services
         mock_gpt_service.health_check.return_value = {"healthy": True}
-        mock_prompt_manager.get_prompt.return_value = "test prompt"
+        mock_prompt_manager_plain.get_prompt.return_value = "test prompt"
         
         health = await agent.health_check()
         
@@ -362,17 +340,16 @@ class TestHealthCheck:
         assert health["role"] == "dog"
         assert "services" in health
     
-    @pytest.mark.asyncio
-    async def test_health_check_service_unhealthy(self, mock_gpt_service, mock_prompt_manager):
+    async def test_health_check_service_unhealthy(self, mock_gpt_service, mock_prompt_manager_plain):
         """Test health check when a service is unhealthy"""
         agent = DogAgent(
-            prompt_manager=mock_prompt_manager,
+            prompt_manager=mock_prompt_manager_plain,
             gpt_service=mock_gpt_service
         )
         
         # Mock unhealthy GPT service
         mock_gpt_service.health_check.side_effect = Exception("Service down")
-        mock_prompt_manager.get_prompt.return_value = "test prompt"
+        mock_prompt_manager_plain.get_prompt.return_value = "test prompt"
         
         health = await agent.health_check()
         
@@ -381,29 +358,13 @@ class TestHealthCheck:
 
 
 # Fixtures
-@pytest.fixture
-def mock_prompt_manager():
-    """Mock PromptManager for testing"""
-    mock = Mock(spec=PromptManager)
-    mock.get_prompt.return_value = "Mock prompt"
-    return mock
+@pytest.fixture(scope="module")
+def dog_agent():
+    """DogAgent with default services, shared by tests that inject no mocks"""
+    return DogAgent()
 
 
 @pytest.fixture
 def mock_gpt_service():
-    """Mock GPTService for testing"""
-    mock = AsyncMock()
-    mock.complete.return_value = "Mock GPT response"
-    mock.health_check.return_value = {"healthy": True}
-    return mock
-
-
-@pytest.fixture
-def mock_weaviate_service():
-    """Mock WeaviateService for testing"""
-    mock = AsyncMock()
-    mock.vector_search.return_value = [
-        {"text": "Mock result", "score": 0.9}
-    ]
-    mock.health_check.return_value = {"healthy": True}
-    return mock
\ No newline at end of file
+    """Stub GPTService for testing"""
+    return StubGPTService()
\ No newline at end of file
@@ -6,7 +6,9 @@ Provides properly mocked services, sample data, and utilities for testing
 flow handlers, flow engine, and orchestrator.
 """
 
+import string
 import pytest
+from functools import lru_cache
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
 
@@ -16,298 +18,417 @@ from src.agents.base_agent import AgentContext, MessageType, V2AgentMessage
 from src.core.flow_engine import FlowEvent
 
 
-@pytest.fixture
-def mock_gpt_service():
-    """Mock GPTService for testing"""
+# Service and agent mocks are built once per session; the function-scoped
+# fixtures reset them and reapply their defaults for every test, so call
+# counts and return_value/side_effect overrides never leak between tests.
+# Configure them through return_value/side_effect rather than by replacing
+# attributes, which would outlive the test.
+
+def _reset_async_mock(mock):
+    """
+    Reset calls, return values and side effects of a shared AsyncMock.
+    
+    reset_mock(return_value=True) also drops the defaults MagicMock gives
+    its magic methods, so truthiness is restored: FlowHandlers falls back
+    to real dependencies with ``dep or Default()``.
+    """
+    mock.reset_mock(return_value=True, side_effect=True)
+    mock.__bool__.return_value = True
+
+
+# GPT responses by keyword, checked in order; first match wins
+_GPT_RULES = (
+    ("jagd", "Als Hund will ich jagen und verfolgen."),
+    ("territorial", "Als Hund beschütze ich mein Gebiet."),
+    ("rudel", "Als Hund brauche ich mein Rudel."),
+    ("instinkt", "territorial"),  # Primary instinct response
+)
+_DEFAULT_GPT_RESPONSE = "Als Hund fühle ich mich in dieser Situation unsicher."
+
+
+@lru_cache(maxsize=256)
+def _gpt_response(prompt: str) -> str:
+    """GPT response for a lowercased prompt; inputs repeat across tests"""
+    return next(
+        (response for keyword, response in _GPT_RULES if keyword in prompt),
+        _DEFAULT_GPT_RESPONSE
+    )
+
+
+async def _complete_side_effect(prompt, **kwargs):
+    """Default GPT responses for different scenarios"""
+    return _gpt_response(prompt.lower())
+
+
+@pytest.fixture(scope="session")
+def _gpt_service_base():
+    """Session-wide GPTService mock and its default configuration"""
     mock = AsyncMock()
     
-    # Default responses for different scenarios
-    async def complete_side_effect(prompt, **kwargs):
-        if "jagd" in prompt.lower():
-            return "Als Hund will ich jagen und verfolgen."
-        elif "territorial" in prompt.lower():
-            return "Als Hund beschütze ich mein Gebiet."
-        elif "rudel" in prompt.lower():
-            return "Als Hund brauche ich mein Rudel."
-        elif "instinkt" in prompt.lower():
-            return "territorial"  # Primary instinct response
-        else:
-            return "Als Hund fühle ich mich in dieser Situation unsicher."
-    
-    mock.complete.side_effect = complete_side_effect
-    mock.health_check.return_value = {"healthy": True}
+    def apply_defaults():
+        mock.complete.side_effect = _complete_side_effect
+        mock.health_check.return_value = {"healthy": True}
     
-    return mock
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_weaviate_service():
-    """Mock WeaviateService for testing"""
-    mock = AsyncMock()
+def mock_gpt_service(_gpt_service_base):
+    """Mock GPTService for testing"""
+    mock, apply_defaults = _gpt_service_base
+    _reset_async_mock(mock)
+    apply_defaults()
+    return mock
+
+
+def _fresh_results(results):
+    """
+    Copy of stored search results, as WeaviateService.search returns them.
     
-    # Default search results
-    async def search_side_effect(collection=None, query=None, limit=3, properties=None, return_metadata=True, **kwargs):
-        # Map collection to collection_name for compatibility
-        collection_name = collection
-        if collection_name == "Symptome":
-            if "bellt" in query.lower():
-                return [
-                    {
-                        "id": "uuid-1",
-                        "properties": {
-                            "text": "Hund bellt territorial zur Verteidigung",
-                            "schnelldiagnose": "Der Hund zeigt territoriales Verhalten zum Schutz seines Reviers",
-                            "instinct": "territorial"
-                        },
-                        "metadata": {"distance": 0.1, "certainty": 0.9}
-                    },
-                    {
-                        "id": "uuid-2",
-                        "properties": {
-                            "text": "Bellverhalten bei Hunden",
-                            "schnelldiagnose": "Bellen ist ein normales Kommunikationsmittel",
-                            "behavior": "barking"
-                        },
-                        "metadata": {"distance": 0.2, "certainty": 0.8}
-                    }
-                ]
-            elif "springt" in query.lower():
-                return [
-                    {
-                        "id": "uuid-3",
-                        "properties": {
-                            "text": "Hund springt aus Rudelinstinkt",
-                            "schnelldiagnose": "Das Springen zeigt Aufregung und Begrüßungsverhalten im Rudel",
-                            "instinct": "rudel"
-                        },
-                        "metadata": {"distance": 0.15, "certainty": 0.85}
-                    }
-                ]
-            else:
-                return []  # No matches
-        
-        elif collection_name == "Instinkte":
-            return [
-                {
-                    "id": "inst-1",
-                    "properties": {
-                        "text": "Territorial: Schutz des eigenen Gebiets",
-                        "type": "territorial"
-                    },
-                    "metadata": {"distance": 0.1, "certainty": 0.9}
-                },
-                {
-                    "id": "inst-2",
-                    "properties": {
-                        "text": "Jagd: Verfolgung und Fangen von Beute",
-                        "type": "jagd"
-                    },
-                    "metadata": {"distance": 0.2, "certainty": 0.8}
-                },
-                {
-                    "id": "inst-3",
-                    "properties": {
-                        "text": "Rudel: Soziales Gruppenverhalten",
-                        "type": "rudel"
-                    },
-                    "metadata": {"distance": 0.3, "certainty": 0.7}
-                }
-            ]
-        
-        elif collection_name == "Erziehung":
-            return [
-                {
-                    "id": "exercise-1",
-                    "properties": {
-                        "text": "Übe täglich 10 Minuten Impulskontrolle mit klaren Kommandos",
-                        "anleitung": "Übe täglich 10 Minuten Impulskontrolle mit klaren Kommandos",
-                        "exercise_type": "impulse_control"
-                    },
-                    "metadata": {"distance": 0.1, "certainty": 0.9}
-                }
-            ]
-        
-        return []
+    Each call gets its own list of dicts, so callers may mutate or extend
+    the results without affecting other tests.
+    """
+    return [
+        {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in result.items()
+        }
+        for result in results
+    ]
+
+
+# Symptom search results by keyword in the query, checked in order
+_SYMPTOM_RESULTS = (
+    ("bellt", [
+        {
+            "id": "uuid-1",
+            "properties": {
+                "text": "Hund bellt territorial zur Verteidigung",
+                "schnelldiagnose": "Der Hund zeigt territoriales Verhalten zum Schutz seines Reviers",
+                "instinct": "territorial"
+            },
+            "metadata": {"distance": 0.1, "certainty": 0.9}
+        },
+        {
+            "id": "uuid-2",
+            "properties": {
+                "text": "Bellverhalten bei Hunden",
+                "schnelldiagnose": "Bellen ist ein normales Kommunikationsmittel",
+                "behavior": "barking"
+            },
+            "metadata": {"distance": 0.2, "certainty": 0.8}
+        }
+    ]),
+    ("springt", [
+        {
+            "id": "uuid-3",
+            "properties": {
+                "text": "Hund springt aus Rudelinstinkt",
+                "schnelldiagnose": "Das Springen zeigt Aufregung und Begrüßungsverhalten im Rudel",
+                "instinct": "rudel"
+            },
+            "metadata": {"distance": 0.15, "certainty": 0.85}
+        }
+    ]),
+)
+
+# Search results for the other collections, whatever the query
+_COLLECTION_RESULTS = {
+    "Instinkte": [
+        {
+            "id": "inst-1",
+            "properties": {
+                "text": "Territorial: Schutz des eigenen Gebiets",
+                "type": "territorial"
+            },
+            "metadata": {"distance": 0.1, "certainty": 0.9}
+        },
+        {
+            "id": "inst-2",
+            "properties": {
+                "text": "Jagd: Verfolgung und Fangen von Beute",
+                "type": "jagd"
+            },
+            "metadata": {"distance": 0.2, "certainty": 0.8}
+        },
+        {
+            "id": "inst-3",
+            "properties": {
+                "text": "Rudel: Soziales Gruppenverhalten",
+                "type": "rudel"
+            },
+            "metadata": {"distance": 0.3, "certainty": 0.7}
+        }
+    ],
+    "Erziehung": [
+        {
+            "id": "exercise-1",
+            "properties": {
+                "text": "Übe täglich 10 Minuten Impulskontrolle mit klaren Kommandos",
+                "anleitung": "Übe täglich 10 Minuten Impulskontrolle mit klaren Kommandos",
+                "exercise_type": "impulse_control"
+            },
+            "metadata": {"distance": 0.1, "certainty": 0.9}
+        }
+    ],
+}
+
+
+@lru_cache(maxsize=256)
+def _symptom_results(query: str):
+    """Stored symptom search results for a lowercased query"""
+    return next(
+        (results for keyword, results in _SYMPTOM_RESULTS if keyword in query),
+        ()  # No matches
+    )
+
+
+async def _search_side_effect(collection=None, query=None, limit=3, properties=None, return_metadata=True, **kwargs):
+    """Default search results per collection"""
+    if collection == "Symptome":
+        return _fresh_results(_symptom_results(query.lower()))
+    return _fresh_results(_COLLECTION_RESULTS.get(collection, ()))
+
+
+@pytest.fixture(scope="session")
+def _weaviate_service_base():
+    """Session-wide WeaviateService mock and its default configuration"""
+    mock = AsyncMock()
     
-    # The flow handlers use 'search' not 'vector_search'
-    mock.search.side_effect = search_side_effect
-    # Also keep vector_search for compatibility  
-    mock.vector_search.side_effect = search_side_effect
-    mock.health_check.return_value = {"healthy": True}
+    def apply_defaults():
+        # The flow handlers use 'search' not 'vector_search'
+        mock.search.side_effect = _search_side_effect
+        # Also keep vector_search for compatibility
+        mock.vector_search.side_effect = _search_side_effect
+        mock.health_check.return_value = {"healthy": True}
     
-    return mock
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_redis_service():
-    """Mock RedisService for testing with flexible argument handling"""
+def mock_weaviate_service(_weaviate_service_base):
+    """Mock WeaviateService for testing"""
+    mock, apply_defaults = _weaviate_service_base
+    _reset_async_mock(mock)
+    apply_defaults()
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _redis_service_base():
+    """Session-wide RedisService mock and its default configuration"""
     mock = Mock()  # Use regular Mock, not AsyncMock for Redis
     
-    # Storage for testing
+    # Storage for testing, emptied for every test
     redis_storage = {}
     
-    def set_side_effect(*args, **kwargs):
-        """Handle set calls with maximum flexibility"""
-        try:
-            # Initialize variables
-            key = None
-            value = None
-            expire = None
-            
-            # Try to extract from positional arguments
-            if args:
-                if len(args) >= 1:
-                    key = args[0]
-                if len(args) >= 2:
-                    value = args[1]
-                if len(args) >= 3:
-                    expire = args[2]
-            
-            # Override with keyword arguments if present
-            key = kwargs.get('key', key)
-            value = kwargs.get('value', value)
-            expire = kwargs.get('expire', expire)
-            
-            # Store if we have at least key and value
-            if key is not None and value is not None:
-                redis_storage[key] = {"value": value, "expire": expire}
-                return True
-            
-            # Default success even if no valid args
-            return True
-            
-        except Exception as e:
-            print(f"Redis mock set error (ignored): {e}")
-            return True
+    def set_side_effect(key=None, value=None, expire=None, *args, **kwargs):
+        """Store value under key; expire is accepted but not simulated"""
+        if key is not None and value is not None:
+            redis_storage[key] = value
+        return True
     
     def get_side_effect(key, **kwargs):
         """Handle get calls"""
-        try:
-            stored = redis_storage.get(key, {})
-            return stored.get("value")
-        except Exception:
-            return None
+        return redis_storage.get(key)
     
-    mock.set = Mock(side_effect=set_side_effect)
-    mock.get = Mock(side_effect=get_side_effect)
-    mock.health_check = Mock(return_value={"healthy": True})
+    def apply_defaults():
+        redis_storage.clear()
+        mock.set.side_effect = set_side_effect
+        mock.get.side_effect = get_side_effect
+        mock.health_check.return_value = {"healthy": True}
     
-    return mock
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_prompt_manager():
-    """Mock PromptManager for testing"""
-    mock = Mock()
+def mock_redis_service(_redis_service_base):
+    """Mock RedisService for testing"""
+    mock, apply_defaults = _redis_service_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+# Default prompts for different types
+_PROMPT_RESPONSES = {
+    # Dog prompts
+    "dog.greeting": "Wuff! Hallo!",
+    "dog.greeting.followup": "Was ist los?",
+    "dog.confirmation.question": "Magst Du mehr erfahren?",
+    "dog.context.question": "Erzähl mir mehr über die Situation.",
+    "dog.exercise.question": "Möchtest du eine Übung?",
+    "dog.restart.question": "Möchtest du ein weiteres Verhalten besprechen?",
+    "dog.no.match.error": "Dazu habe ich keine Informationen.",
+    "dog.technical.error": "Es tut mir leid, ich habe ein Problem.",
+    "dog.describe.more": "Kannst du mehr erzählen?",
+    "dog.fallback.exercise": "Übe Impulskontrolle mit deinem Hund.",
+    
+    # Companion prompts
+    "companion.feedback.intro": "Ich würde mich über Feedback freuen.",
+    "companion.feedback.q1": "Hat dir die Beratung geholfen?",
+    "companion.feedback.q2": "Wie fandest du die Hundeperspektive?",
+    "companion.feedback.q3": "Was denkst du über die Übung?",
+    "companion.feedback.q4": "Würdest du uns weiterempfehlen?",
+    "companion.feedback.q5": "Optional: Deine E-Mail für Rückfragen.",
+    "companion.feedback.complete": "Danke für dein Feedback! 🐾",
+    
+    # Generation prompts
+    "generation.dog_perspective": "Hundeperspektive: {symptom} mit {match}",
+    "query.combined_instinct": "Analysiere: {symptom} mit Kontext: {context}",
+}
+
+
+# Templates without fields are returned as is, skipping str.format
+_STATIC_PROMPTS = frozenset(
+    key for key, template in _PROMPT_RESPONSES.items()
+    if not any(field for _, field, _, _ in string.Formatter().parse(template))
+)
+
+# Normalised prompt keys, filled on first use. Keyed by (type, value):
+# PromptType is a str enum, so a member and its plain string value compare
+# equal but normalise differently.
+_KEY_CACHE: Dict[Any, str] = {}
+
+
+def _prompt_key(prompt_type) -> str:
+    """Prompt table key for prompt_type, e.g. PromptType.DOG_GREETING -> 'dog.greeting'"""
+    cache_key = (type(prompt_type), prompt_type)
+    key = _KEY_CACHE.get(cache_key)
+    if key is None:
+        key = _KEY_CACHE.setdefault(
+            cache_key,
+            str(prompt_type).lower().replace('prompttype.', '').replace('_', '.')
+        )
+    return key
+
+
+def _get_prompt_side_effect(prompt_type, **kwargs):
+    """Look up and format the prompt for prompt_type"""
+    key = _prompt_key(prompt_type)
+    template = _PROMPT_RESPONSES.get(key)
+    if template is None:
+        return f"Mock prompt for {prompt_type}"
+    if key in _STATIC_PROMPTS:
+        return template
     
-    # Default prompts for different types
-    prompt_responses = {
-        # Dog prompts
-        "dog.greeting": "Wuff! Hallo!",
-        "dog.greeting.followup": "Was ist los?",
-        "dog.confirmation.question": "Magst Du mehr erfahren?",
-        "dog.context.question": "Erzähl mir mehr über die Situation.",
-        "dog.exercise.question": "Möchtest du eine Übung?",
-        "dog.restart.question": "Möchtest du ein weiteres Verhalten besprechen?",
-        "dog.no.match.error": "Dazu habe ich keine Informationen.",
-        "dog.technical.error": "Es tut mir leid, ich habe ein Problem.",
-        "dog.describe.more": "Kannst du mehr erzählen?",
-        "dog.fallback.exercise": "Übe Impulskontrolle mit deinem Hund.",
-        
-        # Companion prompts
-        "companion.feedback.intro": "Ich würde mich über Feedback freuen.",
-        "companion.feedback.q1": "Hat dir die Beratung geholfen?",
-        "companion.feedback.q2": "Wie fandest du die Hundeperspektive?",
-        "companion.feedback.q3": "Was denkst du über die Übung?",
-        "companion.feedback.q4": "Würdest du uns weiterempfehlen?",
-        "companion.feedback.q5": "Optional: Deine E-Mail für Rückfragen.",
-        "companion.feedback.complete": "Danke für dein Feedback! 🐾",
-        
-        # Generation prompts
-        "generation.dog_perspective": "Hundeperspektive: {symptom} mit {match}",
-        "query.combined_instinct": "Analysiere: {symptom} mit Kontext: {context}",
-    }
+    # Simple template formatting
+    try:
+        return template.format(**kwargs)
+    except KeyError:
+        return template
+
+
+@pytest.fixture(scope="session")
+def _prompt_manager_base():
+    """Session-wide PromptManager mock and its default configuration"""
+    mock = Mock()
     
-    def get_prompt_side_effect(prompt_type, **kwargs):
-        key = str(prompt_type).lower().replace('prompttype.', '').replace('_', '.')
-        template = prompt_responses.get(key, f"Mock prompt for {prompt_type}")
-        
-        # Simple template formatting
-        try:
-            return template.format(**kwargs)
-        except KeyError:
-            return template
+    def apply_defaults():
+        mock.get_prompt.side_effect = _get_prompt_side_effect
     
-    mock.get_prompt.side_effect = get_prompt_side_effect
-    return mock
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_dog_agent():
-    """Mock DogAgent for testing - always returns lists"""
+def mock_prompt_manager(_prompt_manager_base):
+    """Mock PromptManager for testing"""
+    mock, apply_defaults = _prompt_manager_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+async def _dog_respond_side_effect(context):
+    """Dog replies per message type"""
+    # Always return a list of messages, never None
+    if context.message_type == MessageType.GREETING:
+        return [
+            V2AgentMessage(sender="dog", text="Wuff! Hallo!", message_type="greeting"),
+            V2AgentMessage(sender="dog", text="Was ist los?", message_type="question")
+        ]
+    elif context.message_type == MessageType.RESPONSE:
+        response_mode = context.metadata.get('response_mode', 'perspective_only')
+        if response_mode == 'perspective_only':
+            return [V2AgentMessage(sender="dog", text="Als Hund fühle ich mich...", message_type="response")]
+        elif response_mode == 'diagnosis':
+            return [V2AgentMessage(sender="dog", text="Ich erkenne territorialen Instinkt.", message_type="response")]
+        elif response_mode == 'exercise':
+            return [V2AgentMessage(sender="dog", text="Übe Impulskontrolle.", message_type="response")]
+        else:
+            return [V2AgentMessage(sender="dog", text="Standard response", message_type="response")]
+    elif context.message_type == MessageType.QUESTION:
+        question_type = context.metadata.get('question_type', 'confirmation')
+        return [V2AgentMessage(sender="dog", text=f"{question_type.title()} Frage?", message_type="question")]
+    elif context.message_type == MessageType.ERROR:
+        return [V2AgentMessage(sender="dog", text="Es tut mir leid.", message_type="error")]
+    elif context.message_type == MessageType.INSTRUCTION:
+        return [V2AgentMessage(sender="dog", text="Bitte mehr Details.", message_type="instruction")]
+    
+    # Default fallback - always return at least one message
+    return [V2AgentMessage(sender="dog", text="Standard Antwort", message_type="response")]
+
+
+@pytest.fixture(scope="session")
+def _dog_agent_base():
+    """Session-wide DogAgent mock and its default configuration"""
     mock = AsyncMock()
     
-    async def respond_side_effect(context):
-        # Always return a list of messages, never None
-        if context.message_type == MessageType.GREETING:
-            return [
-                V2AgentMessage(sender="dog", text="Wuff! Hallo!", message_type="greeting"),
-                V2AgentMessage(sender="dog", text="Was ist los?", message_type="question")
-            ]
-        elif context.message_type == MessageType.RESPONSE:
-            response_mode = context.metadata.get('response_mode', 'perspective_only')
-            if response_mode == 'perspective_only':
-                return [V2AgentMessage(sender="dog", text="Als Hund fühle ich mich...", message_type="response")]
-            elif response_mode == 'diagnosis':
-                return [V2AgentMessage(sender="dog", text="Ich erkenne territorialen Instinkt.", message_type="response")]
-            elif response_mode == 'exercise':
-                return [V2AgentMessage(sender="dog", text="Übe Impulskontrolle.", message_type="response")]
-            else:
-                return [V2AgentMessage(sender="dog", text="Standard response", message_type="response")]
-        elif context.message_type == MessageType.QUESTION:
-            question_type = context.metadata.get('question_type', 'confirmation')
-            return [V2AgentMessage(sender="dog", text=f"{question_type.title()} Frage?", message_type="question")]
-        elif context.message_type == MessageType.ERROR:
-            return [V2AgentMessage(sender="dog", text="Es tut mir leid.", message_type="error")]
-        elif context.message_type == MessageType.INSTRUCTION:
-            return [V2AgentMessage(sender="dog", text="Bitte mehr Details.", message_type="instruction")]
-        
-        # Default fallback - always return at least one message
-        return [V2AgentMessage(sender="dog", text="Standard Antwort", message_type="response")]
-    
-    mock.respond.side_effect = respond_side_effect
-    mock.health_check.return_value = {"healthy": True, "agent": "dog"}
+    def apply_defaults():
+        mock.respond.side_effect = _dog_respond_side_effect
+        mock.health_check.return_value = {"healthy": True, "agent": "dog"}
     
-    return mock
+    return mock, apply_defaults
 
 
 @pytest.fixture
-def mock_companion_agent():
-    """Mock CompanionAgent for testing - always returns lists"""
-    mock = AsyncMock()
+def mock_dog_agent(_dog_agent_base):
+    """Mock DogAgent for testing - always returns lists"""
+    mock, apply_defaults = _dog_agent_base
+    _reset_async_mock(mock)
+    apply_defaults()
+    return mock
+
+
+async def _companion_respond_side_effect(context):
+    """Companion replies per message type"""
+    # Always return a list of messages, never None
+    if context.message_type == MessageType.GREETING:
+        return [V2AgentMessage(sender="companion", text="Feedback bitte!", message_type="greeting")]
+    elif context.message_type == MessageType.QUESTION:
+        question_number = context.metadata.get('question_number', 1)
+        return [V2AgentMessage(sender="companion", text=f"Frage {question_number}?", message_type="question")]
+    elif context.message_type == MessageType.RESPONSE:
+        response_mode = context.metadata.get('response_mode', 'acknowledgment')
+        if response_mode == 'acknowledgment':
+            return [V2AgentMessage(sender="companion", text="Danke.", message_type="response")]
+        elif response_mode == 'completion':
+            return [V2AgentMessage(sender="companion", text="Feedback komplett! 🐾", message_type="response")]
+        else:
+            return [V2AgentMessage(sender="companion", text="OK", message_type="response")]
     
-    async def respond_side_effect(context):
-        # Always return a list of messages, never None
-        if context.message_type == MessageType.GREETING:
-            return [V2AgentMessage(sender="companion", text="Feedback bitte!", message_type="greeting")]
-        elif context.message_type == MessageType.QUESTION:
-            question_number = context.metadata.get('question_number', 1)
-            return [V2AgentMessage(sender="companion", text=f"Frage {question_number}?", message_type="question")]
-        elif context.message_type == MessageType.RESPONSE:
-            response_mode = context.metadata.get('response_mode', 'acknowledgment')
-            if response_mode == 'acknowledgment':
-                return [V2AgentMessage(sender="companion", text="Danke.", message_type="response")]
-            elif response_mode == 'completion':
-                return [V2AgentMessage(sender="companion", text="Feedback komplett! 🐾", message_type="response")]
-            else:
-                return [V2AgentMessage(sender="companion", text="OK", message_type="response")]
-        
-        # Default fallback - always return at least one message
-        return [V2AgentMessage(sender="companion", text="Standard Companion Antwort", message_type="response")]
+    # Default fallback - always return at least one message
+    return [V2AgentMessage(sender="companion", text="Standard Companion Antwort", message_type="response")]
+
+
+@pytest.fixture(scope="session")
+def _companion_agent_base():
+    """Session-wide CompanionAgent mock and its default configuration"""
+    mock = AsyncMock()
     
-    mock.respond.side_effect = respond_side_effect
-    mock.health_check.return_value = {"healthy": True, "agent": "companion"}
+    def apply_defaults():
+        mock.respond.side_effect = _companion_respond_side_effect
+        mock.health_check.return_value = {"healthy": True, "agent": "companion"}
     
+    return mock, apply_defaults
+
+
+@pytest.fixture
+def mock_companion_agent(_companion_agent_base):
+    """Mock CompanionAgent for testing - always returns lists"""
+    mock, apply_defaults = _companion_agent_base
+    _reset_async_mock(mock)
+    apply_defaults()
     return mock
 
 
@@ -463,7 +584,15 @@ def test_utils():
 
 # Fully mocked orchestrator fixture for integration tests
 @pytest.fixture
-def fully_mocked_orchestrator(sample_session_store, mock_services_bundle, mock_agents_bundle):
+def fully_mocked_orchestrator(
+    sample_session_store,
+    mock_gpt_service,
+    mock_weaviate_service,
+    mock_redis_service,
+    mock_prompt_manager,
+    mock_dog_agent,
+    mock_companion_agent
+):
     """Create a fully mocked orchestrator for testing"""
     from src.core.orchestrator import V2Orchestrator
     from src.core.flow_engine import FlowEngine
@@ -471,9 +600,12 @@ def fully_mocked_orchestrator(sample_session_store, mock_services_bundle, mock_a
     
     # Create mocked flow handlers with all services
     mock_handlers = FlowHandlers(
-        dog_agent=mock_agents_bundle['dog_agent'],
-        companion_agent=mock_agents_bundle['companion_agent'],
-        **mock_services_bundle
+        dog_agent=mock_dog_agent,
+        companion_agent=mock_companion_agent,
+        gpt_service=mock_gpt_service,
+        weaviate_service=mock_weaviate_service,
+        redis_service=mock_redis_service,
+        prompt_manager=mock_prompt_manager
     )
     
     # Create flow engine with mocked handlers
@@ -509,25 +641,50 @@ def pytest_configure(config):
 
 
 # Additional helper fixtures
-@pytest.fixture
-def mock_flow_engine():
-    """Mock FlowEngine for isolated testing"""
+@pytest.fixture(scope="session")
+def _flow_engine_base():
+    """Session-wide FlowEngine mock and its default configuration"""
     from src.core.flow_engine import FlowEngine, FlowEvent
     
     mock = AsyncMock(spec=FlowEngine)
-    mock.classify_user_input.return_value = FlowEvent.USER_INPUT
-    mock.process_event.return_value = (
-        FlowStep.WAIT_FOR_SYMPTOM,
-        [V2AgentMessage(sender="dog", text="Test", message_type="response")]
-    )
-    mock.get_valid_transitions.return_value = []
-    mock.get_flow_summary.return_value = {
-        "total_states": 10,
-        "total_transitions": 25,
-        "states": ["greeting", "wait_for_symptom"],
-        "events": ["user_input", "yes_response"],
-        "transitions": []
-    }
-    mock.validate_fsm.return_value = []
     
-    return mock
\ No newline at end of file
+    def apply_defaults():
+        mock.classify_user_input.return_value = FlowEvent.USER_INPUT
+        mock.process_event.return_value = (
+            FlowStep.WAIT_FOR_SYMPTOM,
+            [V2AgentMessage(sender="dog", text="Test", message_type="response")]
+        )
+        mock.get_valid_transitions.return_value = []
+        mock.get_flow_summary.return_value = {
+            "total_states": 10,
+            "total_transitions": 25,
+            "states": ["greeting", "wait_for_symptom"],
+            "events": ["user_input", "yes_response"],
+            "transitions": []
+        }
+        mock.validate_fsm.return_value = []
+    
+    return mock, apply_defaults
+
+
+@pytest.fixture
+def mock_flow_engine(_flow_engine_base):
+    """Mock FlowEngine for isolated testing"""
+    mock, apply_defaults = _flow_engine_base
+    mock.reset_mock(return_value=True, side_effect=True)
+    apply_defaults()
+    return mock
+
+
+@pytest.fixture(scope="module")
+def flow_engine_readonly():
+    """
+    One FlowEngine per test module for tests that only read the FSM.
+    
+    Tests that process events or add transitions build their own engine.
+    """
+    from src.core.flow_engine import FlowEngine
+    
+    with patch('src.core.flow_engine.FlowHandlers'):
+        engine = FlowEngine()
+    return engine
\ No newline at end of file
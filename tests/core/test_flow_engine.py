@@ -11,7 +11,7 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import AsyncMock, patch
 from typing import Dict, Any, List
 
 from src.models.flow_models import FlowStep
@@ -22,6 +22,13 @@ from src.core.exceptions import V2FlowError, V2ValidationError
 from src.core.flow_handlers import FlowHandlers
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_handlers():
+    """Keep FlowHandlers patched for the whole module instead of per test"""
+    with patch('src.core.flow_engine.FlowHandlers'):
+        yield
+
+
 # ===========================================
 # UNIT TESTS - FSM MECHANICS
 # ===========================================
@@ -30,112 +37,98 @@ from src.core.flow_handlers import FlowHandlers
 class TestFlowEngineFSM:
     """Test core FSM functionality"""
     
-    def test_flow_engine_initialization(self, mock_services_bundle):
+    def test_flow_engine_initialization(self):
         """Test engine initializes with proper FSM structure"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = Mock()
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine()
-            
-            # Verify initialization
-            assert engine.handlers is not None
-            assert len(engine.transitions) > 0
-            assert len(engine._transition_map) > 0
-            
-            # Check transition map is properly built
-            assert isinstance(engine._transition_map, dict)
-            
-            # Verify key transitions exist
-            greeting_key = (FlowStep.GREETING, FlowEvent.START_SESSION)
-            assert greeting_key in engine._transition_map
+        engine = FlowEngine()
+        
+        # Verify initialization
+        assert engine.handlers is not None
+        assert len(engine.transitions) > 0
+        assert len(engine._transition_map) > 0
+        
+        # Check transition map is properly built
+        assert isinstance(engine._transition_map, dict)
+        
+        # Verify key transitions exist
+        greeting_key = (FlowStep.GREETING, FlowEvent.START_SESSION)
+        assert greeting_key in engine._transition_map
     
-    def test_transition_setup_completeness(self, mock_services_bundle):
+    def test_transition_setup_completeness(self, flow_engine_readonly):
         """Test all required transitions are defined"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Expected key transitions
-            expected_transitions = [
-                (FlowStep.GREETING, FlowEvent.START_SESSION),
-                (FlowStep.WAIT_FOR_SYMPTOM, FlowEvent.USER_INPUT),
-                (FlowStep.WAIT_FOR_CONFIRMATION, FlowEvent.USER_INPUT),  # Changed: Now uses USER_INPUT
-                (FlowStep.WAIT_FOR_CONTEXT, FlowEvent.USER_INPUT),
-                (FlowStep.ASK_FOR_EXERCISE, FlowEvent.YES_RESPONSE),
-                (FlowStep.ASK_FOR_EXERCISE, FlowEvent.NO_RESPONSE),
-                (FlowStep.FEEDBACK_Q1, FlowEvent.FEEDBACK_ANSWER),
-                (FlowStep.FEEDBACK_Q5, FlowEvent.FEEDBACK_COMPLETE),
-            ]
-            
-            for from_state, event in expected_transitions:
-                key = (from_state, event)
-                assert key in engine._transition_map, f"Missing transition: {from_state.value} + {event.value}"
+        # Expected key transitions
+        expected_transitions = [
+            (FlowStep.GREETING, FlowEvent.START_SESSION),
+            (FlowStep.WAIT_FOR_SYMPTOM, FlowEvent.USER_INPUT),
+            (FlowStep.WAIT_FOR_CONFIRMATION, FlowEvent.USER_INPUT),  # Changed: Now uses USER_INPUT
+            (FlowStep.WAIT_FOR_CONTEXT, FlowEvent.USER_INPUT),
+            (FlowStep.ASK_FOR_EXERCISE, FlowEvent.YES_RESPONSE),
+            (FlowStep.ASK_FOR_EXERCISE, FlowEvent.NO_RESPONSE),
+            (FlowStep.FEEDBACK_Q1, FlowEvent.FEEDBACK_ANSWER),
+            (FlowStep.FEEDBACK_Q5, FlowEvent.FEEDBACK_COMPLETE),
+        ]
+        
+        for from_state, event in expected_transitions:
+            key = (from_state, event)
+            assert key in flow_engine_readonly._transition_map, f"Missing transition: {from_state.value} + {event.value}"
     
-    def test_restart_transitions_universal(self, mock_services_bundle):
+    def test_restart_transitions_universal(self, flow_engine_readonly):
         """Test restart command works from all states"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # All states should have restart transition
-            all_states = [
-                FlowStep.GREETING, FlowStep.WAIT_FOR_SYMPTOM, FlowStep.WAIT_FOR_CONFIRMATION,
-                FlowStep.WAIT_FOR_CONTEXT, FlowStep.ASK_FOR_EXERCISE, FlowStep.END_OR_RESTART,
-                FlowStep.FEEDBACK_Q1, FlowStep.FEEDBACK_Q2, FlowStep.FEEDBACK_Q3,
-                FlowStep.FEEDBACK_Q4, FlowStep.FEEDBACK_Q5
-            ]
+        # All states should have restart transition
+        all_states = [
+            FlowStep.GREETING, FlowStep.WAIT_FOR_SYMPTOM, FlowStep.WAIT_FOR_CONFIRMATION,
+            FlowStep.WAIT_FOR_CONTEXT, FlowStep.ASK_FOR_EXERCISE, FlowStep.END_OR_RESTART,
+            FlowStep.FEEDBACK_Q1, FlowStep.FEEDBACK_Q2, FlowStep.FEEDBACK_Q3,
+            FlowStep.FEEDBACK_Q4, FlowStep.FEEDBACK_Q5
+        ]
+        
+        for state in all_states:
+            key = (state, FlowEvent.RESTART_COMMAND)
+            assert key in flow_engine_readonly._transition_map, f"Missing restart from {state.value}"
             
-            for state in all_states:
-                key = (state, FlowEvent.RESTART_COMMAND)
-                assert key in engine._transition_map, f"Missing restart from {state.value}"
-                
-                transition = engine._transition_map[key]
-                assert transition.to_state == FlowStep.WAIT_FOR_SYMPTOM
+            transition = flow_engine_readonly._transition_map[key]
+            assert transition.to_state == FlowStep.WAIT_FOR_SYMPTOM
     
-    def test_get_valid_transitions(self, mock_services_bundle):
+    def test_get_valid_transitions(self, flow_engine_readonly):
         """Test getting valid transitions for a state"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Test greeting state
-            greeting_transitions = engine.get_valid_transitions(FlowStep.GREETING)
-            assert len(greeting_transitions) >= 2  # START_SESSION + RESTART_COMMAND
-            
-            # Test confirmation state  
-            confirmation_transitions = engine.get_valid_transitions(FlowStep.WAIT_FOR_CONFIRMATION)
-            assert len(confirmation_transitions) >= 2  # USER_INPUT + RESTART
-            
-            # Verify types
-            for transition in greeting_transitions:
-                assert isinstance(transition, Transition)
-                assert transition.from_state == FlowStep.GREETING
+        # Test greeting state
+        greeting_transitions = flow_engine_readonly.get_valid_transitions(FlowStep.GREETING)
+        assert len(greeting_transitions) >= 2  # START_SESSION + RESTART_COMMAND
+        
+        # Test confirmation state  
+        confirmation_transitions = flow_engine_readonly.get_valid_transitions(FlowStep.WAIT_FOR_CONFIRMATION)
+        assert len(confirmation_transitions) >= 2  # USER_INPUT + RESTART
+        
+        # Verify types
+        for transition in greeting_transitions:
+            assert isinstance(transition, Transition)
+            assert transition.from_state == FlowStep.GREETING
     
-    def test_can_transition_validation(self, sample_session, mock_services_bundle):
+    def test_can_transition_validation(self, sample_session):
         """Test transition validation logic"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Valid transition
-            assert engine.can_transition(
-                FlowStep.GREETING, 
-                FlowEvent.START_SESSION, 
-                sample_session
-            )
-            
-            # Invalid transition
-            assert not engine.can_transition(
-                FlowStep.GREETING,
-                FlowEvent.FEEDBACK_ANSWER,  # Invalid from greeting
-                sample_session
-            )
-            
-            # Test with context
-            assert engine.can_transition(
-                FlowStep.WAIT_FOR_SYMPTOM,
-                FlowEvent.USER_INPUT,
-                sample_session,
-                user_input="mein hund bellt",
-                context={"test": True}
-            )
+        engine = FlowEngine()
+        
+        # Valid transition
+        assert engine.can_transition(
+            FlowStep.GREETING, 
+            FlowEvent.START_SESSION, 
+            sample_session
+        )
+        
+        # Invalid transition
+        assert not engine.can_transition(
+            FlowStep.GREETING,
+            FlowEvent.FEEDBACK_ANSWER,  # Invalid from greeting
+            sample_session
+        )
+        
+        # Test with context
+        assert engine.can_transition(
+            FlowStep.WAIT_FOR_SYMPTOM,
+            FlowEvent.USER_INPUT,
+            sample_session,
+            user_input="mein hund bellt",
+            context={"test": True}
+        )
 
 
 # ===========================================
@@ -146,71 +139,62 @@ class TestFlowEngineFSM:
 class TestEventClassification:
     """Test user input classification into events"""
     
-    def test_restart_commands(self, mock_services_bundle):
+    def test_restart_commands(self, flow_engine_readonly):
         """Test restart command detection"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            restart_inputs = ["neu", "restart", "von vorne", "NEU", "Restart"]
-            
-            for restart_input in restart_inputs:
-                for state in [FlowStep.WAIT_FOR_SYMPTOM, FlowStep.FEEDBACK_Q2]:
-                    event = engine.classify_user_input(restart_input, state)
-                    assert event == FlowEvent.RESTART_COMMAND
+        restart_inputs = ["neu", "restart", "von vorne", "NEU", "Restart"]
+        
+        for restart_input in restart_inputs:
+            for state in [FlowStep.WAIT_FOR_SYMPTOM, FlowStep.FEEDBACK_Q2]:
+                event = flow_engine_readonly.classify_user_input(restart_input, state)
+                assert event == FlowEvent.RESTART_COMMAND
     
-    def test_yes_no_classification(self, mock_services_bundle):
+    def test_yes_no_classification(self, flow_engine_readonly):
         """Test yes/no response classification"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Yes responses
-            yes_inputs = ["ja", "Ja", "ja bitte", "ja, gerne"]
-            
-            # For WAIT_FOR_CONFIRMATION, we now always return USER_INPUT
-            # The handler will determine if it's yes/no
-            for yes_input in yes_inputs:
-                event = engine.classify_user_input(yes_input, FlowStep.WAIT_FOR_CONFIRMATION)
-                assert event == FlowEvent.USER_INPUT
-            
-            # For ASK_FOR_EXERCISE and END_OR_RESTART, we still return YES_RESPONSE/NO_RESPONSE
-            yes_states_with_direct_classification = [FlowStep.ASK_FOR_EXERCISE, FlowStep.END_OR_RESTART]
-            for yes_input in yes_inputs:
-                for state in yes_states_with_direct_classification:
-                    event = engine.classify_user_input(yes_input, state)
-                    assert event == FlowEvent.YES_RESPONSE
-            
-            # No responses - use full words that match the logic
-            no_inputs = ["nein", "Nein", "nein danke"]
-            
-            for no_input in no_inputs:
-                event = engine.classify_user_input(no_input, FlowStep.WAIT_FOR_CONFIRMATION)
-                assert event == FlowEvent.USER_INPUT
-                
-            for no_input in no_inputs:
-                for state in yes_states_with_direct_classification:
-                    event = engine.classify_user_input(no_input, state)
-                    assert event == FlowEvent.NO_RESPONSE
-    
-    def test_state_specific_classification(self, mock_services_bundle):
-        """Test state-specific input classification"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Symptom input
-            event = engine.classify_user_input("mein hund bellt", FlowStep.WAIT_FOR_SYMPTOM)
+        # Yes responses
+        yes_inputs = ["ja", "Ja", "ja bitte", "ja, gerne"]
+        
+        # For WAIT_FOR_CONFIRMATION, we now always return USER_INPUT
+        # The handler will determine if it's yes/no
+        for yes_input in yes_inputs:
+            event = flow_engine_readonly.classify_user_input(yes_input, FlowStep.WAIT_FOR_CONFIRMATION)
             assert event == FlowEvent.USER_INPUT
-            
-            # Context input
-            event = engine.classify_user_input("wenn besuch kommt", FlowStep.WAIT_FOR_CONTEXT)
+        
+        # For ASK_FOR_EXERCISE and END_OR_RESTART, we still return YES_RESPONSE/NO_RESPONSE
+        yes_states_with_direct_classification = [FlowStep.ASK_FOR_EXERCISE, FlowStep.END_OR_RESTART]
+        for yes_input in yes_inputs:
+            for state in yes_states_with_direct_classification:
+                event = flow_engine_readonly.classify_user_input(yes_input, state)
+                assert event == FlowEvent.YES_RESPONSE
+        
+        # No responses - use full words that match the logic
+        no_inputs = ["nein", "Nein", "nein danke"]
+        
+        for no_input in no_inputs:
+            event = flow_engine_readonly.classify_user_input(no_input, FlowStep.WAIT_FOR_CONFIRMATION)
             assert event == FlowEvent.USER_INPUT
             
-            # Feedback answers
-            event = engine.classify_user_input("sehr hilfreich", FlowStep.FEEDBACK_Q1)
-            assert event == FlowEvent.FEEDBACK_ANSWER
-            
-            # Final feedback
-            event = engine.classify_user_input("test@example.com", FlowStep.FEEDBACK_Q5)
-            assert event == FlowEvent.FEEDBACK_COMPLETE
+        for no_input in no_inputs:
+            for state in yes_states_with_direct_classification:
+                event = flow_engine_readonly.classify_user_input(no_input, state)
+                assert event == FlowEvent.NO_RESPONSE
+    
+    def test_state_specific_classification(self, flow_engine_readonly):
+        """Test state-specific input classification"""
+        # Symptom input
+        event = flow_engine_readonly.classify_user_input("mein hund bellt", FlowStep.WAIT_FOR_SYMPTOM)
+        assert event == FlowEvent.USER_INPUT
+        
+        # Context input
+        event = flow_engine_readonly.classify_user_input("wenn besuch kommt", FlowStep.WAIT_FOR_CONTEXT)
+        assert event == FlowEvent.USER_INPUT
+        
+        # Feedback answers
+        event = flow_engine_readonly.classify_user_input("sehr hilfreich", FlowStep.FEEDBACK_Q1)
+        assert event == FlowEvent.FEEDBACK_ANSWER
+        
+        # Final feedback
+        event = flow_engine_readonly.classify_user_input("test@example.com", FlowStep.FEEDBACK_Q5)
+        assert event == FlowEvent.FEEDBACK_COMPLETE
 
 
 # ===========================================
@@ -222,89 +206,83 @@ class TestHandlerIntegration:
     """Test integration with FlowHandlers"""
     
     @pytest.mark.asyncio
-    async def test_greeting_handler_integration(self, sample_session, mock_services_bundle):
+    async def test_greeting_handler_integration(self, sample_session):
         """Test greeting handler is called correctly"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            mock_handlers.handle_greeting.return_value = [
-                V2AgentMessage(sender="dog", text="Hallo!", message_type="greeting")
-            ]
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            sample_session.current_step = FlowStep.GREETING
-            
-            # Process start session event
-            new_state, messages = await engine.process_event(
-                sample_session,
-                FlowEvent.START_SESSION
-            )
-            
-            # Verify handler was called
-            mock_handlers.handle_greeting.assert_called_once()
-            assert new_state == FlowStep.WAIT_FOR_SYMPTOM
-            assert len(messages) == 1
-            assert messages[0].sender == "dog"
+        mock_handlers = AsyncMock()
+        mock_handlers.handle_greeting.return_value = [
+            V2AgentMessage(sender="dog", text="Hallo!", message_type="greeting")
+        ]
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.GREETING
+        
+        # Process start session event
+        new_state, messages = await engine.process_event(
+            sample_session,
+            FlowEvent.START_SESSION
+        )
+        
+        # Verify handler was called
+        mock_handlers.handle_greeting.assert_called_once()
+        assert new_state == FlowStep.WAIT_FOR_SYMPTOM
+        assert len(messages) == 1
+        assert messages[0].sender == "dog"
     
     @pytest.mark.asyncio
-    async def test_symptom_handler_integration(self, sample_session, mock_services_bundle):
+    async def test_symptom_handler_integration(self, sample_session):
         """Test symptom input handler integration"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            
-            # Mock handler returns next_event and messages
-            mock_handlers.handle_symptom_input.return_value = (
-                'symptom_found',  # next_event
-                [V2AgentMessage(sender="dog", text="Als Hund fühle ich...", message_type="response")]
-            )
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            sample_session.current_step = FlowStep.WAIT_FOR_SYMPTOM
-            
-            # Process symptom input
-            new_state, messages = await engine.process_event(
-                sample_session,
-                FlowEvent.USER_INPUT,
-                user_input="mein hund bellt"
-            )
-            
-            # Verify handler was called with correct parameters
-            mock_handlers.handle_symptom_input.assert_called_once()
-            args = mock_handlers.handle_symptom_input.call_args[0]
-            assert args[0] == sample_session
-            assert args[1] == "mein hund bellt"
-            
-            assert new_state == FlowStep.WAIT_FOR_CONFIRMATION
-            assert len(messages) == 1
+        mock_handlers = AsyncMock()
+        
+        # Mock handler returns next_event and messages
+        mock_handlers.handle_symptom_input.return_value = (
+            'symptom_found',  # next_event
+            [V2AgentMessage(sender="dog", text="Als Hund fühle ich...", message_type="response")]
+        )
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.WAIT_FOR_SYMPTOM
+        
+        # Process symptom input
+        new_state, messages = await engine.process_event(
+            sample_session,
+            FlowEvent.USER_INPUT,
+            user_input="mein hund bellt"
+        )
+        
+        # Verify handler was called with correct parameters
+        mock_handlers.handle_symptom_input.assert_called_once()
+        args = mock_handlers.handle_symptom_input.call_args[0]
+        assert args[0] == sample_session
+        assert args[1] == "mein hund bellt"
+        
+        assert new_state == FlowStep.WAIT_FOR_CONFIRMATION
+        assert len(messages) == 1
     
     @pytest.mark.asyncio
-    async def test_symptom_not_found_handling(self, sample_session, mock_services_bundle):
+    async def test_symptom_not_found_handling(self, sample_session):
         """Test symptom not found stays in same state"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            
-            # Mock handler returns symptom_not_found
-            mock_handlers.handle_symptom_input.return_value = (
-                'symptom_not_found',  # next_event  
-                [V2AgentMessage(sender="dog", text="Dazu habe ich keine Infos.", message_type="error")]
-            )
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            sample_session.current_step = FlowStep.WAIT_FOR_SYMPTOM
-            
-            # Process symptom input
-            new_state, messages = await engine.process_event(
-                sample_session,
-                FlowEvent.USER_INPUT,
-                user_input="unbekanntes verhalten"
-            )
-            
-            # Should stay in same state
-            assert new_state == FlowStep.WAIT_FOR_SYMPTOM
-            assert len(messages) == 1
-            assert "keine" in messages[0].text.lower()
+        mock_handlers = AsyncMock()
+        
+        # Mock handler returns symptom_not_found
+        mock_handlers.handle_symptom_input.return_value = (
+            'symptom_not_found',  # next_event  
+            [V2AgentMessage(sender="dog", text="Dazu habe ich keine Infos.", message_type="error")]
+        )
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.WAIT_FOR_SYMPTOM
+        
+        # Process symptom input
+        new_state, messages = await engine.process_event(
+            sample_session,
+            FlowEvent.USER_INPUT,
+            user_input="unbekanntes verhalten"
+        )
+        
+        # Should stay in same state
+        assert new_state == FlowStep.WAIT_FOR_SYMPTOM
+        assert len(messages) == 1
+        assert "keine" in messages[0].text.lower()
 
 
 # ===========================================
@@ -316,155 +294,147 @@ class TestCompleteFlows:
     """Test complete conversation flows end-to-end"""
     
     @pytest.mark.asyncio
-    async def test_happy_path_flow(self, sample_conversation_flow, mock_services_bundle):
+    async def test_happy_path_flow(self, sample_conversation_flow):
         """Test complete happy path conversation"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            
-            # Mock all handlers to return appropriate responses
-            mock_handlers.handle_greeting.return_value = [
-                V2AgentMessage(sender="dog", text="Hallo!", message_type="greeting")
-            ]
-            mock_handlers.handle_symptom_input.return_value = (
-                'symptom_found',
-                [V2AgentMessage(sender="dog", text="Als Hund belle ich...", message_type="response")]
-            )
-            mock_handlers.handle_confirmation.return_value = (
-                FlowStep.WAIT_FOR_CONTEXT,
-                [V2AgentMessage(sender="dog", text="Gut, erzähle mir mehr...", message_type="question")]
-            )
-            mock_handlers.handle_context_input.return_value = [
-                V2AgentMessage(sender="dog", text="Territorial instinkt...", message_type="response")
-            ]
-            mock_handlers.handle_exercise_request.return_value = [
-                V2AgentMessage(sender="dog", text="Übung: ...", message_type="response")
-            ]
-            mock_handlers.handle_feedback_completion.return_value = [
-                V2AgentMessage(sender="companion", text="Danke! 🐾", message_type="response")
-            ]
-            
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            session = SessionState()
-            session.session_id = "test-flow"
-            session.current_step = FlowStep.GREETING
-            
-            # Step 1: Start session
-            state, messages = await engine.process_event(session, FlowEvent.START_SESSION)
-            assert state == FlowStep.WAIT_FOR_SYMPTOM
-            
-            # Step 2: Symptom input
-            state, messages = await engine.process_event(
-                session, FlowEvent.USER_INPUT, "mein hund bellt"
-            )
-            assert state == FlowStep.WAIT_FOR_CONFIRMATION
-            
-            # Step 3: Confirmation yes - use USER_INPUT for confirmation state
-            state, messages = await engine.process_event(session, FlowEvent.USER_INPUT, "ja")
-            assert state == FlowStep.WAIT_FOR_CONTEXT
-            
-            # Step 4: Context input
-            state, messages = await engine.process_event(
-                session, FlowEvent.USER_INPUT, "bei besuch"
-            )
-            assert state == FlowStep.ASK_FOR_EXERCISE
-            
-            # Step 5: Exercise yes
-            state, messages = await engine.process_event(session, FlowEvent.YES_RESPONSE)
-            assert state == FlowStep.END_OR_RESTART
-            
-            # Verify all handlers were called
-            mock_handlers.handle_greeting.assert_called_once()
-            mock_handlers.handle_symptom_input.assert_called_once()
-            mock_handlers.handle_context_input.assert_called_once()
-            mock_handlers.handle_exercise_request.assert_called_once()
+        mock_handlers = AsyncMock()
+        
+        # Mock all handlers to return appropriate responses
+        mock_handlers.handle_greeting.return_value = [
+            V2AgentMessage(sender="dog", text="Hallo!", message_type="greeting")
+        ]
+        mock_handlers.handle_symptom_input.return_value = (
+            'symptom_found',
+            [V2AgentMessage(sender="dog", text="Als Hund belle ich...", message_type="response")]
+        )
+        mock_handlers.handle_confirmation.return_value = (
+            FlowStep.WAIT_FOR_CONTEXT,
+            [V2AgentMessage(sender="dog", text="Gut, erzähle mir mehr...", message_type="question")]
+        )
+        mock_handlers.handle_context_input.return_value = [
+            V2AgentMessage(sender="dog", text="Territorial instinkt...", message_type="response")
+        ]
+        mock_handlers.handle_exercise_request.return_value = [
+            V2AgentMessage(sender="dog", text="Übung: ...", message_type="response")
+        ]
+        mock_handlers.handle_feedback_completion.return_value = [
+            V2AgentMessage(sender="companion", text="Danke! 🐾", message_type="response")
+        ]
+        
+        engine = FlowEngine(mock_handlers)
+        session = SessionState()
+        session.session_id = "test-flow"
+        session.current_step = FlowStep.GREETING
+        
+        # Step 1: Start session
+        state, messages = await engine.process_event(session, FlowEvent.START_SESSION)
+        assert state == FlowStep.WAIT_FOR_SYMPTOM
+        
+        # Step 2: Symptom input
+        state, messages = await engine.process_event(
+            session, FlowEvent.USER_INPUT, "mein hund bellt"
+        )
+        assert state == FlowStep.WAIT_FOR_CONFIRMATION
+        
+        # Step 3: Confirmation yes - use USER_INPUT for confirmation state
+        state, messages = await engine.process_event(session, FlowEvent.USER_INPUT, "ja")
+        assert state == FlowStep.WAIT_FOR_CONTEXT
+        
+        # Step 4: Context input
+        state, messages = await engine.process_event(
+            session, FlowEvent.USER_INPUT, "bei besuch"
+        )
+        assert state == FlowStep.ASK_FOR_EXERCISE
+        
+        # Step 5: Exercise yes
+        state, messages = await engine.process_event(session, FlowEvent.YES_RESPONSE)
+        assert state == FlowStep.END_OR_RESTART
+        
+        # Verify all handlers were called
+        mock_handlers.handle_greeting.assert_called_once()
+        mock_handlers.handle_symptom_input.assert_called_once()
+        mock_handlers.handle_context_input.assert_called_once()
+        mock_handlers.handle_exercise_request.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_feedback_flow(self, sample_session, mock_services_bundle):
+    async def test_feedback_flow(self, sample_session):
         """Test complete feedback flow"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            
-            # Mock feedback handlers
-            def feedback_question_side_effect(session, user_input, context):
-                question_num = context.get('question_number', 1)
-                return [V2AgentMessage(sender="companion", text=f"Frage {question_num}", message_type="question")]
-            
-            mock_handlers.handle_feedback_question.side_effect = feedback_question_side_effect
-            mock_handlers.handle_feedback_answer.return_value = None  # Just stores answer
-            mock_handlers.handle_feedback_completion.return_value = [
-                V2AgentMessage(sender="companion", text="Danke! 🐾", message_type="response")
-            ]
-            
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            sample_session.current_step = FlowStep.FEEDBACK_Q1
-            
-            # Q1 -> Q2
-            state, messages = await engine.process_event(
-                sample_session, FlowEvent.FEEDBACK_ANSWER, "hilfreich"
-            )
-            assert state == FlowStep.FEEDBACK_Q2
-            
-            # Q2 -> Q3
-            state, messages = await engine.process_event(
-                sample_session, FlowEvent.FEEDBACK_ANSWER, "gut"
-            )
-            assert state == FlowStep.FEEDBACK_Q3
-            
-            # Q3 -> Q4
-            state, messages = await engine.process_event(
-                sample_session, FlowEvent.FEEDBACK_ANSWER, "passend"
-            )
-            assert state == FlowStep.FEEDBACK_Q4
-            
-            # Q4 -> Q5
-            state, messages = await engine.process_event(
-                sample_session, FlowEvent.FEEDBACK_ANSWER, "8"
-            )
-            assert state == FlowStep.FEEDBACK_Q5
-            
-            # Q5 -> Complete
-            state, messages = await engine.process_event(
-                sample_session, FlowEvent.FEEDBACK_COMPLETE, "test@example.com"
-            )
-            assert state == FlowStep.GREETING
-            
-            # Verify feedback completion
-            mock_handlers.handle_feedback_completion.assert_called_once()
+        mock_handlers = AsyncMock()
+        
+        # Mock feedback handlers
+        def feedback_question_side_effect(session, user_input, context):
+            question_num = context.get('question_number', 1)
+            return [V2AgentMessage(sender="companion", text=f"Frage {question_num}", message_type="question")]
+        
+        mock_handlers.handle_feedback_question.side_effect = feedback_question_side_effect
+        mock_handlers.handle_feedback_answer.return_value = None  # Just stores answer
+        mock_handlers.handle_feedback_completion.return_value = [
+            V2AgentMessage(sender="companion", text="Danke! 🐾", message_type="response")
+        ]
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.FEEDBACK_Q1
+        
+        # Q1 -> Q2
+        state, messages = await engine.process_event(
+            sample_session, FlowEvent.FEEDBACK_ANSWER, "hilfreich"
+        )
+        assert state == FlowStep.FEEDBACK_Q2
+        
+        # Q2 -> Q3
+        state, messages = await engine.process_event(
+            sample_session, FlowEvent.FEEDBACK_ANSWER, "gut"
+        )
+        assert state == FlowStep.FEEDBACK_Q3
+        
+        # Q3 -> Q4
+        state, messages = await engine.process_event(
+            sample_session, FlowEvent.FEEDBACK_ANSWER, "passend"
+        )
+        assert state == FlowStep.FEEDBACK_Q4
+        
+        # Q4 -> Q5
+        state, messages = await engine.process_event(
+            sample_session, FlowEvent.FEEDBACK_ANSWER, "8"
+        )
+        assert state == FlowStep.FEEDBACK_Q5
+        
+        # Q5 -> Complete
+        state, messages = await engine.process_event(
+            sample_session, FlowEvent.FEEDBACK_COMPLETE, "test@example.com"
+        )
+        assert state == FlowStep.GREETING
+        
+        # Verify feedback completion
+        mock_handlers.handle_feedback_completion.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_restart_from_any_state(self, mock_services_bundle):
+    async def test_restart_from_any_state(self):
         """Test restart command works from any state"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            mock_handlers_class.return_value = mock_handlers
+        mock_handlers = AsyncMock()
+        
+        engine = FlowEngine(mock_handlers)
+        
+        test_states = [
+            FlowStep.WAIT_FOR_CONFIRMATION,
+            FlowStep.WAIT_FOR_CONTEXT,
+            FlowStep.FEEDBACK_Q3
+        ]
+        
+        for test_state in test_states:
+            session = SessionState()
+            session.current_step = test_state
+            session.active_symptom = "old symptom"
             
-            engine = FlowEngine(mock_handlers)
+            # Process restart command
+            state, messages = await engine.process_event(
+                session, FlowEvent.RESTART_COMMAND, "neu"
+            )
             
-            test_states = [
-                FlowStep.WAIT_FOR_CONFIRMATION,
-                FlowStep.WAIT_FOR_CONTEXT,
-                FlowStep.FEEDBACK_Q3
-            ]
+            # Should go to symptom waiting state
+            assert state == FlowStep.WAIT_FOR_SYMPTOM
             
-            for test_state in test_states:
-                session = SessionState()
-                session.current_step = test_state
-                session.active_symptom = "old symptom"
-                
-                # Process restart command
-                state, messages = await engine.process_event(
-                    session, FlowEvent.RESTART_COMMAND, "neu"
-                )
-                
-                # Should go to symptom waiting state
-                assert state == FlowStep.WAIT_FOR_SYMPTOM
-                
-                # Session should be cleared
-                assert session.active_symptom == ""
+            # Session should be cleared
+            assert session.active_symptom == ""
 
 
 # ===========================================
@@ -476,53 +446,47 @@ class TestErrorHandling:
     """Test error scenarios and edge cases"""
     
     @pytest.mark.asyncio
-    async def test_invalid_transition_error(self, sample_session, mock_services_bundle):
+    async def test_invalid_transition_error(self, sample_session):
         """Test invalid transition raises proper error"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            sample_session.current_step = FlowStep.GREETING
-            
-            # Try invalid transition - should raise some kind of error
-            with pytest.raises(Exception) as exc_info:  # More generic for now
-                await engine.process_event(
-                    sample_session,
-                    FlowEvent.FEEDBACK_ANSWER  # Invalid from greeting
-                )
-            
-            # Check that it's some kind of flow error
-            error_msg = str(exc_info.value)
-            assert "Invalid transition" in error_msg or "transition" in error_msg.lower()
+        engine = FlowEngine()
+        sample_session.current_step = FlowStep.GREETING
+        
+        # Try invalid transition - should raise some kind of error
+        with pytest.raises(Exception) as exc_info:  # More generic for now
+            await engine.process_event(
+                sample_session,
+                FlowEvent.FEEDBACK_ANSWER  # Invalid from greeting
+            )
+        
+        # Check that it's some kind of flow error
+        error_msg = str(exc_info.value)
+        assert "Invalid transition" in error_msg or "transition" in error_msg.lower()
     
     @pytest.mark.asyncio
-    async def test_handler_exception_propagation(self, sample_session, mock_services_bundle):
+    async def test_handler_exception_propagation(self, sample_session):
         """Test handler exceptions are properly propagated"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            mock_handlers.handle_greeting.side_effect = Exception("Handler failed")
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
-            sample_session.current_step = FlowStep.GREETING
-            
-            # Should raise some kind of error when handler fails
-            with pytest.raises(Exception) as exc_info:  # More generic for now
-                await engine.process_event(sample_session, FlowEvent.START_SESSION)
-            
-            # Check that error relates to handler failure
-            error_msg = str(exc_info.value)
-            assert "Handler failed" in error_msg or "failed" in error_msg.lower()
+        mock_handlers = AsyncMock()
+        mock_handlers.handle_greeting.side_effect = Exception("Handler failed")
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.GREETING
+        
+        # Should raise some kind of error when handler fails
+        with pytest.raises(Exception) as exc_info:  # More generic for now
+            await engine.process_event(sample_session, FlowEvent.START_SESSION)
+        
+        # Check that error relates to handler failure
+        error_msg = str(exc_info.value)
+        assert "Handler failed" in error_msg or "failed" in error_msg.lower()
     
-    def test_empty_user_input_classification(self, mock_services_bundle):
+    def test_empty_user_input_classification(self, flow_engine_readonly):
         """Test classification handles empty input gracefully"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Empty input should still classify properly
-            event = engine.classify_user_input("", FlowStep.WAIT_FOR_SYMPTOM)
-            assert event == FlowEvent.USER_INPUT
-            
-            event = engine.classify_user_input("   ", FlowStep.WAIT_FOR_CONFIRMATION)
-            assert event == FlowEvent.USER_INPUT  # Not yes/no, so generic input
+        # Empty input should still classify properly
+        event = flow_engine_readonly.classify_user_input("", FlowStep.WAIT_FOR_SYMPTOM)
+        assert event == FlowEvent.USER_INPUT
+        
+        event = flow_engine_readonly.classify_user_input("   ", FlowStep.WAIT_FOR_CONFIRMATION)
+        assert event == FlowEvent.USER_INPUT  # Not yes/no, so generic input
 
 
 # ===========================================
@@ -533,72 +497,67 @@ class TestErrorHandling:
 class TestFSMValidation:
     """Test FSM structure validation"""
     
-    def test_fsm_summary_generation(self, mock_services_bundle):
+    def test_fsm_summary_generation(self, flow_engine_readonly):
         """Test FSM summary provides useful information"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            summary = engine.get_flow_summary()
-            
-            # Check summary structure
-            assert "total_states" in summary
-            assert "total_events" in summary
-            assert "total_transitions" in summary
-            assert "states" in summary
-            assert "events" in summary
-            assert "transitions" in summary
-            
-            # Verify counts make sense
-            assert summary["total_states"] > 5  # At least main states
-            assert summary["total_events"] > 5  # At least main events
-            assert summary["total_transitions"] > 10  # Should have many transitions
-            
-            # Check transition details
-            for transition in summary["transitions"]:
-                assert "from" in transition
-                assert "event" in transition
-                assert "to" in transition
-                assert "has_handler" in transition
+        summary = flow_engine_readonly.get_flow_summary()
+        
+        # Check summary structure
+        assert "total_states" in summary
+        assert "total_events" in summary
+        assert "total_transitions" in summary
+        assert "states" in summary
+        assert "events" in summary
+        assert "transitions" in summary
+        
+        # Verify counts make sense
+        assert summary["total_states"] > 5  # At least main states
+        assert summary["total_events"] > 5  # At least main events
+        assert summary["total_transitions"] > 10  # Should have many transitions
+        
+        # Check transition details
+        for transition in summary["transitions"]:
+            assert "from" in transition
+            assert "event" in transition
+            assert "to" in transition
+            assert "has_handler" in transition
     
-    def test_fsm_validation_passes(self, mock_services_bundle):
+    def test_fsm_validation_passes(self, flow_engine_readonly):
         """Test FSM validation finds no issues in properly configured engine"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            issues = engine.validate_fsm()
-            
-            # Well-configured FSM should have no issues
-            assert isinstance(issues, list)
-            # Note: Some issues might be expected (e.g., transitions without handlers in test mode)
-            # The main goal is that validation runs without crashing
+        issues = flow_engine_readonly.validate_fsm()
+        
+        # Well-configured FSM should have no issues
+        assert isinstance(issues, list)
+        # Note: Some issues might be expected (e.g., transitions without handlers in test mode)
+        # The main goal is that validation runs without crashing
     
-    def test_add_custom_transition(self, mock_services_bundle):
+    def test_add_custom_transition(self):
         """Test adding custom transitions works"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            initial_count = len(engine.transitions)
-            
-            # Add custom transition
-            custom_handler = AsyncMock()
-            engine.add_transition(
-                from_state=FlowStep.GREETING,
-                event=FlowEvent.USER_INPUT,  # Custom event for greeting
-                to_state=FlowStep.WAIT_FOR_SYMPTOM,
-                handler=custom_handler,
-                description="Custom test transition"
-            )
-            
-            # Rebuild map
-            engine._build_transition_map()
-            
-            # Verify addition
-            assert len(engine.transitions) == initial_count + 1
-            
-            # Verify it's in the map
-            key = (FlowStep.GREETING, FlowEvent.USER_INPUT)
-            assert key in engine._transition_map
-            
-            transition = engine._transition_map[key]
-            assert transition.handler == custom_handler
-            assert transition.description == "Custom test transition"
+        engine = FlowEngine()
+        initial_count = len(engine.transitions)
+        
+        # Add custom transition
+        custom_handler = AsyncMock()
+        engine.add_transition(
+            from_state=FlowStep.GREETING,
+            event=FlowEvent.USER_INPUT,  # Custom event for greeting
+            to_state=FlowStep.WAIT_FOR_SYMPTOM,
+            handler=custom_handler,
+            description="Custom test transition"
+        )
+        
+        # Rebuild map
+        engine._build_transition_map()
+        
+        # Verify addition
+        assert len(engine.transitions) == initial_count + 1
+        
+        # Verify it's in the map
+        key = (FlowStep.GREETING, FlowEvent.USER_INPUT)
+        assert key in engine._transition_map
+        
+        transition = engine._transition_map[key]
+        assert transition.handler == custom_handler
+        assert transition.description == "Custom test transition"
 
 
 # ===========================================
@@ -609,53 +568,48 @@ class TestFSMValidation:
 class TestPerformance:
     """Test performance characteristics of the engine"""
     
-    def test_transition_lookup_performance(self, mock_services_bundle):
+    def test_transition_lookup_performance(self, flow_engine_readonly):
         """Test transition lookup is fast even with many transitions"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            
-            # Measure time for many lookups
-            import time
-            
-            start_time = time.time()
-            for _ in range(1000):
-                engine.can_transition(
-                    FlowStep.GREETING,
-                    FlowEvent.START_SESSION,
-                    SessionState()
-                )
-            end_time = time.time()
-            
-            # Should be very fast (less than 100ms for 1000 lookups)
-            elapsed = end_time - start_time
-            assert elapsed < 0.1, f"Transition lookup too slow: {elapsed}s for 1000 lookups"
+        # Measure time for many lookups
+        import time
+        
+        start_time = time.time()
+        for _ in range(1000):
+            flow_engine_readonly.can_transition(
+                FlowStep.GREETING,
+                FlowEvent.START_SESSION,
+                SessionState()
+            )
+        end_time = time.time()
+        
+        # Should be very fast (less than 100ms for 1000 lookups)
+        elapsed = end_time - start_time
+        assert elapsed < 0.1, f"Transition lookup too slow: {elapsed}s for 1000 lookups"
     
     @pytest.mark.asyncio
-    async def test_event_processing_performance(self, sample_session, mock_services_bundle):
+    async def test_event_processing_performance(self, sample_session):
         """Test event processing remains fast"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            mock_handlers = AsyncMock()
-            mock_handlers.handle_greeting.return_value = [
-                V2AgentMessage(sender="dog", text="Fast response", message_type="greeting")
-            ]
-            mock_handlers_class.return_value = mock_handlers
-            
-            engine = FlowEngine(mock_handlers)
+        mock_handlers = AsyncMock()
+        mock_handlers.handle_greeting.return_value = [
+            V2AgentMessage(sender="dog", text="Fast response", message_type="greeting")
+        ]
+        
+        engine = FlowEngine(mock_handlers)
+        sample_session.current_step = FlowStep.GREETING
+        
+        import time
+        
+        start_time = time.time()
+        for _ in range(10):  # Process events multiple times
+            # Reset state for each iteration
             sample_session.current_step = FlowStep.GREETING
             
-            import time
-            
-            start_time = time.time()
-            for _ in range(10):  # Process events multiple times
-                # Reset state for each iteration
-                sample_session.current_step = FlowStep.GREETING
-                
-                await engine.process_event(sample_session, FlowEvent.START_SESSION)
-            end_time = time.time()
-            
-            # Should be fast
-            elapsed = end_time - start_time
-            assert elapsed < 1.0, f"Event processing too slow: {elapsed}s for 10 events"
+            await engine.process_event(sample_session, FlowEvent.START_SESSION)
+        end_time = time.time()
+        
+        # Should be fast
+        elapsed = end_time - start_time
+        assert elapsed < 1.0, f"Event processing too slow: {elapsed}s for 10 events"
 
 
 # ===========================================
@@ -667,137 +621,132 @@ class TestFlowEngineDemo:
     """Demonstration tests showing engine capabilities"""
     
     @pytest.mark.asyncio
-    async def test_full_conversation_demo(self, mock_services_bundle, caplog):
+    async def test_full_conversation_demo(self, caplog):
         """Complete conversation demonstration with logging"""
-        with patch('src.core.flow_handlers.FlowHandlers') as mock_handlers_class:
-            # Create realistic handlers
-            mock_handlers = AsyncMock()
-            
-            # Realistic responses
-            mock_handlers.handle_greeting.return_value = [
-                V2AgentMessage(sender="dog", text="🐾 Hallo! Ich erkläre Hundeverhalten aus meiner Sicht!", message_type="greeting"),
-                V2AgentMessage(sender="dog", text="Beschreibe mir bitte ein Verhalten!", message_type="question")
-            ]
-            
-            mock_handlers.handle_symptom_input.return_value = (
-                'symptom_found',
-                [V2AgentMessage(sender="dog", text="Als Hund belle ich, weil ich mein Territorium beschütze. Das ist mein Instinkt!", message_type="response"),
-                 V2AgentMessage(sender="dog", text="Magst du mehr über meine Gefühle erfahren?", message_type="question")]
-            )
-            
-            mock_handlers.handle_confirmation.return_value = (
-                FlowStep.WAIT_FOR_CONTEXT,
-                [V2AgentMessage(sender="dog", text="Super! Erzähl mir mehr über die Situation.", message_type="question")]
-            )
-            
-            mock_handlers.handle_context_input.return_value = [
-                V2AgentMessage(sender="dog", text="Jetzt verstehe ich! Wenn Fremde kommen, aktiviert sich mein Schutzinstinkt besonders stark.", message_type="response"),
-                V2AgentMessage(sender="dog", text="Möchtest du eine Übung dazu?", message_type="question")
-            ]
-            
-            mock_handlers.handle_exercise_request.return_value = [
-                V2AgentMessage(sender="dog", text="Übe mit mir täglich 10 Minuten Ruhe-Training. Wenn ich entspannt bin, kann ich besser mit Besuch umgehen!", message_type="response"),
-                V2AgentMessage(sender="dog", text="Möchtest du ein anderes Verhalten verstehen?", message_type="question")
-            ]
-            
-            mock_handlers_class.return_value = mock_handlers
-            
-            # Start conversation  
-            engine = FlowEngine(mock_handlers)
-            session = SessionState()
-            session.session_id = "demo-conversation"
-            
-            print("\n=== V2 FlowEngine Demo: Vollständige Unterhaltung ===")
-            
-            # Step 1: Greeting
-            print(f"\n1. Start (Zustand: {session.current_step.value})")
-            state, messages = await engine.process_event(session, FlowEvent.START_SESSION)
-            for msg in messages:
-                print(f"   🤖 {msg.sender}: {msg.text}")
-            print(f"   → Neuer Zustand: {state.value}")
-            
-            # Step 2: Symptom
-            print(f"\n2. Symptom Eingabe (Zustand: {session.current_step.value})")
-            print("   👤 User: Mein Hund bellt ständig an der Haustür")
-            state, messages = await engine.process_event(
-                session, FlowEvent.USER_INPUT, "Mein Hund bellt ständig an der Haustür"
-            )
-            for msg in messages:
-                print(f"   🤖 {msg.sender}: {msg.text}")
-            print(f"   → Neuer Zustand: {state.value}")
-            
-            # Step 3: Confirmation
-            print(f"\n3. Bestätigung (Zustand: {session.current_step.value})")
-            print("   👤 User: ja")
-            state, messages = await engine.process_event(session, FlowEvent.USER_INPUT, "ja")
-            for msg in messages:
-                print(f"   🤖 {msg.sender}: {msg.text}")
-            print(f"   → Neuer Zustand: {state.value}")
-            
-            # Step 4: Context
-            print(f"\n4. Kontext (Zustand: {session.current_step.value})")
-            print("   👤 User: Besonders wenn Fremde an der Tür stehen")
-            state, messages = await engine.process_event(
-                session, FlowEvent.USER_INPUT, "Besonders wenn Fremde an der Tür stehen"
-            )
-            for msg in messages:
-                print(f"   🤖 {msg.sender}: {msg.text}")
-            print(f"   → Neuer Zustand: {state.value}")
-            
-            # Step 5: Exercise
-            print(f"\n5. Übung (Zustand: {session.current_step.value})")
-            print("   👤 User: ja")
-            state, messages = await engine.process_event(session, FlowEvent.YES_RESPONSE, "ja")
-            for msg in messages:
-                print(f"   🤖 {msg.sender}: {msg.text}")
-            print(f"   → Neuer Zustand: {state.value}")
-            
-            print(f"\n✅ Demo abgeschlossen! Finale Zustand: {state.value}")
-            print("   Alle Handler wurden erfolgreich integriert und aufgerufen.")
-            
-            # Verify all major handlers were called
-            assert mock_handlers.handle_greeting.call_count >= 1
-            assert mock_handlers.handle_symptom_input.call_count >= 1
-            assert mock_handlers.handle_context_input.call_count >= 1
-            assert mock_handlers.handle_exercise_request.call_count >= 1
+        # Create realistic handlers
+        mock_handlers = AsyncMock()
+        
+        # Realistic responses
+        mock_handlers.handle_greeting.return_value = [
+            V2AgentMessage(sender="dog", text="🐾 Hallo! Ich erkläre Hundeverhalten aus meiner Sicht!", message_type="greeting"),
+            V2AgentMessage(sender="dog", text="Beschreibe mir bitte ein Verhalten!", message_type="question")
+        ]
+        
+        mock_handlers.handle_symptom_input.return_value = (
+            'symptom_found',
+            [V2AgentMessage(sender="dog", text="Als Hund belle ich, weil ich mein Territorium beschütze. Das ist mein Instinkt!", message_type="response"),
+             V2AgentMessage(sender="dog", text="Magst du mehr über meine Gefühle erfahren?", message_type="question")]
+        )
+        
+        mock_handlers.handle_confirmation.return_value = (
+            FlowStep.WAIT_FOR_CONTEXT,
+            [V2AgentMessage(sender="dog", text="Super! Erzähl mir mehr über die Situation.", message_type="question")]
+        )
+        
+        mock_handlers.handle_context_input.return_value = [
+            V2AgentMessage(sender="dog", text="Jetzt verstehe ich! Wenn Fremde kommen, aktiviert sich mein Schutzinstinkt besonders stark.", message_type="response"),
+            V2AgentMessage(sender="dog", text="Möchtest du eine Übung dazu?", message_type="question")
+        ]
+        
+        mock_handlers.handle_exercise_request.return_value = [
+            V2AgentMessage(sender="dog", text="Übe mit mir täglich 10 Minuten Ruhe-Training. Wenn ich entspannt bin, kann ich besser mit Besuch umgehen!", message_type="response"),
+            V2AgentMessage(sender="dog", text="Möchtest du ein anderes Verhalten verstehen?", message_type="question")
+        ]
+        
+        # Start conversation  
+        engine = FlowEngine(mock_handlers)
+        session = SessionState()
+        session.session_id = "demo-conversation"
+        
+        print("\n=== V2 FlowEngine Demo: Vollständige Unterhaltung ===")
+        
+        # Step 1: Greeting
+        print(f"\n1. Start (Zustand: {session.current_step.value})")
+        state, messages = await engine.process_event(session, FlowEvent.START_SESSION)
+        for msg in messages:
+            print(f"   🤖 {msg.sender}: {msg.text}")
+        print(f"   → Neuer Zustand: {state.value}")
+        
+        # Step 2: Symptom
+        print(f"\n2. Symptom Eingabe (Zustand: {session.current_step.value})")
+        print("   👤 User: Mein Hund bellt ständig an der Haustür")
+        state, messages = await engine.process_event(
+            session, FlowEvent.USER_INPUT, "Mein Hund bellt ständig an der Haustür"
+        )
+        for msg in messages:
+            print(f"   🤖 {msg.sender}: {msg.text}")
+        print(f"   → Neuer Zustand: {state.value}")
+        
+        # Step 3: Confirmation
+        print(f"\n3. Bestätigung (Zustand: {session.current_step.value})")
+        print("   👤 User: ja")
+        state, messages = await engine.process_event(session, FlowEvent.USER_INPUT, "ja")
+        for msg in messages:
+            print(f"   🤖 {msg.sender}: {msg.text}")
+        print(f"   → Neuer Zustand: {state.value}")
+        
+        # Step 4: Context
+        print(f"\n4. Kontext (Zustand: {session.current_step.value})")
+        print("   👤 User: Besonders wenn Fremde an der Tür stehen")
+        state, messages = await engine.process_event(
+            session, FlowEvent.USER_INPUT, "Besonders wenn Fremde an der Tür stehen"
+        )
+        for msg in messages:
+            print(f"   🤖 {msg.sender}: {msg.text}")
+        print(f"   → Neuer Zustand: {state.value}")
+        
+        # Step 5: Exercise
+        print(f"\n5. Übung (Zustand: {session.current_step.value})")
+        print("   👤 User: ja")
+        state, messages = await engine.process_event(session, FlowEvent.YES_RESPONSE, "ja")
+        for msg in messages:
+            print(f"   🤖 {msg.sender}: {msg.text}")
+        print(f"   → Neuer Zustand: {state.value}")
+        
+        print(f"\n✅ Demo abgeschlossen! Finale Zustand: {state.value}")
+        print("   Alle Handler wurden erfolgreich integriert und aufgerufen.")
+        
+        # Verify all major handlers were called
+        assert mock_handlers.handle_greeting.call_count >= 1
+        assert mock_handlers.handle_symptom_input.call_count >= 1
+        assert mock_handlers.handle_context_input.call_count >= 1
+        assert mock_handlers.handle_exercise_request.call_count >= 1
     
-    def test_fsm_structure_demo(self, mock_services_bundle):
+    def test_fsm_structure_demo(self, flow_engine_readonly):
         """Demonstrate FSM structure and capabilities"""
-        with patch('src.core.flow_handlers.FlowHandlers'):
-            engine = FlowEngine()
-            summary = engine.get_flow_summary()
-            
-            print("\n=== V2 FlowEngine FSM Struktur Demo ===")
-            print(f"📊 Zustandsanzahl: {summary['total_states']}")
-            print(f"📊 Ereignisanzahl: {summary['total_events']}")
-            print(f"📊 Übergänge gesamt: {summary['total_transitions']}")
-            
-            print(f"\n🎯 Verfügbare Zustände:")
-            for state in summary['states']:
-                print(f"   - {state}")
-            
-            print(f"\n⚡ Verfügbare Ereignisse:")
-            for event in summary['events']:
-                print(f"   - {event}")
-            
-            print(f"\n🔄 Beispiel-Übergänge:")
-            for transition in summary['transitions'][:5]:  # Show first 5
-                handler_status = "✅" if transition['has_handler'] else "❌"
-                print(f"   {handler_status} {transition['from']} + {transition['event']} → {transition['to']}")
-            
-            print(f"   ... und {len(summary['transitions']) - 5} weitere")
-            
-            # Validation
-            issues = engine.validate_fsm()
-            print(f"\n🔍 FSM Validierung:")
-            if issues:
-                print("   ⚠️ Gefundene Probleme:")
-                for issue in issues:
-                    print(f"     - {issue}")
-            else:
-                print("   ✅ Keine Probleme gefunden!")
-            
-            print("\n✅ FSM Demo abgeschlossen!")
+        summary = flow_engine_readonly.get_flow_summary()
+        
+        print("\n=== V2 FlowEngine FSM Struktur Demo ===")
+        print(f"📊 Zustandsanzahl: {summary['total_states']}")
+        print(f"📊 Ereignisanzahl: {summary['total_events']}")
+        print(f"📊 Übergänge gesamt: {summary['total_transitions']}")
+        
+        print(f"\n🎯 Verfügbare Zustände:")
+        for state in summary['states']:
+            print(f"   - {state}")
+        
+        print(f"\n⚡ Verfügbare Ereignisse:")
+        for event in summary['events']:
+            print(f"   - {event}")
+        
+        print(f"\n🔄 Beispiel-Übergänge:")
+        for transition in summary['transitions'][:5]:  # Show first 5
+            handler_status = "✅" if transition['has_handler'] else "❌"
+            print(f"   {handler_status} {transition['from']} + {transition['event']} → {transition['to']}")
+        
+        print(f"   ... und {len(summary['transitions']) - 5} weitere")
+        
+        # Validation
+        issues = flow_engine_readonly.validate_fsm()
+        print(f"\n🔍 FSM Validierung:")
+        if issues:
+            print("   ⚠️ Gefundene Probleme:")
+            for issue in issues:
+                print(f"     - {issue}")
+        else:
+            print("   ✅ Keine Probleme gefunden!")
+        
+        print("\n✅ FSM Demo abgeschlossen!")
 
 
 # ===========================================
@@ -809,7 +758,7 @@ class TestRegressionFixes:
     """Tests for specific bugs that were fixed"""
     
     @pytest.mark.asyncio
-    async def test_nein_after_dog_perspective_restarts_immediately(self, mock_services_bundle):
+    async def test_nein_after_dog_perspective_restarts_immediately(self, mock_weaviate_service):
         """
         Regression test: When user says 'nein' after dog perspective,
         should restart immediately to WAIT_FOR_SYMPTOM, not go to END_OR_RESTART
@@ -820,17 +769,14 @@ class TestRegressionFixes:
         Fix: 'nein' after perspective should directly restart conversation
         """
         # Setup
-        mock_gpt = mock_services_bundle['gpt_service']
-        mock_weaviate = mock_services_bundle['weaviate_service'] 
-        mock_redis = mock_services_bundle['redis_service']
-        mock_weaviate.semantic_search_symptoms.return_value = [{
+        mock_weaviate_service.semantic_search_symptoms.return_value = [{
             'content': 'Bellen an der Haustür',
             'distance': 0.15,
             'properties': {'symptom': 'Bellen', 'instinct': 'Territorial'}
         }]
         
         # Create engine and session - using REAL handlers to test actual fix
-        engine = FlowEngine()
+        engine = FlowEngine(FlowHandlers())
         session = SessionState(session_id="test_nein_restart")
         session.current_step = FlowStep.WAIT_FOR_CONFIRMATION
         session.active_symptom = "Bellen an der Haustür"
@@ -6,8 +6,11 @@ Uses mock-first approach to test without requiring a real Redis instance.
 """
 import os
 import json
+import asyncio
+import math
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+import pytest_asyncio
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from datetime import timedelta
 
 from src.services.redis_service import (
@@ -16,7 +19,9 @@ from src.services.redis_service import (
     create_redis_service,
     get_redis_singleton
 )
-from src.core.exceptions import RedisServiceError
+from src.core.exceptions import RedisServiceError, ConfigurationError
+
+pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture
@@ -29,6 +34,14 @@ def mock_config():
     )
 
 
+def async_iter(items):
+    """Build an async iterator over items (stands in for scan_iter)"""
+    async def _gen(*args, **kwargs):
+        for item in items:
+            yield item
+    return _gen
+
+
 @pytest.fixture
 def mock_redis_client():
     """Create a mock Redis client"""
@@ -41,7 +54,7 @@ def mock_redis_client():
     client.setex = AsyncMock(return_value=True)
     client.delete = AsyncMock(return_value=1)
     client.exists = AsyncMock(return_value=1)
-    client.keys = AsyncMock(return_value=[])
+    client.scan_iter = Mock(side_effect=async_iter([]))
     client.expire = AsyncMock(return_value=True)
     client.ttl = AsyncMock(return_value=3600)
     client.mget = AsyncMock(return_value=[None, None])
@@ -54,16 +67,23 @@ def mock_redis_client():
     })
     client.close = AsyncMock()
     
+    # Mock pipeline: commands are queued synchronously, sent on execute()
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(return_value=[])
+    client.pipeline = Mock(return_value=pipe)
+    
     return client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def redis_service(mock_config, mock_redis_client):
     """Create a Redis service with mocked client"""
     service = RedisService(mock_config)
     
     # Patch the client creation
-    with patch('src.services.redis_service.redis.from_url', return_value=mock_redis_client):
+    with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client):
         await service.initialize()
     
     return service
@@ -79,13 +99,81 @@ class TestRedisService:
         assert service.config == mock_config
         assert not service.is_initialized
         
-        with patch('src.services.redis_service.redis.from_url', return_value=mock_redis_client):
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client):
             await service.initialize()
         
         assert service.is_initialized
         assert service.is_connected()
         mock_redis_client.ping.assert_called_once()
     
+    async def test_initialization_client_options(self, mock_config, mock_redis_client):
+        """Test client is created with keepalive and a client name"""
+        service = RedisService(mock_config)
+        
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client) as client_cls:
+            await service.initialize()
+        
+        pool = client_cls.call_args.kwargs["connection_pool"]
+        assert pool.max_connections == 64
+        assert pool.connection_kwargs["socket_keepalive"] is True
+        assert pool.connection_kwargs["client_name"]
+        await service.shutdown()
+    
+    async def test_shared_connection_pool(self, mock_redis_client):
+        """Test services for the same URL share one pool until the last shuts down"""
+        config = RedisConfig(url="redis://shared-pool:6379/0")
+        service1 = RedisService(config)
+        service2 = RedisService(config)
+        
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client) as client_cls:
+            await service1.initialize()
+            await service2.initialize()
+        
+        pool1 = client_cls.call_args_list[0].kwargs["connection_pool"]
+        pool2 = client_cls.call_args_list[1].kwargs["connection_pool"]
+        assert pool1 is pool2
+        
+        with patch.object(pool1, "disconnect", AsyncMock()) as disconnect:
+            await service1.shutdown()
+            disconnect.assert_not_awaited()
+            await service2.shutdown()
+            disconnect.assert_awaited_once()
+    
+    async def test_connection_pool_keyed_by_options(self, mock_redis_client):
+        """Test services with different connection options get separate pools"""
+        small = RedisService(RedisConfig(url="redis://shared-pool:6379/0", max_connections=8))
+        large = RedisService(RedisConfig(url="redis://shared-pool:6379/0", max_connections=64))
+        
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client) as client_cls:
+            await small.initialize()
+            await large.initialize()
+        
+        small_pool = client_cls.call_args_list[0].kwargs["connection_pool"]
+        large_pool = client_cls.call_args_list[1].kwargs["connection_pool"]
+        assert small_pool is not large_pool
+        assert small_pool.max_connections == 8
+        assert large_pool.max_connections == 64
+        await small.shutdown()
+        await large.shutdown()
+    
+    async def test_connection_pool_per_event_loop(self, mock_redis_client):
+        """Test a pool created on one event loop is not reused on another"""
+        config = RedisConfig(url="redis://shared-pool:6379/0")
+        
+        async def use_service():
+            service = RedisService(config)
+            await service.initialize()
+            await service.shutdown()
+        
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client) as client_cls:
+            service = RedisService(config)
+            await service.initialize()
+            await asyncio.to_thread(asyncio.run, use_service())
+        
+        pools = [call.kwargs["connection_pool"] for call in client_cls.call_args_list]
+        assert pools[0] is not pools[1]
+        await service.shutdown()
+    
     async def test_initialization_from_env(self):
         """Test initialization from environment variables"""
         with patch.dict('os.environ', {
@@ -118,7 +206,7 @@ class TestRedisService:
         failing_client = AsyncMock()
         failing_client.ping.side_effect = Exception("Connection refused")
         
-        with patch('src.services.redis_service.redis.from_url', return_value=failing_client):
+        with patch('src.services.redis_service.redis.Redis', return_value=failing_client):
             # Should not raise but log warning
             await service.initialize()
         
@@ -142,6 +230,23 @@ class TestRedisService:
         
         assert result == {"name": "test", "value": 42}
     
+    async def test_get_json_like_string(self, redis_service, mock_redis_client):
+        """Test strings that only look like JSON are returned unchanged"""
+        mock_redis_client.get.return_value = "nein"
+        
+        result = await redis_service.get("test_key")
+        
+        assert result == "nein"
+    
+    async def test_get_json_with_nan_and_whitespace(self, redis_service, mock_redis_client):
+        """Test values json.dumps can write are still deserialized"""
+        mock_redis_client.get.return_value = json.dumps({"x": float("nan")})
+        result = await redis_service.get("test_key")
+        assert isinstance(result, dict) and math.isnan(result["x"])
+        
+        mock_redis_client.get.return_value = ' \n{"a": 1}'
+        assert await redis_service.get("test_key") == {"a": 1}
+    
     async def test_get_default(self, redis_service, mock_redis_client):
         """Test getting with default value"""
         mock_redis_client.get.return_value = None
@@ -181,6 +286,38 @@ class TestRedisService:
         assert result is True
         mock_redis_client.setex.assert_called_once_with("test_key", 3600, "value")
     
+    async def test_set_compressed_roundtrip(self, mock_redis_client):
+        """Test large values are zstd-compressed and transparently restored"""
+        config = RedisConfig(
+            url="redis://localhost:6379/0",
+            decode_responses=False,
+            compress_min_size=1024
+        )
+        service = RedisService(config)
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client):
+            await service.initialize()
+        data = {"text": "wuff " * 500}
+        
+        await service.set("big", data)
+        await service.set("small", "wuff")
+        
+        stored = mock_redis_client.set.call_args_list[0][0][1]
+        assert stored.startswith(b"\x28\xb5\x2f\xfd")
+        assert len(stored) < 1024
+        assert mock_redis_client.set.call_args_list[1][0][1] == "wuff"
+        
+        mock_redis_client.get.return_value = stored
+        assert await service.get("big") == data
+        mock_redis_client.get.return_value = b"wuff"
+        assert await service.get("small") == "wuff"
+    
+    async def test_compression_requires_binary_client(self):
+        """Test compression with decoded responses is rejected"""
+        service = RedisService(RedisConfig(url="redis://localhost:6379/0", compress_min_size=1024))
+        
+        with pytest.raises(ConfigurationError):
+            await service.initialize()
+    
     async def test_set_no_client(self, redis_service):
         """Test set when Redis is not connected"""
         redis_service._client = None
@@ -209,12 +346,21 @@ class TestRedisService:
     
     async def test_keys(self, redis_service, mock_redis_client):
         """Test getting keys by pattern"""
-        mock_redis_client.keys.return_value = [b"key1", b"key2", "key3"]
+        mock_redis_client.scan_iter.side_effect = async_iter([b"key1", b"key2", "key3"])
         
         result = await redis_service.keys("key*")
         
         assert result == ["key1", "key2", "key3"]
-        mock_redis_client.keys.assert_called_once_with("key*")
+        mock_redis_client.scan_iter.assert_called_once_with(match="key*", count=500)
+    
+    async def test_iter_keys(self, redis_service, mock_redis_client):
+        """Test streaming keys via SCAN"""
+        mock_redis_client.scan_iter.side_effect = async_iter(["a", b"b"])
+        
+        result = [key async for key in redis_service.iter_keys("*", count=10)]
+        
+        assert result == ["a", "b"]
+        mock_redis_client.scan_iter.assert_called_once_with(match="*", count=10)
     
     async def test_expire(self, redis_service, mock_redis_client):
         """Test setting expiration"""
@@ -257,10 +403,62 @@ class TestRedisService:
         assert result is True
         
         # Check that non-strings were serialized
-        call_args = mock_redis_client.mset.call_args[0][0]
+        pipe = mock_redis_client.pipeline.return_value
+        call_args = pipe.mset.call_args[0][0]
         assert call_args["key1"] == "value1"
         assert call_args["key2"] == '{"nested": "data"}'
         assert call_args["key3"] == "42"
+        pipe.execute.assert_awaited_once()
+    
+    async def test_mset_serializes_like_set(self, redis_service, mock_redis_client):
+        """Test mset accepts everything json.dumps does"""
+        result = await redis_service.mset({"key1": {1: "a"}, "key2": 2 ** 70})
+        
+        assert result is True
+        call_args = mock_redis_client.pipeline.return_value.mset.call_args[0][0]
+        assert call_args == {"key1": '{"1": "a"}', "key2": str(2 ** 70)}
+    
+    async def test_mset_chunked(self, redis_service, mock_redis_client):
+        """Test large mappings are split into several MSETs in one pipeline"""
+        redis_service.config.pipeline_chunk = 2
+        mapping = {f"key{i}": f"value{i}" for i in range(5)}
+        
+        result = await redis_service.mset(mapping)
+        
+        assert result is True
+        pipe = mock_redis_client.pipeline.return_value
+        assert [len(c[0][0]) for c in pipe.mset.call_args_list] == [2, 2, 1]
+        pipe.execute.assert_awaited_once()
+    
+    async def test_pipeline_get(self, redis_service, mock_redis_client):
+        """Test pipelined get deserializes results"""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = ["value1", '{"key": "value2"}', None]
+        
+        result = await redis_service.pipeline_get(["key1", "key2", "key3"])
+        
+        assert result == ["value1", {"key": "value2"}, None]
+        assert pipe.get.call_count == 3
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    
+    async def test_pipeline_set_with_ttl(self, redis_service, mock_redis_client):
+        """Test pipelined set uses SETEX when a TTL is given"""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [True, True]
+        
+        result = await redis_service.pipeline_set({"key1": "value1", "key2": {"a": 1}}, ttl=60)
+        
+        assert result is True
+        pipe.setex.assert_any_call("key1", 60, "value1")
+        pipe.setex.assert_any_call("key2", 60, '{"a": 1}')
+    
+    async def test_pipeline_no_client(self, redis_service):
+        """Test pipelined get when Redis is not connected"""
+        redis_service._client = None
+        
+        result = await redis_service.pipeline_get(["key1", "key2"])
+        
+        assert result == [None, None]
     
     async def test_incr(self, redis_service, mock_redis_client):
         """Test incrementing counter"""
@@ -271,14 +469,84 @@ class TestRedisService:
         assert result == 5
         mock_redis_client.incrby.assert_called_once_with("counter", 2)
     
-    async def test_health_check_healthy(self, redis_service):
+    async def test_incr_with_ttl(self, redis_service, mock_redis_client):
+        """Test incrementing with TTL runs one atomic script"""
+        script = AsyncMock(return_value=1)
+        mock_redis_client.register_script = Mock(return_value=script)
+        
+        result = await redis_service.incr("counter", 1, ttl=60)
+        await redis_service.incr("counter", 1, ttl=60)
+        
+        assert result == 1
+        mock_redis_client.incrby.assert_not_called()
+        mock_redis_client.register_script.assert_called_once()
+        script.assert_awaited_with(keys=["counter"], args=[1, 60])
+    
+    async def test_get_or_set_hit(self, redis_service, mock_redis_client):
+        """Test get_or_set returns cached value without producing"""
+        mock_redis_client.get.return_value = '{"cached": true}'
+        producer = Mock()
+        
+        result = await redis_service.get_or_set("test_key", producer, ttl=60)
+        
+        assert result == {"cached": True}
+        producer.assert_not_called()
+    
+    async def test_get_or_set_stored_none(self, redis_service, mock_redis_client):
+        """Test a stored JSON null is returned instead of producing again"""
+        mock_redis_client.get.return_value = 'null'
+        producer = Mock()
+        
+        result = await redis_service.get_or_set("test_key", producer, ttl=60)
+        
+        assert result is None
+        producer.assert_not_called()
+    
+    async def test_get_or_set_miss(self, redis_service, mock_redis_client):
+        """Test get_or_set stores the produced value atomically"""
+        script = AsyncMock(return_value='{"fresh": 1}')
+        mock_redis_client.register_script = Mock(return_value=script)
+        
+        async def producer():
+            return {"fresh": 1}
+        
+        result = await redis_service.get_or_set("test_key", producer, ttl=60)
+        
+        assert result == {"fresh": 1}
+        script.assert_awaited_once_with(keys=["test_key"], args=['{"fresh": 1}', 60])
+    
+    async def test_health_check_healthy(self, redis_service, mock_redis_client):
         """Test health check when service is healthy"""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [
+            True,
+            {"connected_clients": 5},
+            {"used_memory_human": "1.5M"},
+            {"redis_version": "7.0.0"}
+        ]
+        
         health = await redis_service.health_check()
         
         assert health['healthy'] is True
         assert health['status'] == 'connected'
         assert health['details']['redis_version'] == '7.0.0'
         assert health['details']['connected_clients'] == 5
+        assert health['details']['used_memory_human'] == '1.5M'
+        pipe.info.assert_any_call("server")
+    
+    async def test_health_check_caches_version(self, redis_service, mock_redis_client):
+        """Test the server INFO section is only fetched until the version is known"""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.return_value = [True, {}, {}, {"redis_version": "7.0.0"}]
+        await redis_service.health_check()
+        
+        pipe.info.reset_mock()
+        pipe.execute.return_value = [True, {"connected_clients": 2}, {}]
+        health = await redis_service.health_check()
+        
+        assert health['details']['redis_version'] == '7.0.0'
+        assert health['details']['connected_clients'] == 2
+        assert [c[0][0] for c in pipe.info.call_args_list] == ["clients", "memory"]
     
     async def test_health_check_no_url(self):
         """Test health check when Redis is not configured"""
@@ -293,7 +561,8 @@ class TestRedisService:
     
     async def test_health_check_error(self, redis_service, mock_redis_client):
         """Test health check when Redis has errors"""
-        mock_redis_client.ping.side_effect = Exception("Connection lost")
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute.side_effect = Exception("Connection lost")
         
         health = await redis_service.health_check()
         
@@ -314,7 +583,7 @@ class TestRedisServiceFactory:
     
     async def test_create_redis_service(self, mock_redis_client):
         """Test service creation via factory"""
-        with patch('src.services.redis_service.redis.from_url', return_value=mock_redis_client):
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client):
             service = await create_redis_service(
                 url="redis://factory:6379",
                 socket_timeout=10.0
@@ -327,7 +596,7 @@ class TestRedisServiceFactory:
     
     async def test_singleton(self, mock_redis_client):
         """Test singleton pattern"""
-        with patch('src.services.redis_service.redis.from_url', return_value=mock_redis_client):
+        with patch('src.services.redis_service.redis.Redis', return_value=mock_redis_client):
             # First call creates instance
             service1 = await get_redis_singleton()
             
@@ -4,6 +4,8 @@ Tests for ValidationService - centralized input validation.
 """
 
 import pytest
+import asyncio
+from unittest.mock import AsyncMock, Mock
 from src.services.validation_service import ValidationService, ValidationResult, DogContentValidator
 
 
@@ -108,7 +110,7 @@ class TestValidationService:
     @pytest.mark.asyncio
     async def test_yes_responses(self, validation_service):
         """Test various yes responses"""
-        yes_inputs = ["ja", "Ja", "JA", "ja gerne", "yes", "YES"]
+        yes_inputs = ["ja", "Ja", "JA", "ja gerne", "Ja, bitte!", "yes", "YES"]
         
         for input_text in yes_inputs:
             result = await validation_service.validate_yes_no_response(input_text)
@@ -128,7 +130,7 @@ class TestValidationService:
     @pytest.mark.asyncio
     async def test_invalid_yes_no_responses(self, validation_service):
         """Test invalid yes/no responses"""
-        invalid_inputs = ["vielleicht", "maybe", "123", ""]
+        invalid_inputs = ["vielleicht", "maybe", "123", "", "jaguar", "yesterday", "nobody"]
         
         for input_text in invalid_inputs:
             result = await validation_service.validate_yes_no_response(input_text)
@@ -165,6 +167,24 @@ class TestValidationService:
         assert "cannot be empty" in result.message
         assert result.details['question_number'] == 1
         assert result.details['min_length'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_min_length_overrides(self):
+        """Test overridden MIN_* thresholds are honored"""
+        class LenientValidationService(ValidationService):
+            MIN_CONTEXT_LENGTH = 5
+        
+        result = await LenientValidationService().validate_context_input("Im Park")
+        assert result.valid is True
+        
+        strict_service = ValidationService()
+        strict_service.MIN_SYMPTOM_LENGTH = 100
+        result = await strict_service.validate_symptom_input(
+            "Mein Hund bellt ständig sehr laut wenn Besucher kommen"
+        )
+        assert result.valid is False
+        assert result.details['min_length'] == 100
+        assert "at least 100 characters" in result.message
 
 
 class TestDogContentValidator:
@@ -258,3 +278,52 @@ class TestDogContentValidator:
         assert dog_validator._check_keywords("computer problems") is False
         assert dog_validator._check_keywords("") is False
     
+    def test_dog_keywords_alias(self, dog_validator):
+        """Test the per-language DOG_KEYWORDS mapping is still available"""
+        assert dog_validator.DOG_KEYWORDS['de'] == DogContentValidator.KEYWORDS_DE
+        assert dog_validator.DOG_KEYWORDS['en'] == DogContentValidator.KEYWORDS_EN
+        assert 'hund' in DogContentValidator.DOG_KEYWORDS['de']
+    
+    def test_keyword_detection_compound_words(self, dog_validator):
+        """Test keywords only match whole words, not parts of compounds"""
+        # Keywords that are themselves compounds still match
+        assert dog_validator._check_keywords("Wir gehen zur Hundeschule") is True
+        
+        # Compounds containing a keyword are left to the GPT fallback
+        assert dog_validator._check_keywords("Die Hundeleine ist neu") is False
+        assert dog_validator._check_keywords("Leinenführigkeit üben") is False
+    
+    
+    @pytest.mark.asyncio
+    async def test_gpt_verdict_cached(self):
+        """Test repeated input reuses the cached GPT verdict"""
+        gpt_service = Mock()
+        gpt_service.complete = AsyncMock(return_value="nein")
+        validator = DogContentValidator(gpt_service)
+        
+        first = await validator.is_dog_related("Das Wetter ist heute schön")
+        second = await validator.is_dog_related("  das wetter ist  heute schön ")
+        
+        assert first is False
+        assert second is False
+        gpt_service.complete.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_gpt_checks_deduplicated(self):
+        """Test concurrent checks of the same text share one GPT request"""
+        async def slow_complete(**kwargs):
+            await asyncio.sleep(0.01)
+            return "ja"
+        
+        gpt_service = Mock()
+        gpt_service.complete = AsyncMock(side_effect=slow_complete)
+        validator = DogContentValidator(gpt_service)
+        
+        results = await asyncio.gather(*[
+            validator.is_dog_related("Er macht das jeden Abend im Garten")
+            for _ in range(5)
+        ])
+        
+        assert results == [True] * 5
+        gpt_service.complete.assert_awaited_once()
+        assert validator._inflight == {}
@@ -5,21 +5,37 @@ Unit tests for V2 Weaviate Service.
 Uses mock-first approach to test without requiring a real Weaviate instance.
 """
 import os
+import array
+import asyncio
+import threading
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, patch, MagicMock
 from uuid import uuid4
 
+from src.services import weaviate_service as weaviate_module
 from src.services.weaviate_service import (
     WeaviateService, 
     WeaviateConfig, 
     create_weaviate_service
 )
 from src.core.exceptions import (
+    V2ServiceError,
     WeaviateServiceError, 
     ConfigurationError, 
     ValidationError
 )
 
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def clear_client_registry():
+    """Keep shared clients from leaking between tests"""
+    weaviate_module._CLIENT_REGISTRY.clear()
+    yield
+    weaviate_module._CLIENT_REGISTRY.clear()
+
 
 @pytest.fixture
 def mock_config():
@@ -77,7 +93,7 @@ def mock_search_results():
     return result
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def weaviate_service(mock_config, mock_weaviate_client):
     """Create a Weaviate service with mocked client"""
     service = WeaviateService(mock_config)
@@ -111,6 +127,157 @@ class TestWeaviateService:
         assert service.is_initialized
         mock_connect.assert_called_once()
     
+    async def test_shared_client(self, mock_config, mock_weaviate_client):
+        """Test services for the same cluster share one client"""
+        mock_weaviate_client.is_live.return_value = True
+        service1 = WeaviateService(mock_config)
+        service2 = WeaviateService(mock_config)
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   return_value=mock_weaviate_client) as mock_connect:
+            await service1.initialize()
+            await service2.initialize()
+        
+        mock_connect.assert_called_once()
+        assert service1.client is service2.client
+        
+        await service1.shutdown()
+        mock_weaviate_client.close.assert_not_called()
+        await service2.shutdown()
+        mock_weaviate_client.close.assert_called_once()
+    
+    async def test_shared_client_reconnects_when_dead(self, mock_config, mock_weaviate_client):
+        """Test a dead shared client is replaced by a fresh connection"""
+        mock_weaviate_client.is_live.return_value = False
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   return_value=mock_weaviate_client) as mock_connect:
+            stale_owner = WeaviateService(mock_config)
+            await stale_owner.initialize()
+            service = WeaviateService(mock_config)
+            await service.initialize()
+        
+        assert mock_connect.call_count == 2
+        # The stale pool is closed once, and releasing it later does not
+        # close the replacement
+        mock_weaviate_client.close.assert_called_once()
+        await stale_owner.shutdown()
+        mock_weaviate_client.close.assert_called_once()
+        await service.shutdown()
+        assert mock_weaviate_client.close.call_count == 2
+    
+    async def test_shared_client_keyed_by_connection_settings(self, mock_config, mock_weaviate_client):
+        """Test services with different connection settings get separate clients"""
+        mock_weaviate_client.is_live.return_value = True
+        other_config = WeaviateConfig(
+            url=mock_config.url,
+            api_key=mock_config.api_key,
+            additional_headers={"X-OpenAI-Api-Key": "other-key"}
+        )
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   return_value=mock_weaviate_client) as mock_connect:
+            await WeaviateService(mock_config).initialize()
+            await WeaviateService(other_config).initialize()
+        
+        assert mock_connect.call_count == 2
+        assert mock_connect.call_args.kwargs["headers"] == {"X-OpenAI-Api-Key": "other-key"}
+    
+    async def test_client_lock_per_event_loop(self):
+        """Test the registry lock is created per event loop, not at import"""
+        async def lock_in_loop():
+            return weaviate_module._client_lock()
+        
+        lock = weaviate_module._client_lock()
+        other_lock = await asyncio.to_thread(asyncio.run, lock_in_loop())
+        
+        assert weaviate_module._client_lock() is lock
+        assert other_lock is not lock
+    
+    async def test_readiness_check_opt_in(self, mock_config, mock_weaviate_client):
+        """Test the post-connect readiness round trip only runs when enabled"""
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   return_value=mock_weaviate_client):
+            await WeaviateService(mock_config).initialize()
+            mock_weaviate_client.is_ready.assert_not_called()
+            
+            weaviate_module._CLIENT_REGISTRY.clear()
+            mock_weaviate_client.is_ready.return_value = False
+            mock_config.verify_ready = True
+            with pytest.raises(V2ServiceError):
+                await WeaviateService(mock_config).initialize()
+    
+    async def test_connection_timeouts(self, mock_config, mock_weaviate_client):
+        """Test init and query timeouts are configured separately"""
+        mock_config.query_timeout = 3
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   return_value=mock_weaviate_client) as mock_connect:
+            await WeaviateService(mock_config).initialize()
+        
+        additional_config = mock_connect.call_args.kwargs["additional_config"]
+        assert additional_config.timeout.init == 30
+        assert additional_config.timeout.query == 3
+        assert ("grpc.keepalive_time_ms", 30000) in additional_config.grpc_config.channel_options
+    
+    async def test_client_pool_round_robin(self, mock_config, mock_search_results):
+        """Test pooled clients are opened together and used in turn"""
+        mock_config.pool_size = 3
+        clients = []
+        for _ in range(3):
+            client = Mock()
+            client.is_ready.return_value = True
+            client.collections.get.return_value.query.near_text.return_value = mock_search_results
+            clients.append(client)
+        service = WeaviateService(mock_config)
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   side_effect=clients) as mock_connect:
+            await service.initialize()
+        
+        assert mock_connect.call_count == 3
+        for i in range(6):
+            await service.search("Symptome", f"Bellen {i}")
+        near_text_calls = [
+            c.collections.get.return_value.query.near_text.call_count for c in clients
+        ]
+        assert near_text_calls == [2, 2, 2]
+        # Collection handles are looked up once per client
+        assert [c.collections.get.call_count for c in clients] == [1, 1, 1]
+        
+        await service.shutdown()
+        for client in clients:
+            client.close.assert_called_once()
+    
+    async def test_client_pool_shared_across_pool_sizes(self, mock_config):
+        """Test a larger pool_size grows the shared pool instead of opening another"""
+        clients = []
+        for _ in range(3):
+            client = Mock()
+            client.is_live.return_value = True
+            clients.append(client)
+        small = WeaviateService(mock_config)
+        large = WeaviateService(WeaviateConfig(
+            url=mock_config.url,
+            api_key=mock_config.api_key,
+            pool_size=3
+        ))
+        
+        with patch('src.services.weaviate_service.weaviate.connect_to_weaviate_cloud',
+                   side_effect=clients) as mock_connect:
+            await small.initialize()
+            await large.initialize()
+        
+        assert mock_connect.call_count == 3
+        assert large._client_pool == clients
+        assert small.client is large.client
+        
+        await small.shutdown()
+        clients[0].close.assert_not_called()
+        await large.shutdown()
+        for client in clients:
+            client.close.assert_called_once()
+    
     async def test_initialization_from_env(self):
         """Test initialization from environment variables"""
         with patch.dict('os.environ', {
@@ -148,12 +315,7 @@ class TestWeaviateService:
         """Test successful search"""
         # Setup mock collection
         mock_collection = Mock()
-        mock_query = Mock()
-        mock_query.near_text.return_value = mock_query
-        mock_query.select.return_value = mock_query
-        mock_query.include_metadata.return_value = mock_query
-        mock_query.do.return_value = mock_search_results
-        mock_collection.query = mock_query
+        mock_collection.query.near_text.return_value = mock_search_results
         
         weaviate_service.client.collections.get.return_value = mock_collection
         
@@ -170,6 +332,34 @@ class TestWeaviateService:
         assert "metadata" in results[0]
         assert results[0]["properties"]["schnelldiagnose"] == "Aufregung oder Unsicherheit"
     
+    async def test_search_runs_off_event_loop(self, weaviate_service, mock_search_results):
+        """Test blocking client calls run on the worker pool, not the loop thread"""
+        calling_threads = []
+        
+        def near_text(**kwargs):
+            calling_threads.append(threading.current_thread().name)
+            return mock_search_results
+        
+        mock_collection = Mock()
+        mock_collection.query.near_text.side_effect = near_text
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        results = await weaviate_service.search(collection="Symptome", query="Hund bellt")
+        
+        assert len(results) == 2
+        assert calling_threads[0].startswith("weaviate")
+    
+    async def test_search_without_ids(self, weaviate_service, mock_search_results):
+        """Test UUIDs are not formatted when return_id is False"""
+        mock_collection = Mock()
+        mock_collection.query.near_text.return_value = mock_search_results
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        results = await weaviate_service.search("Symptome", "Hund bellt", return_id=False)
+        
+        assert [r["id"] for r in results] == [None, None]
+        assert results[0]["properties"]["schnelldiagnose"] == "Aufregung oder Unsicherheit"
+    
     async def test_search_validation_errors(self, weaviate_service):
         """Test search input validation"""
         # Empty collection
@@ -211,6 +401,63 @@ class TestWeaviateService:
         assert len(results) == 2
         mock_query.near_vector.assert_called_once_with(near_vector=vector, limit=3)
     
+    async def test_search_results_cached(self, weaviate_service, mock_search_results):
+        """Test repeated searches are served from the result cache"""
+        mock_collection = Mock()
+        mock_collection.query.near_text.return_value = mock_search_results
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        first = await weaviate_service.search("Symptome", "Hund bellt beim Klingeln")
+        first[0]["properties"]["schnelldiagnose"] = "changed"
+        second = await weaviate_service.search("Symptome", "  hund bellt beim klingeln ")
+        batch = await weaviate_service.search_batch(
+            "Symptome", ["Hund bellt beim Klingeln", "Hund zieht an der Leine"]
+        )
+        
+        assert second[0]["properties"]["schnelldiagnose"] == "Aufregung oder Unsicherheit"
+        assert batch[0] == second
+        assert mock_collection.query.near_text.call_count == 2
+    
+    async def test_vector_search_accepts_sequences(self, weaviate_service, mock_search_results):
+        """Test compact vector containers are passed through without conversion"""
+        mock_collection = Mock()
+        mock_collection.query.near_vector.return_value.do.return_value = mock_search_results
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        vector = array.array("f", [0.1, 0.2, 0.3])
+        await weaviate_service.vector_search("Symptome", vector)
+        assert mock_collection.query.near_vector.call_args.kwargs["near_vector"] is vector
+        
+        for invalid in ([], "0.1,0.2", None):
+            with pytest.raises(ValidationError):
+                await weaviate_service.vector_search("Symptome", invalid)
+    
+    async def test_search_batch(self, weaviate_service, mock_search_results):
+        """Test batch search returns one result list per query"""
+        mock_collection = Mock()
+        mock_collection.query.near_text.return_value = mock_search_results
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        results = await weaviate_service.search_batch("Symptome", ["Bellen", "Beißen", "Ziehen"])
+        
+        assert len(results) == 3
+        assert all(len(r) == 2 for r in results)
+        assert mock_collection.query.near_text.call_count == 3
+        weaviate_service.client.collections.get.assert_called_once_with("Symptome")
+    
+    async def test_find_symptom_match_many(self, weaviate_service, mock_search_results):
+        """Test finding several symptom matches in one batch"""
+        empty = Mock(objects=[])
+        mock_collection = Mock()
+        mock_collection.query.near_text.side_effect = (
+            lambda **kwargs: mock_search_results if kwargs["query"] == "Bellen" else empty
+        )
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        result = await weaviate_service.find_symptom_match_many(["Bellen", "Unbekannt"])
+        
+        assert result == ["Aufregung oder Unsicherheit", None]
+    
     async def test_get_by_id(self, weaviate_service):
         """Test getting object by ID"""
         # Setup mock
@@ -255,6 +502,21 @@ class TestWeaviateService:
         assert await weaviate_service.collection_exists("Symptome") is True
         assert await weaviate_service.collection_exists("NonExistent") is False
     
+    async def test_collections_cache_refresh(self, weaviate_service):
+        """Test the collection list is refetched after invalidation or expiry"""
+        list_all = weaviate_service.client.collections.list_all
+        await weaviate_service.get_collections()
+        await weaviate_service.get_collections()
+        assert list_all.call_count == 1
+        
+        list_all.return_value = {"Symptome": {}, "Neu": {}}
+        weaviate_service.invalidate_collections()
+        assert await weaviate_service.collection_exists("Neu") is True
+        
+        weaviate_service.config.collections_cache_ttl = 0
+        await weaviate_service.get_collections()
+        assert list_all.call_count == 3
+    
     async def test_count_objects(self, weaviate_service):
         """Test counting objects in collection"""
         # Setup mock
@@ -271,16 +533,26 @@ class TestWeaviateService:
         
         assert count == 42
     
+    async def test_count_objects_cached(self, weaviate_service):
+        """Test counts are served from cache within the TTL"""
+        mock_collection = Mock()
+        mock_collection.aggregate.over_all.return_value = Mock(total_count=7)
+        weaviate_service.client.collections.get.return_value = mock_collection
+        
+        assert await weaviate_service.count_objects("Symptome") == 7
+        assert await weaviate_service.count_objects("Symptome") == 7
+        mock_collection.aggregate.over_all.assert_called_once()
+        
+        # Expired entries are refreshed
+        weaviate_service.config.count_cache_ttl = 0
+        await weaviate_service.count_objects("Symptome")
+        assert mock_collection.aggregate.over_all.call_count == 2
+    
     async def test_find_symptom_match(self, weaviate_service, mock_search_results):
         """Test finding symptom match (from retrieval.py)"""
         # Setup mock
         mock_collection = Mock()
-        mock_query = Mock()
-        mock_query.near_text.return_value = mock_query
-        mock_query.select.return_value = mock_query
-        mock_query.include_metadata.return_value = mock_query
-        mock_query.do.return_value = mock_search_results
-        mock_collection.query = mock_query
+        mock_collection.query.near_text.return_value = mock_search_results
         
         weaviate_service.client.collections.get.return_value = mock_collection
         
@@ -314,13 +586,15 @@ class TestWeaviateService:
         health = await weaviate_service.health_check()
         
         assert health['healthy'] is False
-        assert health['status'] == 'connected'  # Still says connected but not ready
+        assert health['status'] == 'not ready'
     
     async def test_cleanup(self, weaviate_service):
         """Test cleanup closes client"""
+        client = weaviate_service.client
+        
         await weaviate_service.shutdown()
         
-        weaviate_service.client.close.assert_called_once()
+        client.close.assert_called_once()
         assert not weaviate_service.is_initialized
 
 